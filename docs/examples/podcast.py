@@ -30,26 +30,30 @@ def load_podcasts(server, test):
 
     for podcast, name in PODCAST_URLS:
         feed = feedparser.parse(podcast)
-        for m in feed.entries:
-            try:
-                if not test:
-                    c = client.content.create(
-                        name=m['title'],
-                        content_type=pathgather.types.ContentType.MEDIA,
-                        source_url=m['link'],
-                        provider_id=name,
-                        topic_name=None,
-                        level=pathgather.types.SkillLevel.ALL,
-                        custom_id=None,
-                        description=m['summary'],
-                        image=feed['feed']['image']['href'],
-                        tags=None,
-                        enabled=True,
-                        skills=[tag['term'] for tag in m['tags']],
-                        duration=m.get('itunes_duration', 0))
-                    print("Added content {0}".format(c))
-            except pathgather.exceptions.PathgatherApiException as p:
-                print("Failed to create content: {0}".format(p.message))
+        items = [
+            dict(
+                name=m['title'],
+                content_type=pathgather.types.ContentType.MEDIA,
+                source_url=m['link'],
+                provider_id=name,
+                topic_name=None,
+                level=pathgather.types.SkillLevel.ALL,
+                custom_id=None,
+                description=m['summary'],
+                image=feed['feed']['image']['href'],
+                tags=None,
+                enabled=True,
+                skills=[tag['term'] for tag in m['tags']],
+                duration=m.get('itunes_duration', 0))
+            for m in feed.entries]
+        if test:
+            continue
+        report = client.content.bulk_create(items, max_workers=8)
+        for result in report.results:
+            if result.ok:
+                print("Added content {0}".format(result.result))
+            else:
+                print("Failed to create content: {0}".format(result.error))
 
 if __name__ == '__main__':
     load_podcasts()
@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+# Licensed to Anthony Shaw (anthonyshaw@apache.org) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import aiohttp
+
+from ..codec import default_codec
+from ..exceptions import PathgatherApiException
+from .users import AsyncUsersClient
+from .content import AsyncContentClient
+from .paths import AsyncPathsClient
+from .gatherings import AsyncGatheringsClient
+from .skills import AsyncSkillsClient
+from .providers import AsyncProvidersClient
+
+
+class AsyncPathgatherClient(object):
+    """
+    The asyncio API client, mirrors :class:`pathgather.PathgatherClient`.
+
+    Use as an asynchronous context manager, or call :meth:`close` when done.
+    """
+
+    """
+    Set the default results per page. Max 100
+    """
+    results_per_page = 50
+
+    """
+    The largest page the API returns
+    """
+    MAX_RESULTS_PER_PAGE = 100
+
+    def __init__(
+        self,
+        host,
+        api_key,
+        proxy=None,
+        skip_ssl_validation=False,
+        json_codec=None,
+        scheme="https",
+    ):
+        """
+        Instantiate a new asyncio API client
+
+        :param host: The host name, e.g. mycompany.pathgather.com
+        :type  host: ``str``
+
+        :param api_key: The API token (from the admin console)
+        :type  api_key: ``str``
+
+        :param proxy: The proxy to connect through
+        :type  proxy: ``str``
+
+        :param skip_ssl_validation: Skip SSL validation
+        :type  skip_ssl_validation: ``bool``
+
+        :param json_codec: Encodes request bodies and decodes responses,
+            defaults to the fastest JSON library installed
+        :type  json_codec: :class:`pathgather.codec.JsonCodec`
+
+        :param scheme: "https", or "http" for a local server such as
+            :class:`pathgather.server.PathgatherServer`
+        :type  scheme: ``str``
+        """
+        self._api_key = api_key
+        self.json_codec = json_codec or default_codec()
+
+        self.base_url = "{0}://{1}/v1".format(scheme, host)
+
+        self.proxy = proxy
+        self.ssl = False if skip_ssl_validation else None
+        self.headers = {
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+            "Authorization": "Bearer {0}".format(api_key),
+        }
+        # aiohttp sessions must be created inside a running event loop
+        self._session = None
+
+        self._users = AsyncUsersClient(self)
+        self._content = AsyncContentClient(self)
+        self._paths = AsyncPathsClient(self)
+        self._gatherings = AsyncGatheringsClient(self)
+        self._skills = AsyncSkillsClient(self)
+        self._providers = AsyncProvidersClient(self)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    @property
+    def session(self):
+        """
+        The underlying HTTP session, created on first use
+
+        :rtype: :class:`aiohttp.ClientSession`
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(headers=self.headers)
+        return self._session
+
+    async def close(self):
+        """
+        Close the underlying HTTP session
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _request(self, method, uri, params=None, data=None):
+        if params:
+            # aiohttp rejects None values, requests silently drops them
+            params = {k: v for k, v in params.items() if v is not None}
+        async with self.session.request(
+            method,
+            "{0}/{1}".format(self.base_url, uri),
+            params=params,
+            data=data,
+            proxy=self.proxy,
+            ssl=self.ssl,
+        ) as response:
+            body = await response.read()
+            if response.status >= 400:
+                raise PathgatherApiException(body.decode("utf-8", "replace"), uri)
+            return body
+
+    async def get(self, uri, params=None, data=None):
+        params = dict(params or {})
+        if "per_page" not in params:
+            params["per_page"] = self.results_per_page
+        body = await self._request("GET", uri, params=params, data=data)
+        return self.json_codec.decode(body)
+
+    async def get_paged(self, uri, params=None, data=None):
+        params = dict(params or {})
+        if "per_page" in params:
+            params["per_page"] = min(params["per_page"], self.MAX_RESULTS_PER_PAGE)
+        end = False
+        while not end:
+            result = await self.get(uri, params=params, data=data)
+            next_page = result["next"]
+            yield result
+            if next_page:
+                params["from"] = next_page
+            else:
+                end = True
+
+    async def post(self, uri, data=None):
+        body = await self._request("POST", uri, data=self._encode(data))
+        return self.json_codec.decode(body)
+
+    async def put(self, uri, data=None):
+        body = await self._request("PUT", uri, data=self._encode(data))
+        if body:
+            return self.json_codec.decode(body)
+
+    def _encode(self, data):
+        return self.json_codec.encode(data) if data is not None else None
+
+    async def delete(self, uri):
+        await self._request("DELETE", uri)
+
+    @property
+    def users(self):
+        """
+        Users
+
+        :rtype: :class:`pathgather.aio.users.AsyncUsersClient`
+        """
+        return self._users
+
+    @property
+    def content(self):
+        """
+        Learning Content
+
+        :rtype: :class:`pathgather.aio.content.AsyncContentClient`
+        """
+        return self._content
+
+    @property
+    def paths(self):
+        """
+        Learning Paths
+
+        :rtype: :class:`pathgather.aio.paths.AsyncPathsClient`
+        """
+        return self._paths
+
+    @property
+    def gatherings(self):
+        """
+        Learner Gatherings
+
+        :rtype: :class:`pathgather.aio.gatherings.AsyncGatheringsClient`
+        """
+        return self._gatherings
+
+    @property
+    def skills(self):
+        """
+        Pathgather Skills
+
+        :rtype: :class:`pathgather.aio.skills.AsyncSkillsClient`
+        """
+        return self._skills
+
+    @property
+    def providers(self):
+        """
+        Pathgather Providers
+
+        :rtype: :class:`pathgather.aio.providers.AsyncProvidersClient`
+        """
+        return self._providers
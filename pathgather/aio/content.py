@@ -0,0 +1,408 @@
+# -*- coding: utf-8 -*-
+# Licensed to Anthony Shaw (anthonyshaw@apache.org) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from ..content import BaseContentClient
+
+
+class AsyncContentClient(BaseContentClient):
+    """ Content API (asyncio). """
+
+    async def all(
+        self, from_page=None, query=None, filter=None, per_page=None, raw=False
+    ):
+        """
+        Get all content.
+
+        :param from_page: Get from page
+        :type  from_page: ``str``
+
+        :param query: Additional filter query
+            (see https://docs.pathgather.com/docs/filtering)
+        :type  query: ``dict``
+
+        :param filter: Additional type filter, e.g. "shared", "official", "pathgather"
+        :type  filter: ``str``
+
+        :param per_page: Results per page, up to
+            :attr:`pathgather.client.PathgatherClient.MAX_RESULTS_PER_PAGE`
+        :type  per_page: ``int``
+
+        :param raw: Return the decoded ``dict`` records, without building models
+        :type  raw: ``bool``
+
+        :return: A list of content
+        :rtype: ``list`` of :class:`pathgather.models.content.Content`
+        """
+        return [
+            i
+            async for i in self.iter_all(
+                from_page=from_page,
+                query=query,
+                filter=filter,
+                per_page=per_page,
+                raw=raw,
+            )
+        ]
+
+    async def iter_all(
+        self, from_page=None, query=None, filter=None, per_page=None, raw=False
+    ):
+        """
+        Iterate all content, fetching each page only when it is needed
+
+        :param from_page: Get from page
+        :type  from_page: ``str``
+
+        :param query: Additional filter query
+            (see https://docs.pathgather.com/docs/filtering)
+        :type  query: ``dict``
+
+        :param filter: Additional type filter, e.g. "shared", "official", "pathgather"
+        :type  filter: ``str``
+
+        :param per_page: Results per page, up to
+            :attr:`pathgather.client.PathgatherClient.MAX_RESULTS_PER_PAGE`
+        :type  per_page: ``int``
+
+        :param raw: Return the decoded ``dict`` records, without building models
+        :type  raw: ``bool``
+
+        :return: An async generator of content
+        :rtype: ``async generator`` of :class:`pathgather.models.content.Content`
+        """
+        params = {}
+
+        if from_page is not None:
+            params["from"] = from_page
+        if per_page is not None:
+            params["per_page"] = per_page
+
+        data = None
+        if query or filter:
+            extra = {}
+            if query:
+                extra["q"] = query
+            if filter:
+                extra["filter"] = filter
+            data = self.client.json_codec.encode(extra)
+        content = self.client.get_paged("content", params=params, data=data)
+
+        async for page in content:
+            for i in page["results"]:
+                yield i if raw else self._to_content(i)
+
+    async def get(self, id, raw=False):
+        """
+        Fetch a piece of content by ID.
+
+        :param id: The content ID or custom ID
+        :type  id: ``str``
+
+        :param raw: Return the decoded ``dict``, without building a model
+        :type  raw: ``bool``
+
+        :rtype: :class:`pathgather.models.content.Content`
+        """
+        content = await self.client.get("content/{0}".format(id))
+        return content if raw else self._to_content(content)
+
+    async def create(
+        self,
+        name,
+        content_type,
+        source_url,
+        topic_name,
+        provider_name=None,
+        provider_id=None,
+        level=None,
+        custom_id=None,
+        description=None,
+        image=None,
+        tags=None,
+        enabled=True,
+        skills=None,
+        duration=None,
+    ):
+        """
+        Create a piece of content in the catalogue,
+        see :meth:`pathgather.content.ContentClient.create`
+
+        :rtype: :class:`pathgather.models.content.Content`
+        """
+        params = self._create_params(
+            name,
+            content_type,
+            source_url,
+            topic_name,
+            provider_name,
+            provider_id,
+            level,
+            custom_id,
+            description,
+            image,
+            tags,
+            enabled,
+            skills,
+            duration,
+        )
+
+        content = await self.client.post("content", {"content": params})
+        return self._to_content(content)
+
+    async def update(
+        self,
+        id,
+        name=None,
+        content_type=None,
+        source_url=None,
+        topic_name=None,
+        provider_name=None,
+        provider_id=None,
+        level=None,
+        custom_id=None,
+        description=None,
+        image=None,
+        tags=None,
+        enabled=True,
+        skills=None,
+        duration=None,
+    ):
+        """
+        Update a piece of content, see :meth:`pathgather.content.ContentClient.update`
+
+        :rtype: :class:`pathgather.models.content.Content`
+        """
+        params = self._update_params(
+            name,
+            content_type,
+            source_url,
+            topic_name,
+            provider_name,
+            provider_id,
+            level,
+            custom_id,
+            description,
+            image,
+            tags,
+            enabled,
+            skills,
+            duration,
+        )
+
+        content = await self.client.put("content/{0}".format(id), {"content": params})
+        return self._to_content(content)
+
+    async def delete(self, id):
+        """
+        Delete a piece of content
+
+        :param id: The identifier
+        :type  id: ``str``
+        """
+        await self.client.delete("content/{0}".format(id))
+
+    async def starts_and_completions(
+        self, from_page=None, query=None, per_page=None, raw=False
+    ):
+        """
+        Returns objects representing a user's interaction
+        (starts and completions) with content, fetching each page
+        only when it is needed.
+
+        :param from_page: Get from page
+        :type  from_page: ``str``
+
+        :param query: Extra query parameters
+        :param query: ``dict``
+
+        :param per_page: Results per page, up to
+            :attr:`pathgather.client.PathgatherClient.MAX_RESULTS_PER_PAGE`
+        :type  per_page: ``int``
+
+        :param raw: Return the decoded ``dict`` records, without building models
+        :type  raw: ``bool``
+
+        :rtype: ``list`` of :class:`pathgather.models.content.UserContent`
+        """
+        return [
+            i
+            async for i in self.iter_starts_and_completions(
+                from_page=from_page, query=query, per_page=per_page, raw=raw
+            )
+        ]
+
+    async def iter_starts_and_completions(
+        self, from_page=None, query=None, per_page=None, raw=False
+    ):
+        """
+        Iterate objects representing a user's interaction
+        (starts and completions) with content, fetching each page
+        only when it is needed.
+
+        :param from_page: Get from page
+        :type  from_page: ``str``
+
+        :param query: Extra query parameters
+        :param query: ``dict``
+
+        :param per_page: Results per page, up to
+            :attr:`pathgather.client.PathgatherClient.MAX_RESULTS_PER_PAGE`
+        :type  per_page: ``int``
+
+        :param raw: Return the decoded ``dict`` records, without building models
+        :type  raw: ``bool``
+
+        :rtype: ``async generator`` of :class:`pathgather.models.content.UserContent`
+        """
+        params = {}
+
+        if from_page is not None:
+            params["from"] = from_page
+        if per_page is not None:
+            params["per_page"] = per_page
+        data = None
+        if query:
+            data = self.client.json_codec.encode({"q": query})
+        content = self.client.get_paged("user_content", params=params, data=data)
+        async for page in content:
+            for i in page["results"]:
+                yield i if raw else self._to_user_content(i)
+
+    async def log_completion(
+        self, content_id, completed_at="now", user_id=None, user_email=None
+    ):
+        """
+        Logs that a user completed content,
+        see :meth:`pathgather.content.ContentClient.log_completion`
+
+        :rtype: :class:`pathgather.models.content.UserContent`
+        """
+        params = self._completion_params(
+            content_id, completed_at, user_id, user_email
+        )
+
+        content = await self.client.post("user_content", params)
+        return self._to_user_content(content)
+
+    async def get_comments(
+        self, id, from_page=None, query=None, per_page=None, raw=False
+    ):
+        """
+        Get comments on a content item
+
+        :param id: The content item ID
+        :type  id: ``str``
+
+        :param from_page: Get from page
+        :type  from_page: ``str``
+
+        :param query: Extra query parameters
+        :param query: ``dict``
+
+        :param per_page: Results per page, up to
+            :attr:`pathgather.client.PathgatherClient.MAX_RESULTS_PER_PAGE`
+        :type  per_page: ``int``
+
+        :param raw: Return the decoded ``dict`` records, without building models
+        :type  raw: ``bool``
+
+        :rtype: ``list`` of :class:`pathgather.models.content.ContentComment`
+        """
+        return [i async for i in self.iter_comments(
+            id, from_page=from_page, query=query, per_page=per_page, raw=raw
+        )]
+
+    async def iter_comments(
+        self, id, from_page=None, query=None, per_page=None, raw=False
+    ):
+        """
+        Iterate comments on a content item, fetching each page only when it is needed
+
+        :param id: The content item ID
+        :type  id: ``str``
+
+        :param from_page: Get from page
+        :type  from_page: ``str``
+
+        :param query: Extra query parameters
+        :param query: ``dict``
+
+        :param per_page: Results per page, up to
+            :attr:`pathgather.client.PathgatherClient.MAX_RESULTS_PER_PAGE`
+        :type  per_page: ``int``
+
+        :param raw: Return the decoded ``dict`` records, without building models
+        :type  raw: ``bool``
+
+        :rtype: ``async generator`` of :class:`pathgather.models.content.ContentComment`
+        """
+        params = {}
+
+        if from_page is not None:
+            params["from"] = from_page
+        if per_page is not None:
+            params["per_page"] = per_page
+
+        data = None
+        if query is not None:
+            data = self.client.json_codec.encode({"q": query})
+
+        content = self.client.get_paged(
+            "content/{0}/comments".format(id), params=params, data=data
+        )
+        async for page in content:
+            for i in page["results"]:
+                yield i if raw else self._to_content_comment(i)
+
+    async def create_comment(self, id, message, user_id, custom_id=None):
+        """
+        Create a comment on a content item
+
+        :param id: The content item ID
+        :type  id: ``str``
+
+        :param message: The comment text, in plain or HTML
+        :type  message: ``str``
+
+        :param user_id: The ID of the user to create the comment as
+        :type  user_id: ``str``
+
+        :param custom_id: Custom identifier for the comment
+        :type  custom_id: ``str``
+
+        :rtype: :class:`pathgather.models.content.ContentComment`
+        """
+        params = {"message": message, "user_id": user_id}
+        if custom_id:
+            params["custom_id"] = custom_id
+
+        response = await self.client.post(
+            "content/{0}/comments".format(id), {"comment": params}
+        )
+        return self._to_content_comment(response)
+
+    async def delete_comment(self, id, comment_id):
+        """
+        Delete a comment on a content item
+
+        :param id: The content item ID
+        :type  id: ``str``
+
+        :param comment_id: The comment ID
+        :type  comment_id: ``str``
+        """
+        await self.client.delete("content/{0}/comments/{1}".format(id, comment_id))
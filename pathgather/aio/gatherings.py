@@ -0,0 +1,357 @@
+# -*- coding: utf-8 -*-
+# Licensed to Anthony Shaw (anthonyshaw@apache.org) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from ..gatherings import BaseGatheringsClient
+
+
+class AsyncGatheringsClient(BaseGatheringsClient):
+    """ Gatherings API (asyncio). """
+
+    async def all(self, from_page=None, per_page=None, raw=False):
+        """
+        Get all gatherings (will page results out)
+
+        :param from_page: Start at page
+        :type  from_page: ``int``
+
+        :param per_page: Results per page, up to
+            :attr:`pathgather.client.PathgatherClient.MAX_RESULTS_PER_PAGE`
+        :type  per_page: ``int``
+
+        :param raw: Return the decoded ``dict`` records, without building models
+        :type  raw: ``bool``
+
+        :rtype: ``list`` of :class:`pathgather.models.gathering.Gathering`
+        """
+        return [i async for i in self.iter_all(
+            from_page=from_page, per_page=per_page, raw=raw
+        )]
+
+    async def iter_all(self, from_page=None, per_page=None, raw=False):
+        """
+        Iterate all gatherings, fetching each page only when it is needed
+
+        :param from_page: Start at page
+        :type  from_page: ``int``
+
+        :param per_page: Results per page, up to
+            :attr:`pathgather.client.PathgatherClient.MAX_RESULTS_PER_PAGE`
+        :type  per_page: ``int``
+
+        :param raw: Return the decoded ``dict`` records, without building models
+        :type  raw: ``bool``
+
+        :rtype: ``async generator`` of :class:`pathgather.models.gathering.Gathering`
+        """
+        params = {}
+
+        if from_page is not None:
+            params["from"] = from_page
+        if per_page is not None:
+            params["per_page"] = per_page
+
+        gatherings = self.client.get_paged("gatherings", params=params)
+        async for page in gatherings:
+            for i in page["results"]:
+                yield i if raw else self._to_gathering(i)
+
+    async def get(self, id, raw=False):
+        """
+        Fetch a gathering by ID.
+
+        :param id: The gathering id
+        :type  id: ``str``
+
+        :param raw: Return the decoded ``dict``, without building a model
+        :type  raw: ``bool``
+
+        :rtype: :class:`pathgather.models.gathering.Gathering`
+        """
+        gathering = await self.client.get("gatherings/{0}".format(id))
+        return gathering if raw else self._to_gathering(gathering)
+
+    async def create(
+        self,
+        name,
+        custom_id=None,
+        description=None,
+        closed=True,
+        image=None,
+        skills=None,
+    ):
+        """
+        Create a gathering, see :meth:`pathgather.gatherings.GatheringsClient.create`
+
+        :rtype: :class:`pathgather.models.gathering.Gathering`
+        """
+        params = self._create_params(
+            name, custom_id, description, closed, image, skills
+        )
+
+        gathering = await self.client.post("gatherings", {"gathering": params})
+        return self._to_gathering(gathering)
+
+    async def update(
+        self,
+        id,
+        name,
+        custom_id=None,
+        description=None,
+        closed=True,
+        image=None,
+        skills=None,
+    ):
+        """
+        Update a gathering, see :meth:`pathgather.gatherings.GatheringsClient.update`
+
+        :rtype: :class:`pathgather.models.gathering.Gathering`
+        """
+        params = self._update_params(
+            name, custom_id, description, closed, image, skills
+        )
+
+        gathering = await self.client.put(
+            "gatherings/{0}".format(id), {"gathering": params}
+        )
+        return self._to_gathering(gathering)
+
+    async def users(self, id, from_page=None, per_page=None, raw=False):
+        """
+        Fetch a gathering's membership by ID.
+
+        :param id: The gathering id
+        :type  id: ``str``
+
+        :param per_page: Results per page, up to
+            :attr:`pathgather.client.PathgatherClient.MAX_RESULTS_PER_PAGE`
+        :type  per_page: ``int``
+
+        :param raw: Return the decoded ``dict`` records, without building models
+        :type  raw: ``bool``
+
+        :rtype: ``list`` of :class:`pathgather.models.gathering.GatheringUser`
+        """
+        return [i async for i in self.iter_users(
+            id, from_page=from_page, per_page=per_page, raw=raw
+        )]
+
+    async def iter_users(self, id, from_page=None, per_page=None, raw=False):
+        """
+        Iterate a gathering's membership, fetching each page only when it is needed
+
+        :param id: The gathering id
+        :type  id: ``str``
+
+        :param per_page: Results per page, up to
+            :attr:`pathgather.client.PathgatherClient.MAX_RESULTS_PER_PAGE`
+        :type  per_page: ``int``
+
+        :param raw: Return the decoded ``dict`` records, without building models
+        :type  raw: ``bool``
+
+        :rtype: ``async generator`` of :class:`pathgather.models.gathering.GatheringUser`
+        """
+        params = {}
+
+        if from_page is not None:
+            params["from"] = from_page
+        if per_page is not None:
+            params["per_page"] = per_page
+
+        users = self.client.get_paged("gatherings/{0}/users".format(id), params=params)
+        async for page in users:
+            for i in page["results"]:
+                yield i if raw else self._to_user_gathering(i)
+
+    async def invite_user(self, id, user_id):
+        """
+        Invite a user to a gathering
+
+        :param id: The gathering id
+        :type  id: ``str``
+
+        :param user_id: The user id
+        :type  user_id: ``str``
+
+        :rtype: :class:`pathgather.models.gathering.GatheringInvite`
+        """
+        params = {"gathering_invite": {"invitee_id": user_id}}
+        data = await self.client.post(
+            "gatherings/{0}/gathering_invites".format(id), params
+        )
+        return self._to_gathering_invite(data)
+
+    async def remove_user(self, id, user_id):
+        """
+        Remove a user from a gathering
+
+        :param id: The gathering id
+        :type  id: ``str``
+
+        :param user_id: The user id
+        :type  user_id: ``str``
+        """
+        await self.client.delete("gatherings/{0}/users/{1}".format(id, user_id))
+
+    async def content(self, id, from_page=None, per_page=None, raw=False):
+        """
+        Fetch a gathering's content by ID.
+
+        :param id: The gathering id
+        :type  id: ``str``
+
+        :param per_page: Results per page, up to
+            :attr:`pathgather.client.PathgatherClient.MAX_RESULTS_PER_PAGE`
+        :type  per_page: ``int``
+
+        :param raw: Return the decoded ``dict`` records, without building models
+        :type  raw: ``bool``
+
+        :rtype: ``list`` of :class:`pathgather.models.gathering.GatheringContent`
+        """
+        return [i async for i in self.iter_content(
+            id, from_page=from_page, per_page=per_page, raw=raw
+        )]
+
+    async def iter_content(self, id, from_page=None, per_page=None, raw=False):
+        """
+        Iterate a gathering's content, fetching each page only when it is needed
+
+        :param id: The gathering id
+        :type  id: ``str``
+
+        :param per_page: Results per page, up to
+            :attr:`pathgather.client.PathgatherClient.MAX_RESULTS_PER_PAGE`
+        :type  per_page: ``int``
+
+        :param raw: Return the decoded ``dict`` records, without building models
+        :type  raw: ``bool``
+
+        :rtype: ``async generator`` of
+            :class:`pathgather.models.gathering.GatheringContent`
+        """
+        params = {}
+
+        if from_page is not None:
+            params["from"] = from_page
+        if per_page is not None:
+            params["per_page"] = per_page
+
+        content = self.client.get_paged(
+            "gatherings/{0}/contents".format(id), params=params
+        )
+        async for page in content:
+            for i in page["results"]:
+                yield i if raw else self._to_content_gathering(i)
+
+    async def add_content(self, id, content_id):
+        """
+        Add a piece of content to a gathering
+
+        :param id: The gathering id
+        :type  id: ``str``
+
+        :param content_id: The content id
+        :type  content_id: ``str``
+
+        :rtype: ``dict``
+        """
+        params = {"content": {"id": content_id}}
+        return await self.client.post("gatherings/{0}/contents".format(id), params)
+
+    async def remove_content(self, id, content_id):
+        """
+        Remove content from a gathering
+
+        :param id: The gathering id
+        :type  id: ``str``
+
+        :param content_id: The content id
+        :type  content_id: ``str``
+        """
+        await self.client.delete("gatherings/{0}/contents/{1}".format(id, content_id))
+
+    async def paths(self, id, from_page=None, per_page=None, raw=False):
+        """
+        Fetch a gathering's paths by ID.
+
+        :param id: The gathering id
+        :type  id: ``str``
+
+        :param per_page: Results per page, up to
+            :attr:`pathgather.client.PathgatherClient.MAX_RESULTS_PER_PAGE`
+        :type  per_page: ``int``
+
+        :param raw: Return the decoded ``dict`` records, without building models
+        :type  raw: ``bool``
+
+        :rtype: ``list`` of :class:`pathgather.models.gathering.GatheringPath`
+        """
+        return [i async for i in self.iter_paths(
+            id, from_page=from_page, per_page=per_page, raw=raw
+        )]
+
+    async def iter_paths(self, id, from_page=None, per_page=None, raw=False):
+        """
+        Iterate a gathering's paths, fetching each page only when it is needed
+
+        :param id: The gathering id
+        :type  id: ``str``
+
+        :param per_page: Results per page, up to
+            :attr:`pathgather.client.PathgatherClient.MAX_RESULTS_PER_PAGE`
+        :type  per_page: ``int``
+
+        :param raw: Return the decoded ``dict`` records, without building models
+        :type  raw: ``bool``
+
+        :rtype: ``async generator`` of :class:`pathgather.models.gathering.GatheringPath`
+        """
+        params = {}
+
+        if from_page is not None:
+            params["from"] = from_page
+        if per_page is not None:
+            params["per_page"] = per_page
+
+        content = self.client.get_paged(
+            "gatherings/{0}/paths".format(id), params=params
+        )
+        async for page in content:
+            for i in page["results"]:
+                yield i if raw else self._to_path_gathering(i)
+
+    async def remove_path(self, id, path_id):
+        """
+        Remove path from a gathering
+
+        :param id: The gathering id
+        :type  id: ``str``
+
+        :param path_id: The path id
+        :type  path_id: ``str``
+        """
+        await self.client.delete("gatherings/{0}/paths/{1}".format(id, path_id))
+
+    async def delete(self, id):
+        """
+        Delete a gathering by ID.
+
+        :param id: The gathering ID
+        :type  id: ``str``
+        """
+        await self.client.delete("gatherings/{0}".format(id))
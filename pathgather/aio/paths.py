@@ -0,0 +1,273 @@
+# -*- coding: utf-8 -*-
+# Licensed to Anthony Shaw (anthonyshaw@apache.org) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from ..paths import BasePathsClient
+
+
+class AsyncPathsClient(BasePathsClient):
+    """ Path API (asyncio). """
+
+    async def all(self, from_page=None, query=None, per_page=None, raw=False):
+        """
+        Get all paths.
+
+        :param from_page: Get from page (when paginated)
+        :type  from_page: ``int``
+
+        :param query: Extra query parameters
+        :param query: ``dict``
+
+        :param per_page: Results per page, up to
+            :attr:`pathgather.client.PathgatherClient.MAX_RESULTS_PER_PAGE`
+        :type  per_page: ``int``
+
+        :param raw: Return the decoded ``dict`` records, without building models
+        :type  raw: ``bool``
+
+        :rtype: ``list`` of :class:`pathgather.models.path.Path`
+        """
+        return [i async for i in self.iter_all(
+            from_page=from_page, query=query, per_page=per_page, raw=raw
+        )]
+
+    async def iter_all(self, from_page=None, query=None, per_page=None, raw=False):
+        """
+        Iterate all paths, fetching each page only when it is needed
+
+        :param from_page: Get from page (when paginated)
+        :type  from_page: ``int``
+
+        :param query: Extra query parameters
+        :param query: ``dict``
+
+        :param per_page: Results per page, up to
+            :attr:`pathgather.client.PathgatherClient.MAX_RESULTS_PER_PAGE`
+        :type  per_page: ``int``
+
+        :param raw: Return the decoded ``dict`` records, without building models
+        :type  raw: ``bool``
+
+        :rtype: ``async generator`` of :class:`pathgather.models.path.Path`
+        """
+        params = {}
+
+        if from_page is not None:
+            params["from"] = from_page
+        if per_page is not None:
+            params["per_page"] = per_page
+
+        data = None
+        if query is not None:
+            data = self.client.json_codec.encode({"q": query})
+
+        paths = self.client.get_paged("paths", params=params, data=data)
+        async for page in paths:
+            for i in page["results"]:
+                yield i if raw else self._to_path(i)
+
+    async def get(self, id, raw=False):
+        """
+        Fetch a path by ID
+
+        :param id: Path ID
+        :type  id: ``str``
+
+        :param raw: Return the decoded ``dict``, without building a model
+        :type  raw: ``bool``
+
+        :rtype: :class:`pathgather.models.path.Path`
+        """
+        path = await self.client.get("paths/{0}".format(id))
+        return path if raw else self._to_path(path)
+
+    async def starts_and_completions(
+        self, from_page=None, query=None, per_page=None, raw=False
+    ):
+        """
+        Returns objects representing a user's interaction
+        (starts and completions) with paths, fetching each page
+        only when it is needed.
+
+        :param from_page: Get from page
+        :type  from_page: ``str``
+
+        :param query: Extra query parameters
+        :param query: ``dict``
+
+        :param per_page: Results per page, up to
+            :attr:`pathgather.client.PathgatherClient.MAX_RESULTS_PER_PAGE`
+        :type  per_page: ``int``
+
+        :param raw: Return the decoded ``dict`` records, without building models
+        :type  raw: ``bool``
+
+        :rtype: ``list`` of :class:`pathgather.models.path.UserPath`
+        """
+        return [
+            i
+            async for i in self.iter_starts_and_completions(
+                from_page=from_page, query=query, per_page=per_page, raw=raw
+            )
+        ]
+
+    async def iter_starts_and_completions(
+        self, from_page=None, query=None, per_page=None, raw=False
+    ):
+        """
+        Iterate objects representing a user's interaction
+        (starts and completions) with paths, fetching each page
+        only when it is needed.
+
+        :param from_page: Get from page
+        :type  from_page: ``str``
+
+        :param query: Extra query parameters
+        :param query: ``dict``
+
+        :param per_page: Results per page, up to
+            :attr:`pathgather.client.PathgatherClient.MAX_RESULTS_PER_PAGE`
+        :type  per_page: ``int``
+
+        :param raw: Return the decoded ``dict`` records, without building models
+        :type  raw: ``bool``
+
+        :rtype: ``async generator`` of :class:`pathgather.models.path.UserPath`
+        """
+        params = {}
+
+        if from_page is not None:
+            params["from"] = from_page
+        if per_page is not None:
+            params["per_page"] = per_page
+
+        data = None
+        if query is not None:
+            data = self.client.json_codec.encode({"q": query})
+
+        content = self.client.get_paged("user_paths", params=params, data=data)
+        async for page in content:
+            for i in page["results"]:
+                yield i if raw else self._to_user_path(i)
+
+    async def get_comments(
+        self, id, from_page=None, query=None, per_page=None, raw=False
+    ):
+        """
+        Get comments on a path
+
+        :param id: The path ID
+        :type  id: ``str``
+
+        :param from_page: Get from page
+        :type  from_page: ``str``
+
+        :param query: Extra query parameters
+        :param query: ``dict``
+
+        :param per_page: Results per page, up to
+            :attr:`pathgather.client.PathgatherClient.MAX_RESULTS_PER_PAGE`
+        :type  per_page: ``int``
+
+        :param raw: Return the decoded ``dict`` records, without building models
+        :type  raw: ``bool``
+
+        :rtype: ``list`` of :class:`pathgather.models.path.PathComment`
+        """
+        return [i async for i in self.iter_comments(
+            id, from_page=from_page, query=query, per_page=per_page, raw=raw
+        )]
+
+    async def iter_comments(
+        self, id, from_page=None, query=None, per_page=None, raw=False
+    ):
+        """
+        Iterate comments on a path, fetching each page only when it is needed
+
+        :param id: The path ID
+        :type  id: ``str``
+
+        :param from_page: Get from page
+        :type  from_page: ``str``
+
+        :param query: Extra query parameters
+        :param query: ``dict``
+
+        :param per_page: Results per page, up to
+            :attr:`pathgather.client.PathgatherClient.MAX_RESULTS_PER_PAGE`
+        :type  per_page: ``int``
+
+        :param raw: Return the decoded ``dict`` records, without building models
+        :type  raw: ``bool``
+
+        :rtype: ``async generator`` of :class:`pathgather.models.path.PathComment`
+        """
+        params = {}
+
+        if from_page is not None:
+            params["from"] = from_page
+        if per_page is not None:
+            params["per_page"] = per_page
+
+        data = None
+        if query is not None:
+            data = self.client.json_codec.encode({"q": query})
+
+        content = self.client.get_paged(
+            "paths/{0}/comments".format(id), params=params, data=data
+        )
+        async for page in content:
+            for i in page["results"]:
+                yield i if raw else self._to_path_comment(i)
+
+    async def create_comment(self, id, message, user_id, custom_id=None):
+        """
+        Create a comment on a path
+
+        :param id: The path ID
+        :type  id: ``str``
+
+        :param message: The comment text, in plain or HTML
+        :type  message: ``str``
+
+        :param user_id: The ID of the user to create the comment as
+        :type  user_id: ``str``
+
+        :param custom_id: Custom identifier for the comment
+        :type  custom_id: ``str``
+
+        :rtype: :class:`pathgather.models.path.PathComment`
+        """
+        params = {"message": message, "user_id": user_id}
+        if custom_id:
+            params["custom_id"] = custom_id
+
+        response = await self.client.post(
+            "paths/{0}/comments".format(id), {"comment": params}
+        )
+        return self._to_path_comment(response)
+
+    async def delete_comment(self, id, comment_id):
+        """
+        Delete a comment on a path
+
+        :param id: The path ID
+        :type  id: ``str``
+
+        :param comment_id: The comment ID
+        :type  comment_id: ``str``
+        """
+        await self.client.delete("paths/{0}/comments/{1}".format(id, comment_id))
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+# Licensed to Anthony Shaw (anthonyshaw@apache.org) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from ..providers import BaseProvidersClient
+
+
+class AsyncProvidersClient(BaseProvidersClient):
+    """ Providers API (asyncio). """
+
+    async def all(self, from_page=None, per_page=None, raw=False):
+        """
+        Get all providers (will page results out)
+
+        :param from_page: Start at page
+        :type  from_page: ``int``
+
+        :param per_page: Results per page, up to
+            :attr:`pathgather.client.PathgatherClient.MAX_RESULTS_PER_PAGE`
+        :type  per_page: ``int``
+
+        :param raw: Return the decoded ``dict`` records, without building models
+        :type  raw: ``bool``
+
+        :rtype: ``list`` of :class:`pathgather.models.provider.Provider`
+        """
+        return [i async for i in self.iter_all(
+            from_page=from_page, per_page=per_page, raw=raw
+        )]
+
+    async def iter_all(self, from_page=None, per_page=None, raw=False):
+        """
+        Iterate all providers, fetching each page only when it is needed
+
+        :param from_page: Start at page
+        :type  from_page: ``int``
+
+        :param per_page: Results per page, up to
+            :attr:`pathgather.client.PathgatherClient.MAX_RESULTS_PER_PAGE`
+        :type  per_page: ``int``
+
+        :param raw: Return the decoded ``dict`` records, without building models
+        :type  raw: ``bool``
+
+        :rtype: ``async generator`` of :class:`pathgather.models.provider.Provider`
+        """
+        params = {}
+
+        if from_page is not None:
+            params["from"] = from_page
+        if per_page is not None:
+            params["per_page"] = per_page
+
+        providers = self.client.get_paged("providers", params=params)
+        async for page in providers:
+            for i in page["results"]:
+                yield i if raw else self._to_provider(i)
+
+    async def get(self, id, raw=False):
+        """
+        Fetch a provider by ID.
+
+        :param id: The provider id
+        :type  id: ``str``
+
+        :param raw: Return the decoded ``dict``, without building a model
+        :type  raw: ``bool``
+
+        :rtype: :class:`pathgather.models.provider.Provider`
+        """
+        provider = await self.client.get("providers/{0}".format(id))
+        return provider if raw else self._to_provider(provider)
+
+    async def create(
+        self,
+        name,
+        custom_id=None,
+        may_require_vpn=False,
+        may_not_be_mobile_friendly=False,
+    ):
+        """
+        Create a provider.
+
+        :param name: The provider name
+        :type  name: ``str``
+
+        :param custom_id: Optional, but highly recommended
+        :type  custom_id: ``str``
+
+        :rtype: :class:`pathgather.models.provider.Provider`
+        """
+        params = {
+            "name": name,
+            "may_require_vpn": may_require_vpn,
+            "may_not_be_mobile_friendly": may_not_be_mobile_friendly,
+        }
+
+        if custom_id:
+            params["custom_id"] = custom_id
+
+        provider = await self.client.post("providers", {"provider": params})
+        return self._to_provider(provider)
+
+    async def delete(self, id):
+        """
+        Delete a provider by ID.
+
+        :param id: The provider ID
+        :type  id: ``str``
+        """
+        await self.client.delete("providers/{0}".format(id))
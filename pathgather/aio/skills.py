@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+# Licensed to Anthony Shaw (anthonyshaw@apache.org) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from ..skills import BaseSkillsClient
+
+
+class AsyncSkillsClient(BaseSkillsClient):
+    """ Skills API (asyncio). """
+
+    async def all(self, from_page=None, per_page=None, raw=False):
+        """
+        Get all skills (will page results out)
+
+        :param from_page: Start at page
+        :type  from_page: ``int``
+
+        :param per_page: Results per page, up to
+            :attr:`pathgather.client.PathgatherClient.MAX_RESULTS_PER_PAGE`
+        :type  per_page: ``int``
+
+        :param raw: Return the decoded ``dict`` records, without building models
+        :type  raw: ``bool``
+
+        :rtype: ``list`` of :class:`pathgather.models.skill.Skill`
+        """
+        return [i async for i in self.iter_all(
+            from_page=from_page, per_page=per_page, raw=raw
+        )]
+
+    async def iter_all(self, from_page=None, per_page=None, raw=False):
+        """
+        Iterate all skills, fetching each page only when it is needed
+
+        :param from_page: Start at page
+        :type  from_page: ``int``
+
+        :param per_page: Results per page, up to
+            :attr:`pathgather.client.PathgatherClient.MAX_RESULTS_PER_PAGE`
+        :type  per_page: ``int``
+
+        :param raw: Return the decoded ``dict`` records, without building models
+        :type  raw: ``bool``
+
+        :rtype: ``async generator`` of :class:`pathgather.models.skill.Skill`
+        """
+        params = {}
+
+        if from_page is not None:
+            params["from"] = from_page
+        if per_page is not None:
+            params["per_page"] = per_page
+
+        skills = self.client.get_paged("skills", params=params)
+        async for page in skills:
+            for i in page["results"]:
+                yield i if raw else self._to_skill(i)
+
+    async def get(self, id, raw=False):
+        """
+        Fetch a skill by ID.
+
+        :param id: The skill id
+        :type  id: ``str``
+
+        :param raw: Return the decoded ``dict``, without building a model
+        :type  raw: ``bool``
+
+        :rtype: :class:`pathgather.models.skill.Skill`
+        """
+        skill = await self.client.get("skills/{0}".format(id))
+        return skill if raw else self._to_skill(skill)
+
+    async def create(self, name, custom_id=None):
+        """
+        Create a skill.
+
+        :param name: The skill name
+        :type  name: ``str``
+
+        :param custom_id: Optional, but highly recommended
+        :type  custom_id: ``str``
+
+        :rtype: :class:`pathgather.models.skill.Skill`
+        """
+        params = {"name": name}
+
+        if custom_id:
+            params["custom_id"] = custom_id
+
+        skill = await self.client.post("skills", {"skill": params})
+        return self._to_skill(skill)
+
+    async def update(self, id, name=None, custom_id=None):
+        """
+        Update a skill.
+
+        :param id: The skill id
+        :type  id: ``str``
+
+        :param name: The skill name
+        :type  name: ``str``
+
+        :param custom_id: Optional, but highly recommended
+        :type  custom_id: ``str``
+
+        :rtype: :class:`pathgather.models.skill.Skill`
+        """
+        params = {}
+        if name:
+            params["name"] = name
+        if custom_id:
+            params["custom_id"] = custom_id
+
+        skill = await self.client.put("skills/{0}".format(id), {"user": params})
+        return self._to_skill(skill)
+
+    async def delete(self, id):
+        """
+        Delete a skill by ID.
+
+        :param id: The skill ID
+        :type  id: ``str``
+        """
+        await self.client.delete("skills/{0}".format(id))
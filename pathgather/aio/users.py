@@ -0,0 +1,310 @@
+# -*- coding: utf-8 -*-
+# Licensed to Anthony Shaw (anthonyshaw@apache.org) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from ..users import BaseUsersClient
+from ..types_ import SkillLevel
+from ..models.skill import UserSkill
+from ..exceptions import UserNotFoundException
+
+
+class AsyncUsersClient(BaseUsersClient):
+    """ Users API (asyncio). """
+
+    async def all(self, from_page=None, query=None, per_page=None, raw=False):
+        """
+        Get all users (will page results out)
+
+        :param from_page: Start at page
+        :type  from_page: ``int``
+
+        :param query: Extra query parameters
+        :param query: ``dict``
+
+        :param per_page: Results per page, up to
+            :attr:`pathgather.client.PathgatherClient.MAX_RESULTS_PER_PAGE`
+        :type  per_page: ``int``
+
+        :param raw: Return the decoded ``dict`` records, without building models
+        :type  raw: ``bool``
+
+        :return: A list of users
+        :rtype: ``list`` of :class:`pathgather.models.user.User`
+        """
+        return [i async for i in self.iter_all(
+            from_page=from_page, query=query, per_page=per_page, raw=raw
+        )]
+
+    async def iter_all(self, from_page=None, query=None, per_page=None, raw=False):
+        """
+        Iterate all users, fetching each page only when it is needed
+
+        :param from_page: Start at page
+        :type  from_page: ``int``
+
+        :param query: Extra query parameters
+        :param query: ``dict``
+
+        :param per_page: Results per page, up to
+            :attr:`pathgather.client.PathgatherClient.MAX_RESULTS_PER_PAGE`
+        :type  per_page: ``int``
+
+        :param raw: Return the decoded ``dict`` records, without building models
+        :type  raw: ``bool``
+
+        :return: An async generator of users
+        :rtype: ``async generator`` of :class:`pathgather.models.user.User`
+        """
+        params = {}
+
+        if from_page is not None:
+            params["from"] = from_page
+        if per_page is not None:
+            params["per_page"] = per_page
+
+        data = None
+        if query is not None:
+            data = self.client.json_codec.encode({"q": query})
+
+        users = self.client.get_paged("users", params=params, data=data)
+        async for page in users:
+            for i in page["results"]:
+                yield i if raw else self._to_user(i)
+
+    async def get(self, id, raw=False):
+        """
+        Fetch a user by ID.
+
+        :param id: The user id
+        :type  id: ``str``
+
+        :param raw: Return the decoded ``dict``, without building a model
+        :type  raw: ``bool``
+
+        :rtype: :class:`pathgather.models.user.User`
+        """
+        user = await self.client.get("users/{0}".format(id))
+        return user if raw else self._to_user(user)
+
+    async def get_by_email(self, email, raw=False):
+        """
+        Get a user by email
+
+        :param email: User's email address
+        :type  email: ``str``
+
+        :param raw: Return the decoded ``dict``, without building a model
+        :type  raw: ``bool``
+
+        :rtype: :class:`pathgather.models.user.User`
+        """
+        data = self.client.json_codec.encode({"q": {"email": {"eq": email}}})
+
+        users = await self.client.get("users", params=None, data=data)
+        if len(users["results"]) == 0:
+            raise UserNotFoundException(
+                "Could not find user {0}".format(email), "users"
+            )
+        return users["results"][0] if raw else self._to_user(users["results"][0])
+
+    async def create(
+        self,
+        name,
+        job_title,
+        department,
+        email,
+        saml_id=None,
+        custom_id=None,
+        hire_date=None,
+        location="",
+        avatar="",
+        admin=False,
+        send_invite=True,
+        deactivated=False,
+        custom_fields=None,
+    ):
+        """
+        Create a user, see :meth:`pathgather.users.UsersClient.create`
+
+        :rtype: :class:`pathgather.models.user.User`
+        """
+        params = self._create_params(
+            name,
+            job_title,
+            department,
+            email,
+            saml_id,
+            custom_id,
+            hire_date,
+            location,
+            avatar,
+            admin,
+            send_invite,
+            deactivated,
+            custom_fields,
+        )
+
+        user = await self.client.post("users", {"user": params})
+        return self._to_user(user)
+
+    async def update(
+        self,
+        id,
+        name=None,
+        job_title=None,
+        department=None,
+        email=None,
+        saml_id=None,
+        custom_id=None,
+        hire_date=None,
+        location=None,
+        avatar=None,
+        admin=None,
+        deactivated=None,
+        custom_fields=None,
+    ):
+        """
+        Update a user, see :meth:`pathgather.users.UsersClient.update`
+
+        :rtype: :class:`pathgather.models.user.User`
+        """
+        params = self._update_params(
+            name,
+            job_title,
+            department,
+            email,
+            saml_id,
+            custom_id,
+            hire_date,
+            location,
+            avatar,
+            admin,
+            deactivated,
+            custom_fields,
+        )
+
+        user = await self.client.put("users/{0}".format(id), {"user": params})
+        return self._to_user(user)
+
+    async def delete(self, id):
+        """
+        Delete a user by ID.
+
+        :param id: The user ID
+        :type  id: ``str``
+        """
+        await self.client.delete("users/{0}".format(id))
+
+    async def skills(self, id, raw=False):
+        """
+        Get user skills
+
+        :param id: The user ID
+        :type  id: ``str``
+
+        :param raw: Return the decoded ``dict`` records, without building models
+        :type  raw: ``bool``
+
+        :rtype: ``list`` :class:`pathgather.models.skill.UserSkill`
+        """
+        result = await self.client.get("users/{0}/user_skills".format(id))
+        return result["results"] if raw else self._to_user_skills(result["results"])
+
+    async def add_skill(self, id, skill, level=SkillLevel.ALL):
+        """
+        Add a skill to a user
+
+        :param id: The user ID
+        :type  id: ``str``
+
+        :param skill: The skill to add
+        :type  skill: :class:`pathgather.models.skill.Skill`
+
+        :param level: The skill level
+        :type  level: ``str`` or :enum:`pathgather.types.SkillLevel`
+
+        :rtype: :class:`pathgather.models.skill.UserSkill`
+        """
+        return await self.add_skill_by_id(id, skill.id, level)
+
+    async def add_skill_by_id(self, id, skill_id, level=SkillLevel.ALL):
+        """
+        Add a skill to a user
+
+        :param id: The user ID
+        :type  id: ``str``
+
+        :param skill_id: The skill to add
+        :type  skill_id: ``str``
+
+        :param level: The skill level
+        :type  level: ``str`` or :enum:`pathgather.types.SkillLevel`
+
+        :rtype: :class:`pathgather.models.skill.UserSkill`
+        """
+        data = {"skill_id": skill_id, "level": level}
+        result = await self.client.post("users/{0}/user_skills".format(id), data)
+        return self._to_user_skill(result)
+
+    async def add_skill_by_name(self, id, skill_name, level=SkillLevel.ALL):
+        """
+        Add a skill to a user
+
+        :param id: The user ID
+        :type  id: ``str``
+
+        :param skill_name: The skill to add
+        :type  skill_name: ``str``
+
+        :param level: The skill level
+        :type  level: ``str`` or :enum:`pathgather.types.SkillLevel`
+
+        :rtype: :class:`pathgather.models.skill.UserSkill`
+        """
+        data = {"skill_name": skill_name, "level": level}
+        result = await self.client.post("users/{0}/user_skills".format(id), data)
+        return self._to_user_skill(result)
+
+    async def update_skill_level(self, id, skill, level):
+        """
+        Update the skill level for a user
+
+        :param id: The user ID
+        :type  id: ``str``
+
+        :param skill: The skill to add
+        :type  skill: :class:`pathgather.models.skill.Skill`
+
+        :param level: The skill level
+        :type  level: ``str`` or :enum:`pathgather.types.SkillLevel`
+
+        :rtype: :class:`pathgather.models.skill.UserSkill`
+        """
+        return await self.add_skill_by_id(id, skill.id, level)
+
+    async def delete_skill(self, id, user_skill):
+        """
+        Delete the skill for a user
+
+        :param id: The user ID
+        :type  id: ``str``
+
+        :param user_skill: The user skill to delete
+        :type  user_skill: :class:`pathgather.models.skill.UserSkill` or ``str``
+        """
+        if isinstance(user_skill, UserSkill):
+            user_skill = user_skill.id
+        await self.client.delete("users/{0}/user_skills/{1}".format(id, user_skill))
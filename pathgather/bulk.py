@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+# Licensed to Anthony Shaw (anthonyshaw@apache.org) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+from attr import attrs, attrib, Factory
+
+
+@attrs
+class BulkResult(object):
+    index = attrib()
+    item = attrib()
+    result = attrib(default=None)
+    error = attrib(default=None)
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+@attrs
+class BulkReport(object):
+    results = attrib()
+    elapsed = attrib()
+    skipped = attrib(default=Factory(list))
+
+    @property
+    def succeeded(self):
+        """
+        :rtype: ``list`` of :class:`BulkResult`
+        """
+        return [r for r in self.results if r.ok]
+
+    @property
+    def failed(self):
+        """
+        :rtype: ``list`` of :class:`BulkResult`
+        """
+        return [r for r in self.results if not r.ok]
+
+    @property
+    def throughput(self):
+        """
+        Items processed per second
+
+        :rtype: ``float``
+        """
+        if not self.elapsed:
+            return 0.0
+        return len(self.results) / self.elapsed
+
+
+def run_bulk(func, items, max_workers=8, rate_limiter=None):
+    """
+    Call ``func(item)`` for every item on a pool of threads
+
+    At most ``2 * max_workers`` items are in flight, so ``items`` may be a
+    long generator. An exception raised for one item is recorded in its
+    :class:`BulkResult` and does not stop the others.
+
+    Items are only throttled by ``rate_limiter``, or by the client's own
+    :class:`pathgather.ratelimit.RateLimiter` inside ``func``. Without
+    either, the ``max_workers`` threads call the API as fast as it answers.
+
+    :param func: Called with each item
+    :type  func: ``callable``
+
+    :param items: The items
+    :type  items: ``iterable``
+
+    :param max_workers: Number of threads
+    :type  max_workers: ``int``
+
+    :param rate_limiter: Start the items within this limiter's rate
+    :type  rate_limiter: :class:`pathgather.ratelimit.RateLimiter`
+
+    :return: A report with one result per item, in input order
+    :rtype: :class:`BulkReport`
+    """
+    started = time.time()
+    results = []
+    pending = {}
+    if rate_limiter is not None:
+        call = func
+
+        def func(item):
+            rate_limiter.acquire()
+            return call(item)
+
+    def collect(done):
+        for future in done:
+            result = pending.pop(future)
+            try:
+                result.result = future.result()
+            except Exception as e:
+                result.error = e
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for index, item in enumerate(items):
+            if len(pending) >= 2 * max_workers:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+            result = BulkResult(index=index, item=item)
+            results.append(result)
+            pending[pool.submit(func, item)] = result
+        collect(wait(pending).done)
+    return BulkReport(results=results, elapsed=time.time() - started)
@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+# Licensed to Anthony Shaw (anthonyshaw@apache.org) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import pickle  # nosec - only used on bodies this process decoded itself
+import threading
+import time
+from collections import OrderedDict
+
+_clock = getattr(time, "monotonic", time.time)
+
+
+class HttpCache(object):
+    """
+    Stores ``GET`` response bodies with their ``ETag`` and ``Last-Modified``
+    validators so that :class:`pathgather.PathgatherClient` can revalidate
+    them with a conditional request. A ``304 Not Modified`` is answered from
+    the cache without downloading or decoding the body again.
+
+    Bodies are kept pickled, callers always get their own copy. The least
+    recently used entries are evicted beyond ``max_entries``. Safe to share
+    between threads and clients.
+    """
+
+    def __init__(self, max_entries=1024):
+        """
+        :param max_entries: Maximum number of responses to keep
+        :type  max_entries: ``int``
+        """
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(url, params=None, data=None):
+        """
+        The cache key of a request
+
+        :rtype: ``tuple``
+        """
+        return (url, tuple(sorted((params or {}).items())), data)
+
+    def headers(self, key):
+        """
+        The conditional request headers for a cached response
+
+        :return: Request headers, ``None`` if ``key`` is not cached
+        :rtype: ``dict``
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            return None
+        etag, last_modified, _ = entry
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def get(self, key):
+        """
+        A copy of the cached body
+
+        :return: The decoded body, ``None`` if ``key`` is not cached
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return None
+            # re-insert as the most recently used
+            self._entries[key] = entry
+        return pickle.loads(entry[2])  # nosec
+
+    def set(self, key, etag, last_modified, body):
+        """
+        Cache a decoded body with its validators
+        """
+        if not etag and not last_modified:
+            return
+        entry = (etag, last_modified, pickle.dumps(body, pickle.HIGHEST_PROTOCOL))
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = entry
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """
+        Remove every entry
+        """
+        with self._lock:
+            self._entries.clear()
+
+
+class EntityCache(object):
+    """
+    Caches the models returned by the sub-clients' ``get()`` methods, e.g.
+    :meth:`pathgather.users.UsersClient.get`, keyed by entity type
+    (``"users"``, ``"content"``, ``"paths"``, ``"skills"``, ``"providers"``,
+    ``"gatherings"``) and ID.
+
+    Entries expire after the TTL of their type, the least recently used
+    entries are evicted beyond ``max_entries``. Writes through the same
+    client, e.g. ``update()``, ``delete()`` or a user's ``add_skill()``,
+    invalidate the entity, whether it was cached by ID or by custom ID.
+    Cached models are shared between callers, treat them as read-only. Safe
+    to share between threads.
+    """
+
+    def __init__(self, max_entries=10000, ttl=300, ttls=None):
+        """
+        :param max_entries: Maximum number of entities to keep
+        :type  max_entries: ``int``
+
+        :param ttl: Default time to live of an entry, in seconds
+        :type  ttl: ``float``
+
+        :param ttls: Time to live per entity type, e.g. ``{"content": 3600}``
+        :type  ttls: ``dict``
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.ttls = ttls or {}
+        self._entries = OrderedDict()
+        # (kind, id or custom id) -> keys of the entries caching that entity
+        self._aliases = {}
+        self._lock = threading.Lock()
+
+    def get(self, kind, id):
+        """
+        A cached entity
+
+        :param kind: The entity type, e.g. ``"users"``
+        :type  kind: ``str``
+
+        :param id: The entity ID
+        :type  id: ``str``
+
+        :return: The model, ``None`` if it is not cached or has expired
+        """
+        key = (kind, id)
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return None
+            if entry[0] <= _clock():
+                self._unalias(key, entry)
+                return None
+            self._entries[key] = entry
+        return entry[1]
+
+    def set(self, kind, id, value):
+        """
+        Cache an entity
+
+        :param kind: The entity type, e.g. ``"users"``
+        :type  kind: ``str``
+
+        :param id: The entity ID
+        :type  id: ``str``
+
+        :param value: The model
+        """
+        key = (kind, id)
+        expires = _clock() + self.ttls.get(kind, self.ttl)
+        aliases = set([key])
+        for name in ("id", "custom_id"):
+            alias = getattr(value, name, None)
+            if alias:
+                aliases.add((kind, alias))
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (expires, value, aliases)
+            for alias in aliases:
+                self._aliases.setdefault(alias, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._unalias(*self._entries.popitem(last=False))
+
+    def invalidate(self, kind, id):
+        """
+        Remove an entity
+
+        :param kind: The entity type, e.g. ``"users"``
+        :type  kind: ``str``
+
+        :param id: The entity ID or custom ID
+        :type  id: ``str``
+        """
+        with self._lock:
+            for key in list(self._aliases.get((kind, id), ())):
+                self._remove(key)
+            self._remove((kind, id))
+
+    def clear(self):
+        """
+        Remove every entity
+        """
+        with self._lock:
+            self._entries.clear()
+            self._aliases.clear()
+
+    def _remove(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._unalias(key, entry)
+
+    def _unalias(self, key, entry):
+        for alias in entry[2]:
+            keys = self._aliases.get(alias)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._aliases[alias]
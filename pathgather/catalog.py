@@ -0,0 +1,254 @@
+# -*- coding: utf-8 -*-
+# Licensed to Anthony Shaw (anthonyshaw@apache.org) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+import arrow
+import requests
+
+from .exceptions import PathgatherApiException
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS catalog_records (
+    host TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    body TEXT NOT NULL,
+    PRIMARY KEY (host, kind, id)
+);
+CREATE TABLE IF NOT EXISTS catalog_meta (
+    host TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (host, kind)
+);
+"""
+
+
+class CatalogCache(object):
+    """
+    Persistent cache of a tenant's catalogues (content, providers, skills
+    and paths) in a SQLite database, so short-lived processes can load them
+    without paging through the API on every start.
+
+    Each catalogue is stored with the time it was fetched and is fetched
+    again once it is older than ``max_age``. The database can hold several
+    tenants, entries are keyed by the client's host. Safe to share between
+    threads.
+    """
+
+    #: catalogue name -> (collection URI, sub-client, model builder)
+    KINDS = {
+        "content": ("content", "content", "_to_content"),
+        "providers": ("providers", "providers", "_to_provider"),
+        "skills": ("skills", "skills", "_to_skill"),
+        "paths": ("paths", "paths", "_to_path"),
+    }
+
+    def __init__(self, client, path, max_age=None, serve_stale_on_error=True):
+        """
+        :param client: The API client to fetch catalogues with
+        :type  client: :class:`pathgather.PathgatherClient`
+
+        :param path: The SQLite database file, created if missing
+        :type  path: ``str``
+
+        :param max_age: Seconds after which a catalogue is fetched again,
+            ``None`` to keep it until :meth:`refresh` is called
+        :type  max_age: ``float``
+
+        :param serve_stale_on_error: Return a stale catalogue if fetching a
+            fresh one fails, with an API error or because the API could not
+            be reached, instead of raising
+        :type  serve_stale_on_error: ``bool``
+        """
+        self.client = client
+        self.host = client.base_url
+        self.max_age = max_age
+        self.serve_stale_on_error = serve_stale_on_error
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._db:
+            self._db.executescript(_SCHEMA)
+
+    def close(self):
+        """
+        Close the database
+        """
+        with self._lock:
+            self._db.close()
+
+    def content(self, max_age=None):
+        """
+        The content catalogue
+
+        :param max_age: Override the cache's ``max_age``
+        :type  max_age: ``float``
+
+        :rtype: ``list`` of :class:`pathgather.models.content.Content`
+        """
+        return self.load("content", max_age)
+
+    def providers(self, max_age=None):
+        """
+        The provider catalogue
+
+        :param max_age: Override the cache's ``max_age``
+        :type  max_age: ``float``
+
+        :rtype: ``list`` of :class:`pathgather.models.provider.Provider`
+        """
+        return self.load("providers", max_age)
+
+    def skills(self, max_age=None):
+        """
+        The skill catalogue
+
+        :param max_age: Override the cache's ``max_age``
+        :type  max_age: ``float``
+
+        :rtype: ``list`` of :class:`pathgather.models.skill.Skill`
+        """
+        return self.load("skills", max_age)
+
+    def paths(self, max_age=None):
+        """
+        The path catalogue
+
+        :param max_age: Override the cache's ``max_age``
+        :type  max_age: ``float``
+
+        :rtype: ``list`` of :class:`pathgather.models.path.Path`
+        """
+        return self.load("paths", max_age)
+
+    def load(self, kind, max_age=None):
+        """
+        Load a catalogue, fetching it from the API if it is missing or stale
+
+        :param kind: One of :attr:`KINDS`, e.g. ``"content"``
+        :type  kind: ``str``
+
+        :param max_age: Override the cache's ``max_age``
+        :type  max_age: ``float``
+
+        :return: A list of models
+        :rtype: ``list``
+        """
+        if max_age is None:
+            max_age = self.max_age
+        fetched_at = self._fetched_at(kind)
+        stale = fetched_at is None or (
+            max_age is not None and time.time() - fetched_at > max_age
+        )
+        if stale:
+            try:
+                self.refresh(kind)
+            except (PathgatherApiException, requests.RequestException):
+                if fetched_at is None or not self.serve_stale_on_error:
+                    raise
+        return [self._build(kind, body) for body in self._bodies(kind)]
+
+    def refresh(self, kind):
+        """
+        Fetch a catalogue from the API and replace the cached copy
+
+        :param kind: One of :attr:`KINDS`, e.g. ``"content"``
+        :type  kind: ``str``
+        """
+        uri = self.KINDS[kind][0]
+        # a record that moves between pages during the crawl is listed twice,
+        # keep its first position and its latest body
+        bodies = OrderedDict()
+        params = {"per_page": self.client.MAX_RESULTS_PER_PAGE}
+        dumps = self.client.json_codec.dumps
+        for page in self.client.get_paged(uri, params=params):
+            for record in page["results"]:
+                bodies[record["id"]] = dumps(record)
+        rows = [
+            (self.host, kind, id, position, body)
+            for position, (id, body) in enumerate(bodies.items())
+        ]
+        with self._lock, self._db:
+            self._db.execute(
+                "DELETE FROM catalog_records WHERE host = ? AND kind = ?",
+                (self.host, kind),
+            )
+            self._db.executemany(
+                "INSERT INTO catalog_records VALUES (?, ?, ?, ?, ?)", rows
+            )
+            self._db.execute(
+                "INSERT OR REPLACE INTO catalog_meta VALUES (?, ?, ?)",
+                (self.host, kind, time.time()),
+            )
+
+    def fetched_at(self, kind):
+        """
+        When a catalogue was last fetched
+
+        :param kind: One of :attr:`KINDS`, e.g. ``"content"``
+        :type  kind: ``str``
+
+        :return: The fetch time, ``None`` if it has never been fetched
+        :rtype: :class:`arrow.Arrow`
+        """
+        fetched_at = self._fetched_at(kind)
+        return arrow.get(fetched_at) if fetched_at is not None else None
+
+    def invalidate(self, kind=None):
+        """
+        Drop a cached catalogue, or all of this tenant's catalogues
+
+        :param kind: One of :attr:`KINDS`, ``None`` for all of them
+        :type  kind: ``str``
+        """
+        kinds = [kind] if kind is not None else list(self.KINDS)
+        with self._lock, self._db:
+            for k in kinds:
+                for table in ("catalog_records", "catalog_meta"):
+                    self._db.execute(
+                        "DELETE FROM {0} WHERE host = ? AND kind = ?".format(table),
+                        (self.host, k),
+                    )  # nosec - table names are constants
+
+    def _fetched_at(self, kind):
+        with self._lock:
+            row = self._db.execute(
+                "SELECT fetched_at FROM catalog_meta WHERE host = ? AND kind = ?",
+                (self.host, kind),
+            ).fetchone()
+        return row[0] if row else None
+
+    def _bodies(self, kind):
+        with self._lock:
+            return [
+                row[0]
+                for row in self._db.execute(
+                    "SELECT body FROM catalog_records WHERE host = ? AND kind = ? "
+                    "ORDER BY position",
+                    (self.host, kind),
+                )
+            ]
+
+    def _build(self, kind, body):
+        _, sub_client, builder = self.KINDS[kind]
+        record = self.client.json_codec.decode(body)
+        return getattr(getattr(self.client, sub_client), builder)(record)
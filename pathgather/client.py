@@ -14,9 +14,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import threading
+import time
+
+try:
+    import queue
+except ImportError:  # Python 2
+    import Queue as queue
+
 import requests
+from requests.adapters import HTTPAdapter
 
 from pathgather.exceptions import PathgatherApiException
+from .codec import default_codec
+from .metrics import RequestEvent, RequestMetrics, endpoint_template
+from .ratelimit import parse_retry_after
+from . import stream as streaming
 from .users import UsersClient
 from .content import ContentClient
 from .paths import PathsClient
@@ -24,10 +37,17 @@ from .gatherings import GatheringsClient
 from .skills import SkillsClient
 from .providers import ProvidersClient
 
+_clock = getattr(time, "monotonic", time.time)
+
 
 class PathgatherClient(object):
     """
     The main API client
+
+    A client, and its sub-clients, can be shared by many threads. They share
+    one connection pool, so size ``pool_maxsize`` to the number of threads.
+    Per-client settings such as :attr:`results_per_page` should be set on the
+    instance, or passed to the constructor, rather than on the class.
     """
 
     """
@@ -35,7 +55,36 @@ class PathgatherClient(object):
     """
     results_per_page = 50
 
-    def __init__(self, host, api_key, proxy=None, skip_ssl_validation=False):
+    """
+    The largest page the API returns. Use it as ``per_page`` when exporting
+    a whole collection, it takes half the requests of the default
+    """
+    MAX_RESULTS_PER_PAGE = 100
+
+    def __init__(
+        self,
+        host,
+        api_key,
+        proxy=None,
+        skip_ssl_validation=False,
+        prefetch_pages=0,
+        rate_limiter=None,
+        retry_policy=None,
+        results_per_page=None,
+        pool_connections=10,
+        pool_maxsize=10,
+        pool_block=False,
+        keep_alive=True,
+        timeout=None,
+        http_cache=None,
+        entity_cache=None,
+        json_codec=None,
+        stream_pages=False,
+        scheme="https",
+        before_request=None,
+        after_request=None,
+        metrics=None,
+    ):
         """
         Instantiate a new API client
 
@@ -50,12 +99,97 @@ class PathgatherClient(object):
 
         :param skip_ssl_validation: Skip SSL validation
         :type  skip_ssl_validation: ``bool``
+
+        :param prefetch_pages: Default number of pages :meth:`get_paged` fetches
+            ahead on a background thread, 0 (the default) disables prefetching
+        :type  prefetch_pages: ``int``
+
+        :param rate_limiter: Limit the request rate of this client and retry
+            throttled (HTTP 429) requests
+        :type  rate_limiter: :class:`pathgather.ratelimit.RateLimiter`
+
+        :param retry_policy: Retry failed requests, e.g. HTTP 5xx responses,
+            connection errors and timeouts
+        :type  retry_policy: :class:`pathgather.retry.RetryPolicy`
+
+        :param results_per_page: Results per page for this client, max 100
+        :type  results_per_page: ``int``
+
+        :param pool_connections: Number of host connection pools to cache
+        :type  pool_connections: ``int``
+
+        :param pool_maxsize: Maximum number of connections kept open to the host,
+            set this to at least the number of threads sharing the client
+        :type  pool_maxsize: ``int``
+
+        :param pool_block: Block when all ``pool_maxsize`` connections are in use
+            instead of opening (and later discarding) an extra connection
+        :type  pool_block: ``bool``
+
+        :param keep_alive: Reuse connections between requests
+        :type  keep_alive: ``bool``
+
+        :param timeout: Seconds to wait for the server, either one value or a
+            ``(connect, read)`` tuple. ``None`` waits forever
+        :type  timeout: ``float`` or ``tuple``
+
+        :param http_cache: Revalidate repeated ``GET`` requests with
+            ``If-None-Match``/``If-Modified-Since`` and serve unchanged
+            responses from this cache
+        :type  http_cache: :class:`pathgather.cache.HttpCache`
+
+        :param entity_cache: Cache the models returned by the sub-clients' ``get()``
+        :type  entity_cache: :class:`pathgather.cache.EntityCache`
+
+        :param json_codec: Encodes request bodies and decodes responses,
+            defaults to the fastest JSON library installed
+        :type  json_codec: :class:`pathgather.codec.JsonCodec`
+
+        :param stream_pages: Default for :meth:`get_paged`'s ``stream``,
+            parse each page's results as they are received (requires ``ijson``)
+        :type  stream_pages: ``bool``
+
+        :param scheme: "https", or "http" for a local server such as
+            :class:`pathgather.server.PathgatherServer`
+        :type  scheme: ``str``
+
+        :param before_request: Called with a :class:`pathgather.metrics.RequestEvent`
+            before each request is sent
+        :type  before_request: ``callable``
+
+        :param after_request: Called with the same event once the request has
+            completed, or failed, with its status, latency, sizes and retries
+        :type  after_request: ``callable``
+
+        :param metrics: Counts the requests for :meth:`stats`, pass one
+            instance to several clients to count their requests together
+        :type  metrics: :class:`pathgather.metrics.RequestMetrics`
         """
         self._api_key = api_key
-
-        self.base_url = "https://{0}/v1".format(host)
+        self.prefetch_pages = prefetch_pages
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        if results_per_page is not None:
+            self.results_per_page = results_per_page
+        self.timeout = timeout
+        self.http_cache = http_cache
+        self.entity_cache = entity_cache
+        self.json_codec = json_codec or default_codec()
+        self.stream_pages = stream_pages
+        self.before_request = before_request
+        self.after_request = after_request
+        self.metrics = metrics if metrics is not None else RequestMetrics()
+
+        self.base_url = "{0}://{1}/v1".format(scheme, host)
 
         self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         if proxy:
             self.session.proxies = {"https": proxy}
         if skip_ssl_validation:
@@ -67,6 +201,8 @@ class PathgatherClient(object):
                 "Authorization": "Bearer {0}".format(api_key),
             }
         )
+        if not keep_alive:
+            self.session.headers["Connection"] = "close"
 
         self._users = UsersClient(self)
         self._content = ContentClient(self)
@@ -75,62 +211,269 @@ class PathgatherClient(object):
         self._skills = SkillsClient(self)
         self._providers = ProvidersClient(self)
 
-    def get(self, uri, params=None, data=None):
+    def _request(self, method, uri, idempotent=None, **kwargs):
+        url = "{0}/{1}".format(self.base_url, uri)
+        data = kwargs.get("data")
+        event = RequestEvent(
+            method=method,
+            uri=uri,
+            endpoint=endpoint_template(uri),
+            cursor=(kwargs.get("params") or {}).get("from"),
+            request_bytes=len(data) if data else 0,
+        )
+        if self.before_request is not None:
+            self.before_request(event)
+        started = _clock()
         try:
-            if params:
-                if "per_page" not in params:
-                    params["per_page"] = self.results_per_page
+            if self.retry_policy is None:
+                result = self._send(method, url, event, **kwargs)
             else:
-                params = {"per_page": self.results_per_page}
-            result = self.session.get(
-                "{0}/{1}".format(self.base_url, uri), params=params, data=data
+                result = self.retry_policy.run(
+                    method,
+                    uri,
+                    lambda: self._send(method, url, event, **kwargs),
+                    idempotent,
+                )
+            event.status_code = result.status_code
+            event.response_bytes = self._response_bytes(result, kwargs.get("stream"))
+            return result
+        except Exception as e:
+            event.error = e
+            raise
+        finally:
+            event.elapsed = _clock() - started
+            self.metrics.record(event)
+            if self.after_request is not None:
+                self.after_request(event)
+
+    @staticmethod
+    def _response_bytes(result, stream):
+        if not stream:
+            return len(result.content)
+        # reading a streamed body here would consume it
+        length = result.headers.get("Content-Length")
+        return int(length) if length and length.isdigit() else None
+
+    def _send(self, method, url, event, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        limiter = self.rate_limiter
+        if limiter is None:
+            event.attempts += 1
+            return self.session.request(method, url, **kwargs)
+        throttles = 0
+        while True:
+            limiter.acquire()
+            event.attempts += 1
+            result = self.session.request(method, url, **kwargs)
+            if result.status_code != 429:
+                limiter.succeeded()
+                return result
+            limiter.throttled(parse_retry_after(result.headers.get("Retry-After")))
+            throttles += 1
+            if throttles > limiter.max_retries:
+                return result
+            # release the connection of a streamed response
+            result.close()
+
+    def get(self, uri, params=None, data=None):
+        try:
+            # copy, callers' params may be shared between threads
+            params = dict(params or {})
+            if "per_page" not in params:
+                params["per_page"] = self.results_per_page
+            cache = self.http_cache
+            if cache is None:
+                result = self._request("GET", uri, params=params, data=data)
+                result.raise_for_status()
+                return self.json_codec.decode(result.content)
+
+            key = cache.key("{0}/{1}".format(self.base_url, uri), params, data)
+            result = self._request(
+                "GET", uri, params=params, data=data, headers=cache.headers(key)
             )
+            if result.status_code == 304:
+                body = cache.get(key)
+                if body is not None:
+                    return body
+                # evicted since the request was sent, fetch it unconditionally
+                result = self._request("GET", uri, params=params, data=data)
             result.raise_for_status()
-
-            return result.json()
+            body = self.json_codec.decode(result.content)
+            cache.set(
+                key,
+                result.headers.get("ETag"),
+                result.headers.get("Last-Modified"),
+                body,
+            )
+            return body
         except requests.HTTPError as e:
             raise PathgatherApiException(e.response.text, uri)
 
-    def get_paged(self, uri, params=None, data=None):
+    def get_paged(self, uri, params=None, data=None, prefetch=None, stream=None):
+        """
+        Iterate the pages of a paged collection, following the ``next`` cursor
+
+        :param params: Query parameters sent with every page. ``from`` is
+            the cursor of the first page, ``per_page`` the page size (at most
+            :attr:`MAX_RESULTS_PER_PAGE`)
+        :type  params: ``dict``
+
+        :param prefetch: Number of pages to fetch ahead on a background thread
+            while the caller processes the current one, defaults to
+            :attr:`prefetch_pages`. 0 fetches each page on demand.
+        :type  prefetch: ``int``
+
+        :param stream: Parse each page while it is received, so the first
+            results are available before the whole page has arrived. The
+            page's ``results`` is then a generator, and its ``next`` is only
+            set once the results have been read. Defaults to
+            :attr:`stream_pages`. Ignored when prefetching, or when ``ijson``
+            is not installed. Streamed pages bypass the :attr:`http_cache`.
+        :type  stream: ``bool``
+
+        :rtype: ``generator`` of ``dict``
+        """
+        if prefetch is None:
+            prefetch = self.prefetch_pages
+        if stream is None:
+            stream = self.stream_pages
+        if prefetch > 0:
+            return self._get_paged_prefetch(uri, params, data, prefetch)
+        if stream and streaming.available():
+            return self._get_paged_stream(uri, params, data)
+        return self._get_paged(uri, params, data)
+
+    def _page_params(self, params):
+        params = dict(params or {})
+        if "per_page" in params:
+            params["per_page"] = min(params["per_page"], self.MAX_RESULTS_PER_PAGE)
+        return params
+
+    def _get_paged(self, uri, params=None, data=None):
+        params = self._page_params(params)
         try:
-            page = None
             end = False
             while not end:
-                result = self.get(uri, params={"from": page}, data=data)
+                result = self.get(uri, params=params, data=data)
                 next_page = result["next"]
                 yield result
                 if next_page:
-                    page = next_page
+                    params["from"] = next_page
                 else:
                     end = True
         except requests.HTTPError as e:
             raise PathgatherApiException(e.response.text, uri)
 
-    def post(self, uri, data=None):
+    def _get_paged_stream(self, uri, params=None, data=None):
+        params = self._page_params(params)
+        params.setdefault("per_page", self.results_per_page)
+        while True:
+            result = self._request("GET", uri, params=params, data=data, stream=True)
+            try:
+                try:
+                    result.raise_for_status()
+                except requests.HTTPError as e:
+                    raise PathgatherApiException(e.response.text, uri)
+                page = {"next": None}
+                page["results"] = streaming.iter_results(
+                    result.iter_content(chunk_size=64 * 1024), page
+                )
+                yield page
+                # read whatever the caller skipped to reach the cursor
+                for _ in page["results"]:
+                    pass
+            finally:
+                result.close()
+            if not page["next"]:
+                return
+            params["from"] = page["next"]
+
+    def _get_paged_prefetch(self, uri, params, data, depth):
+        pages = queue.Queue(maxsize=depth)
+        stop = threading.Event()
+
+        def put(item):
+            # Give up once the consumer has gone away rather than block forever
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def fetch():
+            try:
+                for page in self._get_paged(uri, params, data):
+                    if not put((page, None)):
+                        return
+            except Exception as e:
+                put((None, e))
+                return
+            put((None, None))
+
+        worker = threading.Thread(target=fetch, name="pathgather-prefetch")
+        worker.daemon = True
+        worker.start()
+        try:
+            while True:
+                page, error = pages.get()
+                if error is not None:
+                    raise error
+                if page is None:
+                    return
+                yield page
+        finally:
+            stop.set()
+
+    def post(self, uri, data=None, idempotent=None):
+        """
+        :param idempotent: Whether repeating this request is harmless, so the
+            retry policy may retry it like a ``GET``. By default a ``POST`` is
+            only retried if it could not connect.
+        :type  idempotent: ``bool``
+        """
         try:
-            result = self.session.post("{0}/{1}".format(self.base_url, uri), json=data)
+            result = self._request(
+                "POST", uri, idempotent=idempotent, data=self._encode(data)
+            )
             result.raise_for_status()
 
-            return result.json()
+            return self.json_codec.decode(result.content)
         except requests.HTTPError as e:
             raise PathgatherApiException(e.response.text)
 
     def put(self, uri, data=None):
         try:
-            result = self.session.put("{0}/{1}".format(self.base_url, uri), json=data)
+            result = self._request("PUT", uri, data=self._encode(data))
             result.raise_for_status()
-            if result.text:
-                return result.json()
+            if result.content:
+                return self.json_codec.decode(result.content)
         except requests.HTTPError as e:
             raise PathgatherApiException(e.response.text)
 
+    def _encode(self, data):
+        return self.json_codec.encode(data) if data is not None else None
+
     def delete(self, uri):
         try:
-            result = self.session.delete("{0}/{1}".format(self.base_url, uri))
+            result = self._request("DELETE", uri)
             result.raise_for_status()
         except requests.HTTPError as e:
             raise PathgatherApiException(e.response.text)
 
+    def stats(self, reset=False):
+        """
+        Request counters and latency histograms of this client, in total and
+        per endpoint, see :meth:`pathgather.metrics.RequestMetrics.stats`
+
+        :param reset: Clear the counters after taking the snapshot
+        :type  reset: ``bool``
+
+        :rtype: ``dict``
+        """
+        return self.metrics.stats(reset)
+
     @property
     def users(self):
         """
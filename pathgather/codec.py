@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+# Licensed to Anthony Shaw (anthonyshaw@apache.org) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import json
+
+from .utils import strip_types
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+def _strip_type(obj):
+    obj.pop("_type", None)
+    return obj
+
+
+class JsonCodec(object):
+    """
+    Encodes request bodies and decodes responses with the standard library
+    :mod:`json` module. Subclass it to plug in another JSON library, overriding
+    :meth:`dumps` and :meth:`loads`. :meth:`decode` parses with :meth:`loads`,
+    override it too if the library can remove the ``_type`` keys while parsing.
+    """
+
+    name = "json"
+
+    def dumps(self, obj):
+        """
+        :param obj: The value to encode
+        :rtype: ``str``
+        """
+        return json.dumps(obj)
+
+    def encode(self, obj):
+        """
+        Encode a request body
+
+        :param obj: The value to encode
+        :return: UTF-8 encoded JSON
+        :rtype: ``bytes``
+        """
+        return self.dumps(obj).encode("utf-8")
+
+    def loads(self, data):
+        """
+        :param data: A UTF-8 JSON document
+        :type  data: ``bytes`` or ``str``
+        """
+        if isinstance(data, bytes):
+            data = data.decode("utf-8")
+        return json.loads(data)
+
+    def decode(self, data):
+        """
+        Decode an API response, removing the ``_type`` keys the API adds to
+        every object
+
+        :param data: A UTF-8 JSON document
+        :type  data: ``bytes`` or ``str``
+        """
+        if type(self).loads != JsonCodec.loads:
+            return strip_types(self.loads(data))
+        # json's object_hook removes them while parsing
+        if isinstance(data, bytes):
+            data = data.decode("utf-8")
+        return json.loads(data, object_hook=_strip_type)
+
+
+class OrjsonCodec(JsonCodec):
+    """
+    JSON codec using :mod:`orjson`
+    """
+
+    name = "orjson"
+
+    def dumps(self, obj):
+        return orjson.dumps(obj).decode("utf-8")
+
+    def encode(self, obj):
+        return orjson.dumps(obj)
+
+    def loads(self, data):
+        return orjson.loads(data)
+
+    def decode(self, data):
+        return strip_types(self.loads(data))
+
+
+class UjsonCodec(JsonCodec):
+    """
+    JSON codec using :mod:`ujson`
+    """
+
+    name = "ujson"
+
+    def dumps(self, obj):
+        return ujson.dumps(obj, ensure_ascii=False)
+
+    def loads(self, data):
+        return ujson.loads(data)
+
+    def decode(self, data):
+        return strip_types(self.loads(data))
+
+
+def default_codec():
+    """
+    The fastest codec installed, preferring orjson, then ujson, then the
+    standard library
+
+    :rtype: :class:`JsonCodec`
+    """
+    if orjson is not None:
+        return OrjsonCodec()
+    if ujson is not None:
+        return UjsonCodec()
+    return JsonCodec()
@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+# Licensed to Anthony Shaw (anthonyshaw@apache.org) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from collections import OrderedDict
+
+#: Columns ending with these are converted to timestamps by :func:`to_dataframe`
+DATE_SUFFIXES = ("_at", "_date")
+
+
+def iter_records(client, uri, query=None, filter=None, per_page=None):
+    """
+    Iterate the decoded records of a paged collection, without building models
+
+    :param client: The API client
+    :type  client: :class:`pathgather.PathgatherClient`
+
+    :param uri: The collection, e.g. "users"
+    :type  uri: ``str``
+
+    :param query: Additional filter query
+        (see https://docs.pathgather.com/docs/filtering)
+    :type  query: ``dict``
+
+    :param filter: Additional type filter, e.g. "shared", "official"
+    :type  filter: ``str``
+
+    :param per_page: Results per page, defaults to the maximum
+    :type  per_page: ``int``
+
+    :rtype: ``generator`` of ``dict``
+    """
+    body = {}
+    if query:
+        body["q"] = query
+    if filter:
+        body["filter"] = filter
+    data = client.json_codec.encode(body) if body else None
+    params = {"per_page": per_page or client.MAX_RESULTS_PER_PAGE}
+    for page in client.get_paged(uri, params=params, data=data):
+        for record in page["results"]:
+            yield record
+
+
+def _flatten(record, prefix, row, objects):
+    for key, value in record.items():
+        name = prefix + key
+        if isinstance(value, dict):
+            objects.add(name)
+            _flatten(value, name + ".", row, objects)
+        elif value is not None or name not in objects:
+            # a null object leaves its dotted columns to be padded with None
+            row[name] = value
+    return row
+
+
+def _lookup(record, path):
+    for key in path:
+        if not isinstance(record, dict):
+            return None
+        record = record.get(key)
+    return record
+
+
+def to_columns(records, fields=None):
+    """
+    Write records into one list per column
+
+    Nested objects are flattened into dotted columns, e.g. ``user.email``,
+    also in the records where the object is ``null``. Values missing from a
+    record are ``None``. Lists, e.g. ``skills``, are kept as they are.
+
+    The columns are plain lists rather than typed arrays, so that no
+    dependency is needed. pandas and pyarrow infer each column's type when
+    :func:`to_dataframe` or :func:`to_arrow` convert them.
+
+    :param records: Decoded API records
+    :type  records: ``iterable`` of ``dict``
+
+    :param fields: The columns to keep, e.g. ``["id", "user.email"]``,
+        ``None`` keeps every column in the order first seen
+    :type  fields: ``list`` of ``str``
+
+    :rtype: ``OrderedDict`` of ``str`` to ``list``
+    """
+    if fields is not None:
+        columns = OrderedDict((name, []) for name in fields)
+        paths = [(columns[name].append, name.split(".")) for name in fields]
+        for record in records:
+            for append, path in paths:
+                append(_lookup(record, path))
+        return columns
+
+    columns = OrderedDict()
+    objects = set()
+    count = 0
+    for record in records:
+        known = len(objects)
+        row = _flatten(record, "", {}, objects)
+        if len(objects) != known:
+            # an object seen as null so far is flattened from now on
+            for name in objects:
+                column = columns.get(name)
+                if column is not None and all(v is None for v in column):
+                    del columns[name]
+        for name, value in row.items():
+            column = columns.get(name)
+            if column is None:
+                # pad a column first seen part way through
+                column = columns[name] = [None] * count
+            column.append(value)
+        count += 1
+        for column in columns.values():
+            if len(column) < count:
+                column.append(None)
+    return columns
+
+
+def to_dataframe(columns, parse_dates=True):
+    """
+    Convert columns from :func:`to_columns` to a :class:`pandas.DataFrame`.
+    Requires ``pandas`` (``pip install pathgather[dataframe]``).
+
+    :param columns: The columns
+    :type  columns: ``dict`` of ``str`` to ``list``
+
+    :param parse_dates: Convert the ``*_at`` and ``*_date`` columns from
+        ISO-8601 strings to UTC timestamps
+    :type  parse_dates: ``bool``
+
+    :rtype: :class:`pandas.DataFrame`
+    """
+    # imported on first use, pandas takes long to import
+    try:
+        import pandas
+    except ImportError:
+        raise ImportError("to_dataframe requires pandas")
+    frame = pandas.DataFrame(columns, columns=list(columns))
+    if parse_dates:
+        for name in frame.columns:
+            if name.endswith(DATE_SUFFIXES):
+                frame[name] = pandas.to_datetime(
+                    frame[name], utc=True, errors="coerce"
+                )
+    return frame
+
+
+def to_arrow(columns):
+    """
+    Convert columns from :func:`to_columns` to a :class:`pyarrow.Table`, e.g.
+    to write Parquet files. Requires ``pyarrow`` (``pip install pathgather[arrow]``).
+
+    :param columns: The columns
+    :type  columns: ``dict`` of ``str`` to ``list``
+
+    :rtype: :class:`pyarrow.Table`
+    """
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError("to_arrow requires pyarrow")
+    return pyarrow.table(OrderedDict(columns))
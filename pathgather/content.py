@@ -14,20 +14,148 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import json
-
+from .bulk import run_bulk
+from .columns import iter_records, to_arrow, to_columns, to_dataframe
+from .shard import iter_sharded
+from .sync import sync_since
 from .models.content import Content, ContentProvider, UserContent, ContentComment
 from .models.user import User
-from .utils import scrub
 
 
-class ContentClient(object):
-    """ Content API. """
+class BaseContentClient(object):
+    """ Request building and model hydration shared by the Content API clients. """
 
     def __init__(self, client):
         self.client = client
 
-    def all(self, from_page=None, query=None, filter=None):
+    def _create_params(
+        self,
+        name,
+        content_type,
+        source_url,
+        topic_name,
+        provider_name,
+        provider_id,
+        level,
+        custom_id,
+        description,
+        image,
+        tags,
+        enabled,
+        skills,
+        duration,
+    ):
+        params = {
+            "name": name,
+            "content_type": content_type,
+            "source_url": source_url,
+            "topic_name": topic_name,
+            "enabled": enabled,
+        }
+        if level:
+            params["level"] = level
+        if custom_id:
+            params["custom_id"] = custom_id
+        if description:
+            params["description"] = description
+        if image:
+            params["image"] = image
+        if tags:
+            params["tags"] = tags
+        if skills:
+            params["skills"] = skills
+        if duration:
+            params["duration_str"] = duration
+        if provider_name:
+            params["provider_name"] = provider_name
+        else:
+            if provider_id:
+                params["provider_custom_id"] = provider_id
+            else:
+                raise ValueError("provider_name or provider_id required")
+        return params
+
+    def _update_params(
+        self,
+        name,
+        content_type,
+        source_url,
+        topic_name,
+        provider_name,
+        provider_id,
+        level,
+        custom_id,
+        description,
+        image,
+        tags,
+        enabled,
+        skills,
+        duration,
+    ):
+        params = {}
+        if name:
+            params["name"] = name
+        if content_type:
+            params["content_type"] = content_type
+        if source_url:
+            params["source_url"] = source_url
+        if topic_name:
+            params["topic_name"] = topic_name
+        if enabled is not None:
+            params["enabled"] = enabled
+        if level:
+            params["level"] = level
+        if custom_id:
+            params["custom_id"] = custom_id
+        if description:
+            params["description"] = description
+        if image:
+            params["image"] = image
+        if tags:
+            params["tags"] = tags
+        if skills:
+            params["skills"] = skills
+        if duration:
+            params["duration_str"] = duration
+        if provider_name:
+            params["provider_name"] = provider_name
+        if provider_id:
+            params["provider_custom_id"] = provider_id
+        return params
+
+    def _completion_params(self, content_id, completed_at, user_id, user_email):
+        params = {"content_id": content_id, "completed_at": completed_at}
+        if user_id:
+            params["user_id"] = user_id
+        else:
+            if user_email:
+                params["user_email"] = user_email
+            else:
+                raise ValueError("user_email or user_id required")
+        return params
+
+    def _to_content_comment(self, data):
+        data["user"] = User(**data["user"])
+        if "content" in data:
+            data["content"] = Content(**data["content"])
+        return ContentComment(**data)
+
+    def _to_content(self, data):
+        if "provider" in data:
+            data["provider"] = ContentProvider(**data["provider"])
+        return Content(**data)
+
+    def _to_user_content(self, data):
+        data["user"] = User(**data["user"])
+        data["content"] = Content(**data["content"])
+        data["content"].provider = ContentProvider(**data["content"].provider)
+        return UserContent(**data)
+
+
+class ContentClient(BaseContentClient):
+    """ Content API. """
+
+    def all(self, from_page=None, query=None, filter=None, per_page=None, raw=False):
         """
         Get all content.
 
@@ -41,13 +169,52 @@ class ContentClient(object):
         :param filter: Additional type filter, e.g. "shared", "official", "pathgather"
         :type  filter: ``str``
 
+        :param per_page: Results per page, up to
+            :attr:`pathgather.client.PathgatherClient.MAX_RESULTS_PER_PAGE`
+        :type  per_page: ``int``
+
+        :param raw: Return the decoded ``dict`` records, without building models
+        :type  raw: ``bool``
+
         :return: A list of content
         :rtype: ``list`` of :class:`pathgather.models.content.Content`
         """
+        return list(self.iter_all(
+            from_page=from_page, query=query, filter=filter, per_page=per_page, raw=raw
+        ))
+
+    def iter_all(
+        self, from_page=None, query=None, filter=None, per_page=None, raw=False
+    ):
+        """
+        Iterate all content, fetching each page only when it is needed
+
+        :param from_page: Get from page
+        :type  from_page: ``str``
+
+        :param query: Additional filter query
+            (see https://docs.pathgather.com/docs/filtering)
+        :type  query: ``dict``
+
+        :param filter: Additional type filter, e.g. "shared", "official", "pathgather"
+        :type  filter: ``str``
+
+        :param per_page: Results per page, up to
+            :attr:`pathgather.client.PathgatherClient.MAX_RESULTS_PER_PAGE`
+        :type  per_page: ``int``
+
+        :param raw: Return the decoded ``dict`` records, without building models
+        :type  raw: ``bool``
+
+        :return: A generator of content
+        :rtype: ``generator`` of :class:`pathgather.models.content.Content`
+        """
         params = {}
 
         if from_page is not None:
             params["from"] = from_page
+        if per_page is not None:
+            params["per_page"] = per_page
 
         if not query and not filter:
             content = self.client.get_paged("content", params=params)
@@ -57,15 +224,126 @@ class ContentClient(object):
                 extra["q"] = query
             if filter:
                 extra["filter"] = filter
-            data = json.dumps(extra)
+            data = self.client.json_codec.encode(extra)
             content = self.client.get_paged("content", params=params, data=data)
 
-        results = []
         for page in content:
-            results.extend([self._to_content(i) for i in page["results"]])
-        return results
+            for i in page["results"]:
+                yield i if raw else self._to_content(i)
+
+    def sync_since(self, watermark=None, query=None, per_page=None):
+        """
+        Fetch the content updated since the last sync
+
+        :param watermark: The ``watermark`` of the previous sync, ``None``
+            fetches every content item
+        :type  watermark: :class:`arrow.Arrow`, ``datetime`` or ISO-8601 ``str``
+
+        :param query: Additional filter query
+        :type  query: ``dict``
+
+        :param per_page: Results per page
+        :type  per_page: ``int``
+
+        :return: The changed content and the new watermark
+        :rtype: :class:`pathgather.sync.SyncResult`
+        """
+        return sync_since(
+            self.client,
+            "content",
+            self._to_content,
+            watermark=watermark,
+            query=query,
+            per_page=per_page,
+        )
+
+    def to_columns(self, query=None, filter=None, fields=None, per_page=None):
+        """
+        Export all content as columns, without building a model for each record.
+        Nested objects become dotted columns, e.g. ``user.email``.
+
+        :param query: Additional filter query
+            (see https://docs.pathgather.com/docs/filtering)
+        :type  query: ``dict``
+
+        :param filter: Additional type filter, e.g. "shared", "official", "pathgather"
+        :type  filter: ``str``
+
+        :param fields: The columns to keep, ``None`` keeps every column
+        :type  fields: ``list`` of ``str``
+
+        :param per_page: Results per page, defaults to the maximum
+        :type  per_page: ``int``
+
+        :return: One list per column
+        :rtype: ``OrderedDict`` of ``str`` to ``list``
+        """
+        records = iter_records(
+            self.client,
+            "content",
+            query=query,
+            filter=filter,
+            per_page=per_page,
+        )
+        return to_columns(records, fields)
+
+    def to_dataframe(
+        self, query=None, filter=None, fields=None, per_page=None, parse_dates=True
+    ):
+        """
+        Export all content as a :class:`pandas.DataFrame`, without building a model
+        for each record. Requires ``pandas``.
+
+        :param query: Additional filter query
+            (see https://docs.pathgather.com/docs/filtering)
+        :type  query: ``dict``
+
+        :param filter: Additional type filter, e.g. "shared", "official", "pathgather"
+        :type  filter: ``str``
+
+        :param fields: The columns to keep, ``None`` keeps every column
+        :type  fields: ``list`` of ``str``
+
+        :param per_page: Results per page, defaults to the maximum
+        :type  per_page: ``int``
+
+        :param parse_dates: Convert the ``*_at`` and ``*_date`` columns to
+            timestamps
+        :type  parse_dates: ``bool``
+
+        :rtype: :class:`pandas.DataFrame`
+        """
+        columns = self.to_columns(
+            query=query, filter=filter, fields=fields, per_page=per_page
+        )
+        return to_dataframe(columns, parse_dates=parse_dates)
 
-    def get(self, id):
+    def to_arrow(self, query=None, filter=None, fields=None, per_page=None):
+        """
+        Export all content as a :class:`pyarrow.Table`, without building a model
+        for each record. Requires ``pyarrow``.
+
+        :param query: Additional filter query
+            (see https://docs.pathgather.com/docs/filtering)
+        :type  query: ``dict``
+
+        :param filter: Additional type filter, e.g. "shared", "official", "pathgather"
+        :type  filter: ``str``
+
+        :param fields: The columns to keep, ``None`` keeps every column
+        :type  fields: ``list`` of ``str``
+
+        :param per_page: Results per page, defaults to the maximum
+        :type  per_page: ``int``
+
+        :rtype: :class:`pyarrow.Table`
+        """
+        columns = self.to_columns(
+            query=query, filter=filter, fields=fields, per_page=per_page
+        )
+        return to_arrow(columns)
+
+    def get(self, id, raw=False):
         """
         Fetch a piece of content by ID.
 
@@ -74,11 +352,21 @@ class ContentClient(object):
          or a custom ID you assigned to the content.
         :type  id: ``str``
 
+        :param raw: Return the decoded ``dict``, without building a model
+        :type  raw: ``bool``
+
         :return: A piece of content
         :rtype: :class:`pathgather.models.content.Content`
         """
-        user = self.client.get("content/{0}".format(id))
-        return self._to_content(user)
+        if raw:
+            return self.client.get("content/{0}".format(id))
+        cache = self.client.entity_cache
+        content = cache.get("content", id) if cache is not None else None
+        if content is None:
+            content = self._to_content(self.client.get("content/{0}".format(id)))
+            if cache is not None:
+                cache.set("content", id, content)
+        return content
 
     def create(
         self,
@@ -161,38 +449,50 @@ class ContentClient(object):
         :return: A piece of content
         :rtype: :class:`pathgather.models.content.Content`
         """
-        params = {
-            "name": name,
-            "content_type": content_type,
-            "source_url": source_url,
-            "topic_name": topic_name,
-            "enabled": enabled,
-        }
-        if level:
-            params["level"] = level
-        if custom_id:
-            params["custom_id"] = custom_id
-        if description:
-            params["description"] = description
-        if image:
-            params["image"] = image
-        if tags:
-            params["tags"] = tags
-        if skills:
-            params["skills"] = skills
-        if duration:
-            params["duration_str"] = duration
-        if provider_name:
-            params["provider_name"] = provider_name
-        else:
-            if provider_id:
-                params["provider_custom_id"] = provider_id
-            else:
-                raise ValueError("provider_name or provider_id required")
+        params = self._create_params(
+            name,
+            content_type,
+            source_url,
+            topic_name,
+            provider_name,
+            provider_id,
+            level,
+            custom_id,
+            description,
+            image,
+            tags,
+            enabled,
+            skills,
+            duration,
+        )
 
         content = self.client.post("content", {"content": params})
         return self._to_content(content)
 
+    def bulk_create(self, items, max_workers=8, rate_limiter=None):
+        """
+        Create many pieces of content concurrently.
+
+        :param items: Keyword arguments for :meth:`create`, one ``dict`` per
+            piece of content
+        :type  items: ``iterable`` of ``dict``
+
+        :param max_workers: Number of requests to send at once
+        :type  max_workers: ``int``
+
+        :param rate_limiter: Send the requests within this limiter's rate, in
+            addition to the client's :attr:`rate_limiter`. Without either, the
+            ``max_workers`` threads are not throttled
+        :type  rate_limiter: :class:`pathgather.ratelimit.RateLimiter`
+
+        :return: A report with one result per item, in input order. A failed
+            item has its exception in ``error`` rather than stopping the others.
+        :rtype: :class:`pathgather.bulk.BulkReport`
+        """
+        return run_bulk(
+            lambda item: self.create(**item), items, max_workers, rate_limiter
+        )
+
     def update(
         self,
         id,
@@ -278,37 +578,26 @@ class ContentClient(object):
         :return: A piece of content
         :rtype: :class:`pathgather.models.content.Content`
         """
-        params = {}
-        if name:
-            params["name"] = name
-        if content_type:
-            params["content_type"] = content_type
-        if source_url:
-            params["source_url"] = source_url
-        if topic_name:
-            params["topic_name"] = topic_name
-        if enabled is not None:
-            params["enabled"] = enabled
-        if level:
-            params["level"] = level
-        if custom_id:
-            params["custom_id"] = custom_id
-        if description:
-            params["description"] = description
-        if image:
-            params["image"] = image
-        if tags:
-            params["tags"] = tags
-        if skills:
-            params["skills"] = skills
-        if duration:
-            params["duration_str"] = duration
-        if provider_name:
-            params["provider_name"] = provider_name
-        if provider_id:
-            params["provider_custom_id"] = provider_id
+        params = self._update_params(
+            name,
+            content_type,
+            source_url,
+            topic_name,
+            provider_name,
+            provider_id,
+            level,
+            custom_id,
+            description,
+            image,
+            tags,
+            enabled,
+            skills,
+            duration,
+        )
 
         content = self.client.put("content/{0}".format(id), {"content": params})
+        if self.client.entity_cache is not None:
+            self.client.entity_cache.invalidate("content", id)
         return self._to_content(content)
 
     def delete(self, id):
@@ -319,8 +608,12 @@ class ContentClient(object):
         :type  id: ``str``
         """
         self.client.delete("content/{0}".format(id))
+        if self.client.entity_cache is not None:
+            self.client.entity_cache.invalidate("content", id)
 
-    def starts_and_completions(self, from_page=None, query=None):
+    def starts_and_completions(
+        self, from_page=None, query=None, per_page=None, raw=False
+    ):
         """
         Returns objects representing a user's interaction
         (starts and completions) with content.
@@ -330,21 +623,206 @@ class ContentClient(object):
         :param from_page: Get from page
         :type  from_page: ``str``
 
+        :param per_page: Results per page, up to
+            :attr:`pathgather.client.PathgatherClient.MAX_RESULTS_PER_PAGE`
+        :type  per_page: ``int``
+
+        :param raw: Return the decoded ``dict`` records, without building models
+        :type  raw: ``bool``
+
         :return: A list of content starts and completions
         :rtype: ``list`` of :class:`pathgather.models.content.UserContent`
         """
+        return list(self.iter_starts_and_completions(
+            from_page=from_page, query=query, per_page=per_page, raw=raw
+        ))
+
+    def iter_starts_and_completions(
+        self, from_page=None, query=None, per_page=None, raw=False
+    ):
+        """
+        Iterate objects representing a user's interaction
+        (starts and completions) with content, fetching each page
+        only when it is needed.
+
+        :param from_page: Get from page
+        :type  from_page: ``str``
+
+        :param per_page: Results per page, up to
+            :attr:`pathgather.client.PathgatherClient.MAX_RESULTS_PER_PAGE`
+        :type  per_page: ``int``
+
+        :param raw: Return the decoded ``dict`` records, without building models
+        :type  raw: ``bool``
+
+        :return: A generator of content starts and completions
+        :rtype: ``generator`` of :class:`pathgather.models.content.UserContent`
+        """
         params = {}
 
         if from_page is not None:
             params["from"] = from_page
+        if per_page is not None:
+            params["per_page"] = per_page
         data = None
         if query:
-            data = json.dumps({'q': query})
+            data = self.client.json_codec.encode({'q': query})
         content = self.client.get_paged("user_content", params=params, data=data)
-        results = []
         for page in content:
-            results.extend([self._to_user_content(i) for i in page["results"]])
-        return results
+            for i in page["results"]:
+                yield i if raw else self._to_user_content(i)
+
+    def iter_starts_and_completions_sharded(
+        self,
+        start,
+        end=None,
+        shards=8,
+        field="created_at",
+        query=None,
+        per_page=None,
+    ):
+        """
+        Iterate all starts and completions by splitting them into ``shards``
+        windows of ``field`` and fetching the windows in parallel. Results
+        arrive in no particular order, each one once.
+
+        :param start: Start of the range, e.g. when the tenant was created
+        :type  start: :class:`arrow.Arrow`, ``datetime`` or ISO-8601 ``str``
+
+        :param end: End of the range, defaults to open-ended
+        :type  end: :class:`arrow.Arrow`, ``datetime`` or ISO-8601 ``str``
+
+        :param shards: Number of time windows fetched in parallel
+        :type  shards: ``int``
+
+        :param field: The timestamp to split on, "created_at" or "updated_at"
+        :type  field: ``str``
+
+        :param query: Additional filter query, must not filter on ``field``
+        :type  query: ``dict``
+
+        :param per_page: Results per page
+        :type  per_page: ``int``
+
+        :return: A generator of content starts and completions
+        :rtype: ``generator`` of :class:`pathgather.models.content.UserContent`
+        """
+        records = iter_sharded(
+            self.client,
+            "user_content",
+            start,
+            end=end,
+            shards=shards,
+            field=field,
+            query=query,
+            per_page=per_page,
+        )
+        for i in records:
+            yield self._to_user_content(i)
+
+    def sync_starts_and_completions_since(
+        self, watermark=None, query=None, per_page=None
+    ):
+        """
+        Fetch the starts and completions updated since the last sync
+
+        :param watermark: The ``watermark`` of the previous sync, ``None``
+            fetches every start and completion
+        :type  watermark: :class:`arrow.Arrow`, ``datetime`` or ISO-8601 ``str``
+
+        :param query: Additional filter query
+        :type  query: ``dict``
+
+        :param per_page: Results per page
+        :type  per_page: ``int``
+
+        :return: The changed starts and completions and the new watermark
+        :rtype: :class:`pathgather.sync.SyncResult`
+        """
+        return sync_since(
+            self.client,
+            "user_content",
+            self._to_user_content,
+            watermark=watermark,
+            query=query,
+            per_page=per_page,
+        )
+
+    def starts_and_completions_to_columns(self, query=None, fields=None, per_page=None):
+        """
+        Export all starts and completions as columns, without building a model
+        for each record. Nested objects become dotted columns, e.g. ``user.email``.
+
+        :param query: Additional filter query
+            (see https://docs.pathgather.com/docs/filtering)
+        :type  query: ``dict``
+
+        :param fields: The columns to keep, ``None`` keeps every column
+        :type  fields: ``list`` of ``str``
+
+        :param per_page: Results per page, defaults to the maximum
+        :type  per_page: ``int``
+
+        :return: One list per column
+        :rtype: ``OrderedDict`` of ``str`` to ``list``
+        """
+        records = iter_records(
+            self.client,
+            "user_content",
+            query=query,
+            per_page=per_page,
+        )
+        return to_columns(records, fields)
+
+    def starts_and_completions_to_dataframe(
+        self, query=None, fields=None, per_page=None, parse_dates=True
+    ):
+        """
+        Export all starts and completions as a :class:`pandas.DataFrame`,
+        without building a model for each record. Requires ``pandas``.
+
+        :param query: Additional filter query
+            (see https://docs.pathgather.com/docs/filtering)
+        :type  query: ``dict``
+
+        :param fields: The columns to keep, ``None`` keeps every column
+        :type  fields: ``list`` of ``str``
+
+        :param per_page: Results per page, defaults to the maximum
+        :type  per_page: ``int``
+
+        :param parse_dates: Convert the ``*_at`` and ``*_date`` columns to
+            timestamps
+        :type  parse_dates: ``bool``
+
+        :rtype: :class:`pandas.DataFrame`
+        """
+        columns = self.starts_and_completions_to_columns(
+            query=query, fields=fields, per_page=per_page
+        )
+        return to_dataframe(columns, parse_dates=parse_dates)
+
+    def starts_and_completions_to_arrow(self, query=None, fields=None, per_page=None):
+        """
+        Export all starts and completions as a :class:`pyarrow.Table`,
+        without building a model for each record. Requires ``pyarrow``.
+
+        :param query: Additional filter query
+            (see https://docs.pathgather.com/docs/filtering)
+        :type  query: ``dict``
+
+        :param fields: The columns to keep, ``None`` keeps every column
+        :type  fields: ``list`` of ``str``
+
+        :param per_page: Results per page, defaults to the maximum
+        :type  per_page: ``int``
+
+        :rtype: :class:`pyarrow.Table`
+        """
+        columns = self.starts_and_completions_to_columns(
+            query=query, fields=fields, per_page=per_page
+        )
+        return to_arrow(columns)
 
     def log_completion(
         self, content_id, completed_at="now", user_id=None, user_email=None
@@ -371,19 +849,63 @@ class ContentClient(object):
         :return: A registration of user content completion
         :rtype: :class:`pathgather.models.content.UserContent`
         """
-        params = {"content_id": content_id, "completed_at": completed_at}
-        if user_id:
-            params["user_id"] = user_id
-        else:
-            if user_email:
-                params["user_email"] = user_email
-            else:
-                raise ValueError("user_email or user_id required")
+        params = self._completion_params(
+            content_id, completed_at, user_id, user_email
+        )
 
         content = self.client.post("user_content", params)
         return self._to_user_content(content)
 
-    def get_comments(self, id, from_page=None, query=None):
+    def log_completions(self, events, max_workers=8, rate_limiter=None):
+        """
+        Log many completions concurrently, e.g. when syncing learning activity
+        from another system. Repeated events (same content, user and
+        completion time) are only sent once.
+
+        Requests are sent within the client's rate limit, if it has a
+        :class:`pathgather.ratelimit.RateLimiter`, and within ``rate_limiter``.
+        Without either, the ``max_workers`` threads are not throttled.
+
+        :param events: Keyword arguments for :meth:`log_completion`, one
+            ``dict`` per event. May be a generator.
+        :type  events: ``iterable`` of ``dict``
+
+        :param max_workers: Number of requests to send at once
+        :type  max_workers: ``int``
+
+        :param rate_limiter: Send the requests within this limiter's rate
+        :type  rate_limiter: :class:`pathgather.ratelimit.RateLimiter`
+
+        :return: A report with the outcome of each unique event, in input order,
+            the duplicate events in ``skipped`` and the ``throughput``
+        :rtype: :class:`pathgather.bulk.BulkReport`
+        """
+        seen = set()
+        skipped = []
+
+        def unique():
+            for event in events:
+                key = (
+                    event.get("content_id"),
+                    event.get("user_id") or event.get("user_email"),
+                    event.get("completed_at", "now"),
+                )
+                if key in seen:
+                    skipped.append(event)
+                    continue
+                seen.add(key)
+                yield event
+
+        report = run_bulk(
+            lambda event: self.log_completion(**event),
+            unique(),
+            max_workers,
+            rate_limiter,
+        )
+        report.skipped.extend(skipped)
+        return report
+
+    def get_comments(self, id, from_page=None, query=None, per_page=None, raw=False):
         """
         Get comments on a content item
     
@@ -396,25 +918,60 @@ class ContentClient(object):
         :param query: Extra query parameters
         :param query: ``dict``
 
+        :param per_page: Results per page, up to
+            :attr:`pathgather.client.PathgatherClient.MAX_RESULTS_PER_PAGE`
+        :type  per_page: ``int``
+
+        :param raw: Return the decoded ``dict`` records, without building models
+        :type  raw: ``bool``
+
         :return: A list of content item comments
         :rtype: ``list`` of :class:`pathgather.models.content.ContentComment`
         """
+        return list(self.iter_comments(
+            id, from_page=from_page, query=query, per_page=per_page, raw=raw
+        ))
+
+    def iter_comments(self, id, from_page=None, query=None, per_page=None, raw=False):
+        """
+        Iterate comments on a content item, fetching each page only when it is needed
+
+        :param id: The content item ID
+        :type  id: ``str``
+
+        :param from_page: Get from page
+        :type  from_page: ``str``
+
+        :param query: Extra query parameters
+        :param query: ``dict``
+
+        :param per_page: Results per page, up to
+            :attr:`pathgather.client.PathgatherClient.MAX_RESULTS_PER_PAGE`
+        :type  per_page: ``int``
+
+        :param raw: Return the decoded ``dict`` records, without building models
+        :type  raw: ``bool``
+
+        :return: A generator of content item comments
+        :rtype: ``generator`` of :class:`pathgather.models.content.ContentComment`
+        """
         params = {}
 
         if from_page is not None:
             params["from"] = from_page
+        if per_page is not None:
+            params["per_page"] = per_page
 
         data = None
         if query is not None:
-            data = json.dumps({"q": query})
+            data = self.client.json_codec.encode({"q": query})
 
         content = self.client.get_paged(
             "content/{0}/comments".format(id), params=params, data=data
         )
-        results = []
         for page in content:
-            results.extend([self._to_content_comment(i) for i in page["results"]])
-        return results
+            for i in page["results"]:
+                yield i if raw else self._to_content_comment(i)
 
     def create_comment(self, id, message, user_id, custom_id=None):
         """
@@ -456,23 +1013,3 @@ class ContentClient(object):
 
         """
         return self.client.delete("content/{0}/comments/{1}".format(id, comment_id))
-
-    def _to_content_comment(self, data):
-        scrub(data)
-        data["user"] = User(**data["user"])
-        if "content" in data:
-            data["content"] = Content(**data["content"])
-        return ContentComment(**data)
-
-    def _to_content(self, data):
-        scrub(data)
-        if "provider" in data:
-            data["provider"] = ContentProvider(**data["provider"])
-        return Content(**data)
-
-    def _to_user_content(self, data):
-        scrub(data)
-        data["user"] = User(**data["user"])
-        data["content"] = Content(**data["content"])
-        data["content"].provider = ContentProvider(**data["content"].provider)
-        return UserContent(**data)
@@ -14,7 +14,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .utils import scrub
 from .models.user import User
 from .models.skill import Skill
 from .models.gathering import (
@@ -28,45 +27,155 @@ from .models.content import Content
 from .models.path import Path
 
 
-class GatheringsClient(object):
-    """ Gatherings API. """
+class BaseGatheringsClient(object):
+    """ Request building and model hydration shared by the Gatherings API clients. """
 
     def __init__(self, client):
         self.client = client
 
-    def all(self, from_page=None):
+    def _create_params(self, name, custom_id, description, closed, image, skills):
+        params = {"name": name, "closed": closed}
+        if custom_id:
+            params["custom_id"] = custom_id
+        if description:
+            params["description"] = description
+        if image:
+            params["image"] = image
+        if skills:
+            params["skills"] = skills
+        return params
+
+    def _update_params(self, name, custom_id, description, closed, image, skills):
+        params = {}
+        if name:
+            params["name"] = name
+        if closed:
+            params["closed"] = closed
+        if custom_id:
+            params["custom_id"] = custom_id
+        if description:
+            params["description"] = description
+        if image:
+            params["image"] = image
+        if skills:
+            params["skills"] = skills
+        return params
+
+    def _to_gathering(self, data):
+        if "user" in data:
+            data["user"] = User(**data["user"])
+        if "skills" in data:
+            _skills = []
+            for skill in data["skills"]:
+                _skills.append(Skill(**skill))
+            data["skills"] = _skills
+        return Gathering(**data)
+
+    def _to_user_gathering(self, data):
+        if "user" in data:
+            data["user"] = User(**data["user"])
+        if "gathering" in data:
+            data["gathering"] = Gathering(**data["gathering"])
+        return GatheringUser(**data)
+
+    def _to_content_gathering(self, data):
+        if "course" in data:
+            data["course"] = Content(**data["course"])
+        if "user" in data:
+            data["user"] = User(**data["user"])
+        if data["course"].sharer is not None:
+            data["course"].sharer = User(**data["course"].sharer)
+        return GatheringContent(**data)
+
+    def _to_path_gathering(self, data):
+        if "path" in data:
+            data["path"] = Path(**data["path"])
+        if "user" in data:
+            data["user"] = User(**data["user"])
+
+        return GatheringPath(**data)
+
+    def _to_gathering_invite(self, data):
+        if "inviter" in data:
+            data["inviter"] = User(**data["inviter"])
+        if "invitee" in data:
+            data["invitee"] = User(**data["invitee"])
+        return GatheringInvite(**data)
+
+
+class GatheringsClient(BaseGatheringsClient):
+    """ Gatherings API. """
+
+    def all(self, from_page=None, per_page=None, raw=False):
         """
         Get all gatherings (will page results out)
 
         :param from_page: Start at page
         :type  from_page: ``int``
 
+        :param per_page: Results per page, up to
+            :attr:`pathgather.client.PathgatherClient.MAX_RESULTS_PER_PAGE`
+        :type  per_page: ``int``
+
+        :param raw: Return the decoded ``dict`` records, without building models
+        :type  raw: ``bool``
+
         :return: A list of users
         :rtype: ``list`` of :class:`pathgather.models.gathering.Gathering`
         """
+        return list(self.iter_all(from_page=from_page, per_page=per_page, raw=raw))
+
+    def iter_all(self, from_page=None, per_page=None, raw=False):
+        """
+        Iterate all gatherings, fetching each page only when it is needed
+
+        :param from_page: Start at page
+        :type  from_page: ``int``
+
+        :param per_page: Results per page, up to
+            :attr:`pathgather.client.PathgatherClient.MAX_RESULTS_PER_PAGE`
+        :type  per_page: ``int``
+
+        :param raw: Return the decoded ``dict`` records, without building models
+        :type  raw: ``bool``
+
+        :return: A generator of gatherings
+        :rtype: ``generator`` of :class:`pathgather.models.gathering.Gathering`
+        """
         params = {}
 
         if from_page is not None:
             params["from"] = from_page
+        if per_page is not None:
+            params["per_page"] = per_page
 
         users = self.client.get_paged("gatherings", params=params)
-        results = []
         for page in users:
-            results.extend([self._to_gathering(i) for i in page["results"]])
-        return results
+            for i in page["results"]:
+                yield i if raw else self._to_gathering(i)
 
-    def get(self, id):
+    def get(self, id, raw=False):
         """
         Fetch a gathering by ID.
 
         :param id: The gathering id
         :type  id: ``str``
 
+        :param raw: Return the decoded ``dict``, without building a model
+        :type  raw: ``bool``
+
         :return: An instance :class:`pathgather.models.gathering.Gathering`
         :rtype: :class:`pathgather.models.gathering.Gathering`
         """
-        user = self.client.get("gatherings/{0}".format(id))
-        return self._to_gathering(user)
+        if raw:
+            return self.client.get("gatherings/{0}".format(id))
+        cache = self.client.entity_cache
+        gathering = cache.get("gatherings", id) if cache is not None else None
+        if gathering is None:
+            gathering = self._to_gathering(self.client.get("gatherings/{0}".format(id)))
+            if cache is not None:
+                cache.set("gatherings", id, gathering)
+        return gathering
 
     def create(
         self,
@@ -106,15 +215,9 @@ class GatheringsClient(object):
         :return: A gathering
         :rtype: :class:`pathgather.models.gathering.Gathering`
         """
-        params = {"name": name, "closed": closed}
-        if custom_id:
-            params["custom_id"] = custom_id
-        if description:
-            params["description"] = description
-        if image:
-            params["image"] = image
-        if skills:
-            params["skills"] = skills
+        params = self._create_params(
+            name, custom_id, description, closed, image, skills
+        )
 
         content = self.client.post("gatherings", {"gathering": params})
         return self._to_gathering(content)
@@ -161,43 +264,63 @@ class GatheringsClient(object):
         :return: A gathering
         :rtype: :class:`pathgather.models.gathering.Gathering`
         """
-        params = {}
-        if name:
-            params["name"] = name
-        if closed:
-            params["closed"] = closed
-        if custom_id:
-            params["custom_id"] = custom_id
-        if description:
-            params["description"] = description
-        if image:
-            params["image"] = image
-        if skills:
-            params["skills"] = skills
+        params = self._update_params(
+            name, custom_id, description, closed, image, skills
+        )
 
         content = self.client.put("gatherings/{0}".format(id), {"gathering": params})
+        self._invalidate(id)
         return self._to_gathering(content)
 
-    def users(self, id, from_page=None):
+    def users(self, id, from_page=None, per_page=None, raw=False):
         """
         Fetch a gathering's membership by ID.
 
         :param id: The gathering id
         :type  id: ``str``
 
+        :param per_page: Results per page, up to
+            :attr:`pathgather.client.PathgatherClient.MAX_RESULTS_PER_PAGE`
+        :type  per_page: ``int``
+
+        :param raw: Return the decoded ``dict`` records, without building models
+        :type  raw: ``bool``
+
         :return: An list of :class:`pathgather.models.gathering.UserGathering`
         :rtype: ``list`` of :class:`pathgather.models.gathering.UserGathering`
         """
+        return list(self.iter_users(
+            id, from_page=from_page, per_page=per_page, raw=raw
+        ))
+
+    def iter_users(self, id, from_page=None, per_page=None, raw=False):
+        """
+        Iterate a gathering's membership, fetching each page only when it is needed
+
+        :param id: The gathering id
+        :type  id: ``str``
+
+        :param per_page: Results per page, up to
+            :attr:`pathgather.client.PathgatherClient.MAX_RESULTS_PER_PAGE`
+        :type  per_page: ``int``
+
+        :param raw: Return the decoded ``dict`` records, without building models
+        :type  raw: ``bool``
+
+        :return: A generator of :class:`pathgather.models.gathering.UserGathering`
+        :rtype: ``generator`` of :class:`pathgather.models.gathering.UserGathering`
+        """
         params = {}
 
         if from_page is not None:
             params["from"] = from_page
+        if per_page is not None:
+            params["per_page"] = per_page
 
         users = self.client.get_paged("gatherings/{0}/users".format(id), params=params)
-        results = []
         for page in users:
-            results.extend([self._to_user_gathering(i) for i in page["results"]])
-        return results
+            for i in page["results"]:
+                yield i if raw else self._to_user_gathering(i)
 
     def invite_user(self, id, user_id):
         """
@@ -214,12 +337,8 @@ class GatheringsClient(object):
         """
         params = {"gathering_invite": {"invitee_id": user_id}}
         data = self.client.post("gatherings/{0}/gathering_invites".format(id), params)
-        scrub(data)
-        if "inviter" in data:
-            data["inviter"] = User(**data["inviter"])
-        if "invitee" in data:
-            data["invitee"] = User(**data["invitee"])
-        return GatheringInvite(**data)
+        self._invalidate(id)
+        return self._to_gathering_invite(data)
 
     def remove_user(self, id, user_id):
         """
@@ -232,29 +351,59 @@ class GatheringsClient(object):
         :type  user_id: ``str``
         """
         self.client.delete("gatherings/{0}/users/{1}".format(id, user_id))
+        self._invalidate(id)
 
-    def content(self, id, from_page=None):
+    def content(self, id, from_page=None, per_page=None, raw=False):
         """
         Fetch a gathering's content by ID.
 
         :param id: The gathering id
         :type  id: ``str``
 
+        :param per_page: Results per page, up to
+            :attr:`pathgather.client.PathgatherClient.MAX_RESULTS_PER_PAGE`
+        :type  per_page: ``int``
+
+        :param raw: Return the decoded ``dict`` records, without building models
+        :type  raw: ``bool``
+
         :return: An list of :class:`pathgather.models.gathering.GatheringUser`
         :rtype: ``list`` of :class:`pathgather.models.gathering.GatheringUser`
         """
+        return list(self.iter_content(
+            id, from_page=from_page, per_page=per_page, raw=raw
+        ))
+
+    def iter_content(self, id, from_page=None, per_page=None, raw=False):
+        """
+        Iterate a gathering's content, fetching each page only when it is needed
+
+        :param id: The gathering id
+        :type  id: ``str``
+
+        :param per_page: Results per page, up to
+            :attr:`pathgather.client.PathgatherClient.MAX_RESULTS_PER_PAGE`
+        :type  per_page: ``int``
+
+        :param raw: Return the decoded ``dict`` records, without building models
+        :type  raw: ``bool``
+
+        :return: A generator of :class:`pathgather.models.gathering.GatheringUser`
+        :rtype: ``generator`` of :class:`pathgather.models.gathering.GatheringUser`
+        """
         params = {}
 
         if from_page is not None:
             params["from"] = from_page
+        if per_page is not None:
+            params["per_page"] = per_page
 
         content = self.client.get_paged(
             "gatherings/{0}/contents".format(id), params=params
         )
-        results = []
         for page in content:
-            results.extend([self._to_content_gathering(i) for i in page["results"]])
-        return results
+            for i in page["results"]:
+                yield i if raw else self._to_content_gathering(i)
 
     def add_content(self, id, content_id):
         """
@@ -275,6 +424,7 @@ class GatheringsClient(object):
             }
         }
         content = self.client.post("gatherings/{0}/contents".format(id), params)
+        self._invalidate(id)
         return content
 
     def remove_content(self, id, content_id):
@@ -288,29 +438,59 @@ class GatheringsClient(object):
         :type  content_id: ``str``
         """
         self.client.delete("gatherings/{0}/contents/{1}".format(id, content_id))
+        self._invalidate(id)
 
-    def paths(self, id, from_page=None):
+    def paths(self, id, from_page=None, per_page=None, raw=False):
         """
         Fetch a gathering's paths by ID.
 
         :param id: The gathering id
         :type  id: ``str``
 
+        :param per_page: Results per page, up to
+            :attr:`pathgather.client.PathgatherClient.MAX_RESULTS_PER_PAGE`
+        :type  per_page: ``int``
+
+        :param raw: Return the decoded ``dict`` records, without building models
+        :type  raw: ``bool``
+
         :return: An list of :class:`pathgather.models.gathering.GatheringPath`
         :rtype: ``list`` of :class:`pathgather.models.gathering.GatheringPath`
         """
+        return list(self.iter_paths(
+            id, from_page=from_page, per_page=per_page, raw=raw
+        ))
+
+    def iter_paths(self, id, from_page=None, per_page=None, raw=False):
+        """
+        Iterate a gathering's paths, fetching each page only when it is needed
+
+        :param id: The gathering id
+        :type  id: ``str``
+
+        :param per_page: Results per page, up to
+            :attr:`pathgather.client.PathgatherClient.MAX_RESULTS_PER_PAGE`
+        :type  per_page: ``int``
+
+        :param raw: Return the decoded ``dict`` records, without building models
+        :type  raw: ``bool``
+
+        :return: A generator of :class:`pathgather.models.gathering.GatheringPath`
+        :rtype: ``generator`` of :class:`pathgather.models.gathering.GatheringPath`
+        """
         params = {}
 
         if from_page is not None:
             params["from"] = from_page
+        if per_page is not None:
+            params["per_page"] = per_page
 
         content = self.client.get_paged(
             "gatherings/{0}/paths".format(id), params=params
         )
-        results = []
         for page in content:
-            results.extend([self._to_path_gathering(i) for i in page["results"]])
-        return results
+            for i in page["results"]:
+                yield i if raw else self._to_path_gathering(i)
 
     def remove_path(self, id, path_id):
         """
@@ -323,6 +503,7 @@ class GatheringsClient(object):
         :type  path_id: ``str``
         """
         self.client.delete("gatherings/{0}/paths/{1}".format(id, path_id))
+        self._invalidate(id)
 
     def delete(self, id):
         """
@@ -332,41 +513,9 @@ class GatheringsClient(object):
         :type  id: ``str``
         """
         self.client.delete("gatherings/{0}".format(id))
+        self._invalidate(id)
 
-    def _to_gathering(self, data):
-        scrub(data)
-        if "user" in data:
-            data["user"] = User(**data["user"])
-        if "skills" in data:
-            _skills = []
-            for skill in data["skills"]:
-                _skills.append(Skill(**skill))
-            data["skills"] = _skills
-        return Gathering(**data)
-
-    def _to_user_gathering(self, data):
-        scrub(data)
-        if "user" in data:
-            data["user"] = User(**data["user"])
-        if "gathering" in data:
-            data["gathering"] = Gathering(**data["gathering"])
-        return GatheringUser(**data)
-
-    def _to_content_gathering(self, data):
-        scrub(data)
-        if "course" in data:
-            data["course"] = Content(**data["course"])
-        if "user" in data:
-            data["user"] = User(**data["user"])
-        if data["course"].sharer is not None:
-            data["course"].sharer = User(**data["course"].sharer)
-        return GatheringContent(**data)
-
-    def _to_path_gathering(self, data):
-        scrub(data)
-        if "path" in data:
-            data["path"] = Path(**data["path"])
-        if "user" in data:
-            data["user"] = User(**data["user"])
-
-        return GatheringPath(**data)
+    def _invalidate(self, id):
+        # also after membership changes, the counts are part of the gathering
+        if self.client.entity_cache is not None:
+            self.client.entity_cache.invalidate("gatherings", id)
@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+# Licensed to Anthony Shaw (anthonyshaw@apache.org) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import bisect
+import threading
+from collections import Counter, OrderedDict
+
+from attr import attrs, attrib
+
+#: Upper bounds, in seconds, of the latency histogram buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+
+def endpoint_template(uri):
+    """
+    The endpoint a request URI was made from, with the ids replaced by
+    ``{id}``, e.g. ``users/{id}/user_skills`` for ``users/123/user_skills``
+
+    :param uri: The request URI, relative to the API's base URL
+    :type  uri: ``str``
+
+    :rtype: ``str``
+    """
+    segments = uri.split("/")
+    for index in range(1, len(segments), 2):
+        segments[index] = "{id}"
+    return "/".join(segments)
+
+
+@attrs
+class RequestEvent(object):
+    """
+    A request sent by :class:`pathgather.PathgatherClient`, passed to its
+    ``before_request`` callback and, once the response has been received, to
+    its ``after_request`` callback.
+    """
+
+    method = attrib()
+    uri = attrib()
+    endpoint = attrib()
+    cursor = attrib(default=None)
+    request_bytes = attrib(default=0)
+    status_code = attrib(default=None)
+    response_bytes = attrib(default=None)
+    elapsed = attrib(default=None)
+    attempts = attrib(default=0)
+    error = attrib(default=None)
+
+    @property
+    def retries(self):
+        """
+        Number of times the request was repeated, after server errors or
+        throttling
+
+        :rtype: ``int``
+        """
+        return max(self.attempts - 1, 0)
+
+    @property
+    def failed(self):
+        """
+        Whether the request raised or was answered with an HTTP error
+
+        :rtype: ``bool``
+        """
+        return self.error is not None or (self.status_code or 0) >= 400
+
+
+class LatencyHistogram(object):
+    """
+    Counts latencies in fixed buckets, see :data:`LATENCY_BUCKETS`.
+    """
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = None
+        self.max = None
+
+    def add(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def quantile(self, q):
+        """
+        Estimate a quantile as the upper bound of the bucket it falls into,
+        at most the largest latency seen
+
+        :param q: The quantile, between 0 and 1
+        :type  q: ``float``
+
+        :rtype: ``float``
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def as_dict(self):
+        """
+        :return: ``count``, ``sum``, ``min``, ``max``, ``mean``, the estimated
+            ``p50``, ``p90`` and ``p99``, and the ``buckets``, mapping each upper
+            bound (and ``"+Inf"``) to the number of latencies up to it
+        :rtype: ``dict``
+        """
+        bounds = list(self.buckets) + ["+Inf"]
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min,
+            "max": self.max,
+            "mean": self.sum / self.count if self.count else None,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+            "buckets": OrderedDict(zip(bounds, self.counts)),
+        }
+
+
+class _Totals(object):
+    def __init__(self, buckets):
+        self.requests = 0
+        self.failures = 0
+        self.retries = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.status_codes = Counter()
+        self.latency = LatencyHistogram(buckets)
+
+    def add(self, event):
+        self.requests += 1
+        self.failures += event.failed
+        self.retries += event.retries
+        self.request_bytes += event.request_bytes or 0
+        self.response_bytes += event.response_bytes or 0
+        if event.status_code is not None:
+            self.status_codes[event.status_code] += 1
+        if event.elapsed is not None:
+            self.latency.add(event.elapsed)
+
+    def as_dict(self):
+        return {
+            "requests": self.requests,
+            "failures": self.failures,
+            "retries": self.retries,
+            "request_bytes": self.request_bytes,
+            "response_bytes": self.response_bytes,
+            "status_codes": dict(self.status_codes),
+            "latency": self.latency.as_dict(),
+        }
+
+
+class RequestMetrics(object):
+    """
+    Request counters and latency histograms of a client, in total and per
+    endpoint. Safe to share between threads, and between clients.
+    """
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        """
+        :param buckets: Upper bounds of the latency histogram buckets, in seconds
+        :type  buckets: ``tuple`` of ``float``
+        """
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._total = _Totals(buckets)
+        self._endpoints = {}
+
+    def reset(self):
+        """
+        Clear all counters and histograms
+        """
+        self.stats(reset=True)
+
+    def record(self, event):
+        """
+        Count a completed request
+
+        :param event: The request
+        :type  event: :class:`RequestEvent`
+        """
+        key = "{0} {1}".format(event.method, event.endpoint)
+        with self._lock:
+            self._total.add(event)
+            endpoint = self._endpoints.get(key)
+            if endpoint is None:
+                endpoint = self._endpoints[key] = _Totals(self.buckets)
+            endpoint.add(event)
+
+    def stats(self, reset=False):
+        """
+        A snapshot of the counters
+
+        :param reset: Clear the counters, in the same step as taking the snapshot
+        :type  reset: ``bool``
+
+        :return: ``requests``, ``failures`` (HTTP errors and exceptions),
+            ``retries``, ``request_bytes``, ``response_bytes``,
+            ``status_codes`` and the ``latency`` histogram, see
+            :meth:`LatencyHistogram.as_dict`, of all requests, and the same
+            for each endpoint, keyed by method and endpoint template (e.g.
+            ``"GET users/{id}"``), in ``endpoints``
+        :rtype: ``dict``
+        """
+        with self._lock:
+            stats = self._total.as_dict()
+            stats["endpoints"] = {
+                key: endpoint.as_dict() for key, endpoint in self._endpoints.items()
+            }
+            if reset:
+                self._total = _Totals(self.buckets)
+                self._endpoints = {}
+        return stats
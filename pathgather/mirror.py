@@ -0,0 +1,337 @@
+# -*- coding: utf-8 -*-
+# Licensed to Anthony Shaw (anthonyshaw@apache.org) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import logging
+import re
+import sqlite3
+import threading
+import time
+
+import arrow
+
+from .sync import sync_since
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS mirror_records (
+    host TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    id TEXT NOT NULL,
+    body TEXT NOT NULL,
+    PRIMARY KEY (host, kind, id)
+);
+CREATE TABLE IF NOT EXISTS mirror_state (
+    host TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    watermark TEXT,
+    synced_at REAL NOT NULL,
+    PRIMARY KEY (host, kind)
+);
+"""
+
+
+#: query operator -> SQL operator, the operators of the API's ``q`` filters
+_OPERATORS = {"eq": "=", "ne": "!=", "gt": ">", "gte": ">=", "lt": "<", "lte": "<="}
+_FIELD = re.compile(r"^\w+(\.\w+)*$")
+
+
+def _identity(record):
+    return record
+
+
+def _condition(field, value):
+    """
+    An SQL condition on a field of the stored JSON, and its parameters
+    """
+    if not _FIELD.match(field):
+        raise ValueError("Invalid field {0!r}".format(field))
+    column = "json_extract(body, ?)"
+    path = "$." + field
+    conditions = []
+    params = []
+    operators = value if isinstance(value, dict) else {"eq": value}
+    for operator, operand in sorted(operators.items()):
+        if operator == "in":
+            operand = list(operand)
+            conditions.append(
+                "{0} IN ({1})".format(column, ", ".join("?" * len(operand)))
+            )
+            params.extend([path] + operand)
+        elif operator in ("eq", "ne") and operand is None:
+            null = "IS NULL" if operator == "eq" else "IS NOT NULL"
+            conditions.append("{0} {1}".format(column, null))
+            params.append(path)
+        elif operator in _OPERATORS:
+            conditions.append("{0} {1} ?".format(column, _OPERATORS[operator]))
+            params.extend([path, operand])
+        else:
+            raise ValueError("Unsupported operator {0!r}".format(operator))
+    return conditions, params
+
+
+class Mirror(object):
+    """
+    A local, queryable copy of a tenant in a SQLite database, for services
+    that only read Pathgather data and should not call the API on every
+    request.
+
+    :meth:`load` copies every collection, :meth:`sync` then fetches only the
+    users, content and paths updated since the last sync (the smaller
+    gatherings, skills and providers collections are copied again). Records
+    deleted in Pathgather are only removed by :meth:`load`. Reads, including
+    filtered :meth:`query` reads, are served from the database and never call
+    the API. Safe to share between threads.
+    """
+
+    #: collection name -> (collection URI, sub-client, model builder, delta)
+    KINDS = {
+        "users": ("users", "users", "_to_user", True),
+        "content": ("content", "content", "_to_content", True),
+        "paths": ("paths", "paths", "_to_path", True),
+        "gatherings": ("gatherings", "gatherings", "_to_gathering", False),
+        "skills": ("skills", "skills", "_to_skill", False),
+        "providers": ("providers", "providers", "_to_provider", False),
+    }
+
+    def __init__(self, client, path):
+        """
+        :param client: The API client to copy the tenant with
+        :type  client: :class:`pathgather.PathgatherClient`
+
+        :param path: The SQLite database file, created if missing
+        :type  path: ``str``
+        """
+        self.client = client
+        self.host = client.base_url
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._db:
+            self._db.executescript(_SCHEMA)
+        self._stop = None
+        self._worker = None
+
+    def close(self):
+        """
+        Stop background syncing and close the database
+        """
+        self.stop()
+        with self._lock:
+            self._db.close()
+
+    def load(self, kinds=None):
+        """
+        Copy collections from the API, replacing the local copies
+
+        :param kinds: Names from :attr:`KINDS`, ``None`` for all of them
+        :type  kinds: ``list`` of ``str``
+        """
+        for kind in kinds or list(self.KINDS):
+            self._copy(kind, None)
+
+    def sync(self, kinds=None):
+        """
+        Bring collections up to date. A collection that was never loaded is
+        loaded in full.
+
+        :param kinds: Names from :attr:`KINDS`, ``None`` for all of them
+        :type  kinds: ``list`` of ``str``
+        """
+        for kind in kinds or list(self.KINDS):
+            state = self._state(kind)
+            if state is None or not self.KINDS[kind][3]:
+                self._copy(kind, None)
+            else:
+                self._copy(kind, state[0] or None)
+
+    def start(self, interval=300):
+        """
+        Call :meth:`sync` every ``interval`` seconds on a background thread.
+        Failed syncs are logged and retried at the next interval.
+
+        :param interval: Seconds between syncs
+        :type  interval: ``float``
+        """
+        if self._worker is not None:
+            return
+        stop = threading.Event()
+
+        def run():
+            while not stop.wait(interval):
+                try:
+                    self.sync()
+                except Exception:
+                    logger.exception("Mirror sync failed")
+
+        self._stop = stop
+        self._worker = threading.Thread(target=run, name="pathgather-mirror")
+        self._worker.daemon = True
+        self._worker.start()
+
+    def stop(self):
+        """
+        Stop background syncing
+        """
+        if self._worker is None:
+            return
+        self._stop.set()
+        self._worker.join()
+        self._stop = self._worker = None
+
+    def get(self, kind, id):
+        """
+        Get a record by ID
+
+        :param kind: One of :attr:`KINDS`, e.g. ``"users"``
+        :type  kind: ``str``
+
+        :param id: The record ID
+        :type  id: ``str``
+
+        :return: The model, ``None`` if it is not in the mirror
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT body FROM mirror_records WHERE host = ? AND kind = ? "
+                "AND id = ?",
+                (self.host, kind, id),
+            ).fetchone()
+        return self._build(kind, row[0]) if row else None
+
+    def all(self, kind):
+        """
+        Get every record of a collection
+
+        :param kind: One of :attr:`KINDS`, e.g. ``"users"``
+        :type  kind: ``str``
+
+        :rtype: ``list``
+        """
+        with self._lock:
+            bodies = [
+                row[0]
+                for row in self._db.execute(
+                    "SELECT body FROM mirror_records WHERE host = ? AND kind = ? "
+                    "ORDER BY rowid",
+                    (self.host, kind),
+                )
+            ]
+        return [self._build(kind, body) for body in bodies]
+
+    def query(self, kind, where=None, limit=None):
+        """
+        Get the records of a collection matching a filter. The filter runs in
+        SQLite, on the stored JSON, so only matching records are built.
+
+        :param kind: One of :attr:`KINDS`, e.g. ``"users"``
+        :type  kind: ``str``
+
+        :param where: Field -> value the field must equal, or ``dict`` of
+            operators (``eq``, ``ne``, ``gt``, ``gte``, ``lt``, ``lte``,
+            ``in``) to operands, like the API's filters. Nested fields are
+            dotted, e.g. ``{"department.name": "Sales"}``. Timestamps are
+            compared as ISO-8601 strings.
+        :type  where: ``dict``
+
+        :param limit: Return at most this many records
+        :type  limit: ``int``
+
+        :rtype: ``list``
+        """
+        sql = "SELECT body FROM mirror_records WHERE host = ? AND kind = ?"
+        params = [self.host, kind]
+        for field, value in sorted((where or {}).items()):
+            conditions, condition_params = _condition(field, value)
+            for condition in conditions:
+                sql += " AND " + condition
+            params.extend(condition_params)
+        sql += " ORDER BY rowid"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            bodies = [row[0] for row in self._db.execute(sql, params)]
+        return [self._build(kind, body) for body in bodies]
+
+    def count(self, kind):
+        """
+        Number of records in a collection
+
+        :param kind: One of :attr:`KINDS`, e.g. ``"users"``
+        :type  kind: ``str``
+
+        :rtype: ``int``
+        """
+        with self._lock:
+            return self._db.execute(
+                "SELECT COUNT(*) FROM mirror_records WHERE host = ? AND kind = ?",
+                (self.host, kind),
+            ).fetchone()[0]
+
+    def synced_at(self, kind):
+        """
+        When a collection was last loaded or synced
+
+        :param kind: One of :attr:`KINDS`, e.g. ``"users"``
+        :type  kind: ``str``
+
+        :return: The sync time, ``None`` if it has never been loaded
+        :rtype: :class:`arrow.Arrow`
+        """
+        state = self._state(kind)
+        return arrow.get(state[1]) if state is not None else None
+
+    def _copy(self, kind, watermark):
+        uri = self.KINDS[kind][0]
+        result = sync_since(
+            self.client,
+            uri,
+            _identity,
+            watermark=watermark,
+            per_page=self.client.MAX_RESULTS_PER_PAGE,
+        )
+        dumps = self.client.json_codec.dumps
+        rows = [
+            (self.host, kind, record["id"], dumps(record)) for record in result.records
+        ]
+        new_watermark = result.watermark.isoformat() if result.watermark else None
+        with self._lock, self._db:
+            if watermark is None:
+                self._db.execute(
+                    "DELETE FROM mirror_records WHERE host = ? AND kind = ?",
+                    (self.host, kind),
+                )
+            self._db.executemany(
+                "INSERT OR REPLACE INTO mirror_records VALUES (?, ?, ?, ?)", rows
+            )
+            self._db.execute(
+                "INSERT OR REPLACE INTO mirror_state VALUES (?, ?, ?, ?)",
+                (self.host, kind, new_watermark, time.time()),
+            )
+
+    def _state(self, kind):
+        with self._lock:
+            return self._db.execute(
+                "SELECT watermark, synced_at FROM mirror_state "
+                "WHERE host = ? AND kind = ?",
+                (self.host, kind),
+            ).fetchone()
+
+    def _build(self, kind, body):
+        _, sub_client, builder = self.KINDS[kind][:3]
+        record = self.client.json_codec.decode(body)
+        return getattr(getattr(self.client, sub_client), builder)(record)
@@ -14,12 +14,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import arrow
 from attr import attrs, attrib
 import attr
 
+from ..utils import parse_timestamp
 
-@attrs
+_timestamp = attr.converters.optional(parse_timestamp)
+
+
+@attrs(slots=True)
 class Content(object):
     id = attrib()
     name = attrib()
@@ -27,7 +30,7 @@ class Content(object):
     source_url = attrib()
     enabled = attrib()
 
-    created_at = attr.ib(converter=attr.converters.optional(arrow.get), default=None)
+    created_at = attr.ib(converter=_timestamp, default=None)
     description = attrib(default="")
     instructor = attrib(default=None)
     skills = attrib(default=None)
@@ -36,12 +39,12 @@ class Content(object):
     reviews_count = attrib(default=0)
     level = attrib(default=None)
     duration = attrib(default=None)
-    updated_at = attr.ib(converter=attr.converters.optional(arrow.get), default=None)
+    updated_at = attr.ib(converter=_timestamp, default=None)
     provider = attrib(default=None)
     topic = attrib(default=None)
     custom_id = attrib(default=None)
-    start_date = attr.ib(converter=attr.converters.optional(arrow.get), default=None)
-    end_date = attr.ib(converter=attr.converters.optional(arrow.get), default=None)
+    start_date = attr.ib(converter=_timestamp, default=None)
+    end_date = attr.ib(converter=_timestamp, default=None)
     deactivated = attrib(default=False)
     sharer_id = attrib(default=None)
     publicly_accessible = attrib(default=True)
@@ -49,43 +52,43 @@ class Content(object):
     sharer = attrib(default=None)
 
 
-@attrs
+@attrs(slots=True)
 class ContentProvider(object):
     id = attrib()
     name = attrib()
 
-    created_at = attr.ib(converter=attr.converters.optional(arrow.get), default=None)
-    updated_at = attr.ib(converter=attr.converters.optional(arrow.get), default=None)
+    created_at = attr.ib(converter=_timestamp, default=None)
+    updated_at = attr.ib(converter=_timestamp, default=None)
     may_require_vpn = attrib(default=False)
     may_not_be_mobile_friendly = attrib(default=False)
     is_subscribed = attrib(default=True)
     custom_id = attrib(default=None)
 
 
-@attrs
+@attrs(slots=True)
 class UserContent(object):
     id = attrib()
     public = attrib(default=False)
-    started_at = attr.ib(converter=attr.converters.optional(arrow.get), default=None)
-    completed_at = attr.ib(converter=attr.converters.optional(arrow.get), default=None)
+    started_at = attr.ib(converter=_timestamp, default=None)
+    completed_at = attr.ib(converter=_timestamp, default=None)
     user = attrib(default=None)
     content = attrib(default=None)
-    created_at = attr.ib(converter=attr.converters.optional(arrow.get), default=None)
-    updated_at = attr.ib(converter=attr.converters.optional(arrow.get), default=None)
+    created_at = attr.ib(converter=_timestamp, default=None)
+    updated_at = attr.ib(converter=_timestamp, default=None)
     first_launched_at = attr.ib(
-        converter=attr.converters.optional(arrow.get), default=None
+        converter=_timestamp, default=None
     )
     last_launched_at = attr.ib(
-        converter=attr.converters.optional(arrow.get), default=None
+        converter=_timestamp, default=None
     )
-    saved_at = attr.ib(converter=attr.converters.optional(arrow.get), default=None)
+    saved_at = attr.ib(converter=_timestamp, default=None)
 
 
-@attr.s
+@attr.s(slots=True)
 class ContentComment(object):
     id = attrib()
-    created_at = attr.ib(converter=attr.converters.optional(arrow.get), default=None)
-    updated_at = attr.ib(converter=attr.converters.optional(arrow.get), default=None)
+    created_at = attr.ib(converter=_timestamp, default=None)
+    updated_at = attr.ib(converter=_timestamp, default=None)
     message = attr.ib(default=None)
     content = attr.ib(default=None)
     conversation = attr.ib(default=None)
@@ -17,7 +17,7 @@
 from attr import attrs, attrib
 
 
-@attrs
+@attrs(slots=True)
 class Department(object):
     id = attrib()
     name = attrib()
@@ -17,7 +17,7 @@
 from attr import attrs, attrib
 
 
-@attrs
+@attrs(slots=True)
 class Gathering(object):
     id = attrib()
     name = attrib()
@@ -35,7 +35,7 @@ class Gathering(object):
     skills = attrib(default=None)
 
 
-@attrs
+@attrs(slots=True)
 class GatheringInvite(object):
     id = attrib()
     created_at = attrib(default=None)
@@ -43,7 +43,7 @@ class GatheringInvite(object):
     invitee = attrib(default=None)
 
 
-@attrs
+@attrs(slots=True)
 class GatheringUser(object):
     id = attrib()
     created_at = attrib()
@@ -53,7 +53,7 @@ class GatheringUser(object):
     auto_assigned = attrib()
 
 
-@attrs
+@attrs(slots=True)
 class GatheringContent(object):
     id = attrib()
     created_at = attrib()
@@ -61,7 +61,7 @@ class GatheringContent(object):
     course = attrib()
 
 
-@attrs
+@attrs(slots=True)
 class GatheringPath(object):
     id = attrib()
     created_at = attrib()
@@ -14,12 +14,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import arrow
 from attr import attrs, attrib
 import attr
 
+from ..utils import parse_timestamp
 
-@attrs
+_timestamp = attr.converters.optional(parse_timestamp)
+
+
+@attrs(slots=True)
 class Path(object):
     id = attrib()
     name = attrib()
@@ -56,25 +59,25 @@ class Path(object):
     endorsement_count = attrib(default=0)
 
 
-@attr.s
+@attr.s(slots=True)
 class UserPath(object):
     id = attrib()
     percentage = attr.ib(converter=float)
-    started_at = attr.ib(converter=attr.converters.optional(arrow.get))
-    created_at = attr.ib(converter=attr.converters.optional(arrow.get))
-    saved_at = attr.ib(converter=attr.converters.optional(arrow.get))
-    completed_at = attr.ib(converter=attr.converters.optional(arrow.get))
-    updated_at = attr.ib(converter=attr.converters.optional(arrow.get))
+    started_at = attr.ib(converter=_timestamp)
+    created_at = attr.ib(converter=_timestamp)
+    saved_at = attr.ib(converter=_timestamp)
+    completed_at = attr.ib(converter=_timestamp)
+    updated_at = attr.ib(converter=_timestamp)
     public = attr.ib(default=False)
     user = attr.ib(default=None)
     path = attr.ib(default=None)
 
 
-@attr.s
+@attr.s(slots=True)
 class PathComment(object):
     id = attrib()
-    created_at = attr.ib(converter=attr.converters.optional(arrow.get))
-    updated_at = attr.ib(converter=attr.converters.optional(arrow.get))
+    created_at = attr.ib(converter=_timestamp)
+    updated_at = attr.ib(converter=_timestamp)
     message = attr.ib(default=None)
     content = attr.ib(default=None)
     conversation = attr.ib(default=None)
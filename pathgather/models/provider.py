@@ -16,10 +16,13 @@
 
 from attr import attrs, attrib
 import attr
-import arrow
 
+from ..utils import parse_timestamp
 
-@attrs
+_timestamp = attr.converters.optional(parse_timestamp)
+
+
+@attrs(slots=True)
 class Provider(object):
     id = attrib()
     name = attrib()
@@ -28,7 +31,7 @@ class Provider(object):
     may_not_be_mobile_friendly = attr.ib(converter=bool)
     is_subscribed = attr.ib(converter=bool)
 
-    created_at = attr.ib(converter=attr.converters.optional(arrow.get))
-    updated_at = attr.ib(converter=attr.converters.optional(arrow.get))
+    created_at = attr.ib(converter=_timestamp)
+    updated_at = attr.ib(converter=_timestamp)
 
     custom_id = attrib(default=None)
@@ -17,14 +17,14 @@
 from attr import attrs, attrib
 
 
-@attrs
+@attrs(slots=True)
 class UserSkill(object):
     id = attrib()
     level = attrib()
     skill = attrib()
 
 
-@attrs
+@attrs(slots=True)
 class Skill(object):
     id = attrib()
     name = attrib()
@@ -17,7 +17,7 @@
 from attr import attrs, attrib
 
 
-@attrs
+@attrs(slots=True)
 class User(object):
     id = attrib()
     first_name = attrib()
@@ -14,21 +14,44 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import json
-
 from .models.path import Path, UserPath, PathComment
 from .models.skill import Skill
 from .models.user import User
-from .utils import scrub
+from .columns import iter_records, to_arrow, to_columns, to_dataframe
+from .sync import sync_since
 
 
-class PathsClient(object):
-    """ Path API. """
+class BasePathsClient(object):
+    """ Model hydration shared by the Path API clients. """
 
     def __init__(self, client):
         self.client = client
 
-    def all(self, from_page=None, query=None):
+    def _to_path_comment(self, data):
+        data["user"] = User(**data["user"])
+        if "path" in data:
+            data["path"] = Path(**data["path"])
+        return PathComment(**data)
+
+    def _to_user_path(self, data):
+        data["user"] = User(**data["user"])
+        data["path"] = Path(**data["path"])
+        data["path"].user = User(**data["path"].user)
+        return UserPath(**data)
+
+    def _to_path(self, data):
+        _skills = []
+        for skill in data["skills"]:
+            _skills.append(Skill(**skill))
+        data["skills"] = _skills
+        data["user"] = User(**data["user"])
+        return Path(**data)
+
+
+class PathsClient(BasePathsClient):
+    """ Path API. """
+
+    def all(self, from_page=None, query=None, per_page=None, raw=False):
         """
         Get all paths.
 
@@ -41,38 +64,111 @@ class PathsClient(object):
         :param query: Extra query parameters
         :param query: ``dict``
 
+        :param per_page: Results per page, up to
+            :attr:`pathgather.client.PathgatherClient.MAX_RESULTS_PER_PAGE`
+        :type  per_page: ``int``
+
+        :param raw: Return the decoded ``dict`` records, without building models
+        :type  raw: ``bool``
+
         :return: A list of paths
         :rtype: ``list`` of :class:`pathgather.models.path.Path`
         """
+        return list(self.iter_all(
+            from_page=from_page, query=query, per_page=per_page, raw=raw
+        ))
+
+    def iter_all(self, from_page=None, query=None, per_page=None, raw=False):
+        """
+        Iterate all paths, fetching each page only when it is needed.
+
+        Paths are returned sorted by creation date,
+        with the most recently created path appearing first.
+
+        :param from_page: Get from page (when paginated)
+        :type  from_page: ``int``
+
+        :param query: Extra query parameters
+        :param query: ``dict``
+
+        :param per_page: Results per page, up to
+            :attr:`pathgather.client.PathgatherClient.MAX_RESULTS_PER_PAGE`
+        :type  per_page: ``int``
+
+        :param raw: Return the decoded ``dict`` records, without building models
+        :type  raw: ``bool``
+
+        :return: A generator of paths
+        :rtype: ``generator`` of :class:`pathgather.models.path.Path`
+        """
         params = {}
 
         if from_page is not None:
             params["from"] = from_page
+        if per_page is not None:
+            params["per_page"] = per_page
 
         data = None
         if query is not None:
-            data = json.dumps({"q": query})
+            data = self.client.json_codec.encode({"q": query})
 
         paths = self.client.get_paged("paths", params=params, data=data)
-        results = []
         for page in paths:
-            results.extend([self._to_path(i) for i in page["results"]])
-        return results
+            for i in page["results"]:
+                yield i if raw else self._to_path(i)
+
+    def sync_since(self, watermark=None, query=None, per_page=None):
+        """
+        Fetch the paths updated since the last sync
+
+        :param watermark: The ``watermark`` of the previous sync, ``None``
+            fetches every path
+        :type  watermark: :class:`arrow.Arrow`, ``datetime`` or ISO-8601 ``str``
+
+        :param query: Additional filter query
+        :type  query: ``dict``
+
+        :param per_page: Results per page
+        :type  per_page: ``int``
+
+        :return: The changed paths and the new watermark
+        :rtype: :class:`pathgather.sync.SyncResult`
+        """
+        return sync_since(
+            self.client,
+            "paths",
+            self._to_path,
+            watermark=watermark,
+            query=query,
+            per_page=per_page,
+        )
 
-    def get(self, id):
+    def get(self, id, raw=False):
         """
         Fetch a path by ID
 
         :param id: Path ID
         :type  id: ``str``
 
+        :param raw: Return the decoded ``dict``, without building a model
+        :type  raw: ``bool``
+
         :return: A path
         :rtype: :class:`pathgather.models.path.Path`
         """
-        path = self.client.get("paths/{0}".format(id))
-        return self._to_path(path)
-
-    def starts_and_completions(self, from_page=None, query=None):
+        if raw:
+            return self.client.get("paths/{0}".format(id))
+        cache = self.client.entity_cache
+        path = cache.get("paths", id) if cache is not None else None
+        if path is None:
+            path = self._to_path(self.client.get("paths/{0}".format(id)))
+            if cache is not None:
+                cache.set("paths", id, path)
+        return path
+
+    def starts_and_completions(
+        self, from_page=None, query=None, per_page=None, raw=False
+    ):
         """
         Returns objects representing a user's interaction
         (starts and completions) with paths.
@@ -85,25 +181,137 @@ class PathsClient(object):
         :param query: Extra query parameters
         :param query: ``dict``
 
+        :param per_page: Results per page, up to
+            :attr:`pathgather.client.PathgatherClient.MAX_RESULTS_PER_PAGE`
+        :type  per_page: ``int``
+
+        :param raw: Return the decoded ``dict`` records, without building models
+        :type  raw: ``bool``
+
         :return: A list of path starts and completions
         :rtype: ``list`` of :class:`pathgather.models.content.UserPath`
         """
+        return list(self.iter_starts_and_completions(
+            from_page=from_page, query=query, per_page=per_page, raw=raw
+        ))
+
+    def iter_starts_and_completions(
+        self, from_page=None, query=None, per_page=None, raw=False
+    ):
+        """
+        Iterate objects representing a user's interaction
+        (starts and completions) with paths, fetching each page
+        only when it is needed.
+
+        :param from_page: Get from page
+        :type  from_page: ``str``
+
+        :param query: Extra query parameters
+        :param query: ``dict``
+
+        :param per_page: Results per page, up to
+            :attr:`pathgather.client.PathgatherClient.MAX_RESULTS_PER_PAGE`
+        :type  per_page: ``int``
+
+        :param raw: Return the decoded ``dict`` records, without building models
+        :type  raw: ``bool``
+
+        :return: A generator of path starts and completions
+        :rtype: ``generator`` of :class:`pathgather.models.content.UserPath`
+        """
         params = {}
 
         if from_page is not None:
             params["from"] = from_page
+        if per_page is not None:
+            params["per_page"] = per_page
 
         data = None
         if query is not None:
-            data = json.dumps({"q": query})
+            data = self.client.json_codec.encode({"q": query})
 
         content = self.client.get_paged("user_paths", params=params, data=data)
-        results = []
         for page in content:
-            results.extend([self._to_user_path(i) for i in page["results"]])
-        return results
+            for i in page["results"]:
+                yield i if raw else self._to_user_path(i)
+
+    def starts_and_completions_to_columns(self, query=None, fields=None, per_page=None):
+        """
+        Export all starts and completions of paths as columns, without building a model
+        for each record. Nested objects become dotted columns, e.g. ``user.email``.
+
+        :param query: Additional filter query
+            (see https://docs.pathgather.com/docs/filtering)
+        :type  query: ``dict``
+
+        :param fields: The columns to keep, ``None`` keeps every column
+        :type  fields: ``list`` of ``str``
+
+        :param per_page: Results per page, defaults to the maximum
+        :type  per_page: ``int``
+
+        :return: One list per column
+        :rtype: ``OrderedDict`` of ``str`` to ``list``
+        """
+        records = iter_records(
+            self.client,
+            "user_paths",
+            query=query,
+            per_page=per_page,
+        )
+        return to_columns(records, fields)
+
+    def starts_and_completions_to_dataframe(
+        self, query=None, fields=None, per_page=None, parse_dates=True
+    ):
+        """
+        Export all starts and completions of paths as a :class:`pandas.DataFrame`,
+        without building a model for each record. Requires ``pandas``.
+
+        :param query: Additional filter query
+            (see https://docs.pathgather.com/docs/filtering)
+        :type  query: ``dict``
+
+        :param fields: The columns to keep, ``None`` keeps every column
+        :type  fields: ``list`` of ``str``
+
+        :param per_page: Results per page, defaults to the maximum
+        :type  per_page: ``int``
+
+        :param parse_dates: Convert the ``*_at`` and ``*_date`` columns to
+            timestamps
+        :type  parse_dates: ``bool``
 
-    def get_comments(self, id, from_page=None, query=None):
+        :rtype: :class:`pandas.DataFrame`
+        """
+        columns = self.starts_and_completions_to_columns(
+            query=query, fields=fields, per_page=per_page
+        )
+        return to_dataframe(columns, parse_dates=parse_dates)
+
+    def starts_and_completions_to_arrow(self, query=None, fields=None, per_page=None):
+        """
+        Export all starts and completions of paths as a :class:`pyarrow.Table`,
+        without building a model for each record. Requires ``pyarrow``.
+
+        :param query: Additional filter query
+            (see https://docs.pathgather.com/docs/filtering)
+        :type  query: ``dict``
+
+        :param fields: The columns to keep, ``None`` keeps every column
+        :type  fields: ``list`` of ``str``
+
+        :param per_page: Results per page, defaults to the maximum
+        :type  per_page: ``int``
+
+        :rtype: :class:`pyarrow.Table`
+        """
+        columns = self.starts_and_completions_to_columns(
+            query=query, fields=fields, per_page=per_page
+        )
+        return to_arrow(columns)
+
+    def get_comments(self, id, from_page=None, query=None, per_page=None, raw=False):
         """
         Get comments on a path
     
@@ -116,25 +324,60 @@ class PathsClient(object):
         :param query: Extra query parameters
         :param query: ``dict``
 
+        :param per_page: Results per page, up to
+            :attr:`pathgather.client.PathgatherClient.MAX_RESULTS_PER_PAGE`
+        :type  per_page: ``int``
+
+        :param raw: Return the decoded ``dict`` records, without building models
+        :type  raw: ``bool``
+
         :return: A list of path comments
         :rtype: ``list`` of :class:`pathgather.models.path.PathComment`
         """
+        return list(self.iter_comments(
+            id, from_page=from_page, query=query, per_page=per_page, raw=raw
+        ))
+
+    def iter_comments(self, id, from_page=None, query=None, per_page=None, raw=False):
+        """
+        Iterate comments on a path, fetching each page only when it is needed
+
+        :param id: The path ID
+        :type  id: ``str``
+
+        :param from_page: Get from page
+        :type  from_page: ``str``
+
+        :param query: Extra query parameters
+        :param query: ``dict``
+
+        :param per_page: Results per page, up to
+            :attr:`pathgather.client.PathgatherClient.MAX_RESULTS_PER_PAGE`
+        :type  per_page: ``int``
+
+        :param raw: Return the decoded ``dict`` records, without building models
+        :type  raw: ``bool``
+
+        :return: A generator of path comments
+        :rtype: ``generator`` of :class:`pathgather.models.path.PathComment`
+        """
         params = {}
 
         if from_page is not None:
             params["from"] = from_page
+        if per_page is not None:
+            params["per_page"] = per_page
 
         data = None
         if query is not None:
-            data = json.dumps({"q": query})
+            data = self.client.json_codec.encode({"q": query})
 
         content = self.client.get_paged(
             "paths/{0}/comments".format(id), params=params, data=data
         )
-        results = []
         for page in content:
-            results.extend([self._to_path_comment(i) for i in page["results"]])
-        return results
+            for i in page["results"]:
+                yield i if raw else self._to_path_comment(i)
 
     def create_comment(self, id, message, user_id, custom_id=None):
         """
@@ -176,26 +419,3 @@ class PathsClient(object):
 
         """
         return self.client.delete("paths/{0}/comments/{1}".format(id, comment_id))
-
-    def _to_path_comment(self, data):
-        scrub(data)
-        data["user"] = User(**data["user"])
-        if "path" in data:
-            data["path"] = Path(**data["path"])
-        return PathComment(**data)
-
-    def _to_user_path(self, data):
-        scrub(data)
-        data["user"] = User(**data["user"])
-        data["path"] = Path(**data["path"])
-        data["path"].user = User(**data["path"].user)
-        return UserPath(**data)
-
-    def _to_path(self, data):
-        scrub(data)
-        _skills = []
-        for skill in data["skills"]:
-            _skills.append(Skill(**skill))
-        data["skills"] = _skills
-        data["user"] = User(**data["user"])
-        return Path(**data)
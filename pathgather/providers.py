@@ -14,49 +14,92 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .utils import scrub
 from .models.provider import Provider
 
 
-class ProvidersClient(object):
-    """ Providers API. """
+class BaseProvidersClient(object):
+    """ Model hydration shared by the Providers API clients. """
 
     def __init__(self, client):
         self.client = client
 
-    def all(self, from_page=None):
+    def _to_provider(self, data):
+        return Provider(**data)
+
+
+class ProvidersClient(BaseProvidersClient):
+    """ Providers API. """
+
+    def all(self, from_page=None, per_page=None, raw=False):
         """
         Get all providers (will page results out)
 
         :param from_page: Start at page
         :type  from_page: ``int``
 
+        :param per_page: Results per page, up to
+            :attr:`pathgather.client.PathgatherClient.MAX_RESULTS_PER_PAGE`
+        :type  per_page: ``int``
+
+        :param raw: Return the decoded ``dict`` records, without building models
+        :type  raw: ``bool``
+
         :return: A list of providers
         :rtype: ``list`` of :class:`pathgather.models.provider.Provider`
         """
+        return list(self.iter_all(from_page=from_page, per_page=per_page, raw=raw))
+
+    def iter_all(self, from_page=None, per_page=None, raw=False):
+        """
+        Iterate all providers, fetching each page only when it is needed
+
+        :param from_page: Start at page
+        :type  from_page: ``int``
+
+        :param per_page: Results per page, up to
+            :attr:`pathgather.client.PathgatherClient.MAX_RESULTS_PER_PAGE`
+        :type  per_page: ``int``
+
+        :param raw: Return the decoded ``dict`` records, without building models
+        :type  raw: ``bool``
+
+        :return: A generator of providers
+        :rtype: ``generator`` of :class:`pathgather.models.provider.Provider`
+        """
         params = {}
 
         if from_page is not None:
             params["from"] = from_page
+        if per_page is not None:
+            params["per_page"] = per_page
 
         providers = self.client.get_paged("providers", params=params)
-        results = []
         for page in providers:
-            results.extend([self._to_provider(i) for i in page["results"]])
-        return results
+            for i in page["results"]:
+                yield i if raw else self._to_provider(i)
 
-    def get(self, id):
+    def get(self, id, raw=False):
         """
         Fetch a provider by ID.
 
         :param id: The provider id
         :type  id: ``str``
 
+        :param raw: Return the decoded ``dict``, without building a model
+        :type  raw: ``bool``
+
         :return: An instance :class:`pathgather.models.provider.Provider`
         :rtype: :class:`pathgather.models.provider.Provider`
         """
-        provider = self.client.get("providers/{0}".format(id))
-        return self._to_provider(provider)
+        if raw:
+            return self.client.get("providers/{0}".format(id))
+        cache = self.client.entity_cache
+        provider = cache.get("providers", id) if cache is not None else None
+        if provider is None:
+            provider = self._to_provider(self.client.get("providers/{0}".format(id)))
+            if cache is not None:
+                cache.set("providers", id, provider)
+        return provider
 
     def create(
         self,
@@ -97,7 +140,5 @@ class ProvidersClient(object):
         :type  id: ``str``
         """
         self.client.delete("providers/{0}".format(id))
-
-    def _to_provider(self, data):
-        scrub(data)
-        return Provider(**data)
+        if self.client.entity_cache is not None:
+            self.client.entity_cache.invalidate("providers", id)
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+# Licensed to Anthony Shaw (anthonyshaw@apache.org) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import email.utils
+import threading
+import time
+
+_clock = getattr(time, "monotonic", time.time)
+
+
+def parse_retry_after(value):
+    """
+    Parse a ``Retry-After`` header, either delay-seconds or an HTTP-date
+
+    :param value: The header value
+    :type  value: ``str``
+
+    :return: The number of seconds to wait, or ``None`` if it can't be parsed
+    :rtype: ``float``
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    parsed = email.utils.parsedate_tz(value)
+    if parsed is None:
+        return None
+    return max(0.0, email.utils.mktime_tz(parsed) - time.time())
+
+
+class RateLimiter(object):
+    """
+    Adaptive token bucket limiting the request rate of a
+    :class:`pathgather.PathgatherClient`, shared by all of its sub-clients
+    and safe to use from many threads.
+
+    Every throttled (HTTP 429) response cuts the rate by ``decrease_factor``
+    and pauses all callers until ``Retry-After`` has passed; every other
+    response raises the rate by ``increase`` again, up to ``max_rate``.
+    """
+
+    def __init__(
+        self,
+        rate,
+        burst=None,
+        min_rate=0.5,
+        max_rate=None,
+        decrease_factor=0.5,
+        increase=0.1,
+        max_retries=5,
+    ):
+        """
+        :param rate: Starting rate, in requests per second
+        :type  rate: ``float``
+
+        :param burst: Maximum number of requests sent back to back, defaults to
+            one second's worth of ``rate``
+        :type  burst: ``int``
+
+        :param min_rate: The rate is never reduced below this
+        :type  min_rate: ``float``
+
+        :param max_rate: The rate is never increased above this, defaults to ``rate``
+        :type  max_rate: ``float``
+
+        :param decrease_factor: Multiplier applied to the rate when throttled
+        :type  decrease_factor: ``float``
+
+        :param increase: Requests per second added back after each unthrottled response
+        :type  increase: ``float``
+
+        :param max_retries: Number of times a throttled request is retried
+            before the 429 is raised to the caller
+        :type  max_retries: ``int``
+        """
+        self.rate = float(rate)
+        self.burst = burst if burst is not None else max(1.0, self.rate)
+        self.min_rate = min_rate
+        self.max_rate = max_rate if max_rate is not None else self.rate
+        self.decrease_factor = decrease_factor
+        self.increase = increase
+        self.max_retries = max_retries
+
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated = _clock()
+        self._blocked_until = 0.0
+
+    def _refill(self, now):
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+    def acquire(self):
+        """
+        Block until a request may be sent
+        """
+        while True:
+            with self._lock:
+                now = _clock()
+                self._refill(now)
+                if now >= self._blocked_until and self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = max(self._blocked_until - now, (1 - self._tokens) / self.rate)
+            time.sleep(wait)
+
+    def throttled(self, retry_after=None):
+        """
+        Record a throttled response, slowing down all callers
+
+        :param retry_after: Seconds the server asked us to wait, if given
+        :type  retry_after: ``float``
+        """
+        with self._lock:
+            now = _clock()
+            self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+            if retry_after is None:
+                retry_after = 1.0 / self.rate
+            self._blocked_until = max(self._blocked_until, now + retry_after)
+            # no tokens accrue while paused, so callers don't stampede afterwards
+            self._tokens = 0.0
+            self._updated = self._blocked_until
+
+    def succeeded(self):
+        """
+        Record an unthrottled response, speeding back up towards ``max_rate``
+        """
+        with self._lock:
+            if self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate + self.increase)
@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+# Licensed to Anthony Shaw (anthonyshaw@apache.org) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import random
+import time
+
+import requests
+from attr import attrs, attrib
+from requests.packages.urllib3.exceptions import NewConnectionError
+
+from .ratelimit import parse_retry_after
+
+_clock = getattr(time, "monotonic", time.time)
+
+
+def _not_connected(error):
+    """
+    Whether a request failed before the server saw it, because the connection
+    timed out, was refused or the host name could not be resolved
+    """
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    reason = error.args[0] if error.args else None
+    # requests wraps urllib3's MaxRetryError around the original error
+    reason = getattr(reason, "reason", reason)
+    return isinstance(reason, NewConnectionError)
+
+
+@attrs
+class RetryEvent(object):
+    method = attrib()
+    uri = attrib()
+    attempt = attrib()
+    elapsed = attrib()
+    will_retry = attrib()
+    delay = attrib(default=None)
+    status_code = attrib(default=None)
+    error = attrib(default=None)
+
+
+class RetryPolicy(object):
+    """
+    Retries failed requests with exponential backoff and jitter.
+
+    Responses with a status in ``status_codes``, connection errors and timeouts
+    are retried for idempotent requests (``methods``). Other requests, e.g.
+    ``POST``, are only retried when the connection could not be established,
+    since the server never saw them.
+    """
+
+    def __init__(
+        self,
+        max_attempts=4,
+        backoff_factor=0.5,
+        max_backoff=30,
+        jitter=True,
+        deadline=None,
+        status_codes=(500, 502, 503, 504),
+        methods=("GET", "PUT", "DELETE"),
+        on_retry=None,
+    ):
+        """
+        :param max_attempts: Total number of attempts, including the first
+        :type  max_attempts: ``int``
+
+        :param backoff_factor: Delay before the first retry, doubled for each
+            subsequent retry
+        :type  backoff_factor: ``float``
+
+        :param max_backoff: Longest delay between two attempts, in seconds
+        :type  max_backoff: ``float``
+
+        :param jitter: Pick a random delay between 0 and the backoff ("full jitter")
+            so that many clients don't retry in lockstep
+        :type  jitter: ``bool``
+
+        :param deadline: Give up once this many seconds have passed since the
+            first attempt, ``None`` for no deadline
+        :type  deadline: ``float``
+
+        :param status_codes: Response status codes that are retried
+        :type  status_codes: ``tuple`` of ``int``
+
+        :param methods: HTTP methods that are safe to repeat
+        :type  methods: ``tuple`` of ``str``
+
+        :param on_retry: Called with a :class:`RetryEvent` for every failed attempt
+        :type  on_retry: ``callable``
+        """
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.deadline = deadline
+        self.status_codes = status_codes
+        self.methods = methods
+        self.on_retry = on_retry
+
+    def backoff(self, attempt):
+        """
+        The delay after the given (1-based) failed attempt, in seconds
+
+        :rtype: ``float``
+        """
+        delay = min(self.max_backoff, self.backoff_factor * (2 ** (attempt - 1)))
+        if self.jitter:
+            delay = random.uniform(0, delay)  # nosec - not used for security
+        return delay
+
+    def run(self, method, uri, send, idempotent=None):
+        """
+        Call ``send()`` until it returns a response that should not be retried
+
+        :param method: The HTTP method
+        :type  method: ``str``
+
+        :param uri: The request URI, used in retry events
+        :type  uri: ``str``
+
+        :param send: Sends the request and returns the response
+        :type  send: ``callable``
+
+        :param idempotent: Whether the request is safe to repeat, defaults to
+            whether ``method`` is one of :attr:`methods`
+        :type  idempotent: ``bool``
+
+        :rtype: :class:`requests.Response`
+        """
+        if idempotent is None:
+            idempotent = method.upper() in self.methods
+        started = _clock()
+        attempt = 0
+        while True:
+            attempt += 1
+            result = None
+            error = None
+            try:
+                result = send()
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error = e
+            if error is None and result.status_code not in self.status_codes:
+                return result
+
+            delay = self.backoff(attempt)
+            if result is not None:
+                retry_after = parse_retry_after(result.headers.get("Retry-After"))
+                if retry_after is not None:
+                    delay = max(delay, retry_after)
+            elapsed = _clock() - started
+            will_retry = (
+                (idempotent or (error is not None and _not_connected(error)))
+                and attempt < self.max_attempts
+                and (self.deadline is None or elapsed + delay <= self.deadline)
+            )
+            if self.on_retry is not None:
+                self.on_retry(
+                    RetryEvent(
+                        method=method,
+                        uri=uri,
+                        attempt=attempt,
+                        elapsed=elapsed,
+                        will_retry=will_retry,
+                        delay=delay if will_retry else None,
+                        status_code=result.status_code if result is not None else None,
+                        error=error,
+                    )
+                )
+            if not will_retry:
+                if error is not None:
+                    raise error
+                return result
+            if result is not None:
+                # release the connection of a streamed response
+                result.close()
+            time.sleep(delay)
@@ -0,0 +1,896 @@
+# -*- coding: utf-8 -*-
+# Licensed to Anthony Shaw (anthonyshaw@apache.org) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import argparse
+import hashlib
+import json
+import logging
+import math
+import random
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import datetime
+
+try:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+    from urllib.parse import parse_qs, urlparse
+except ImportError:  # Python 2
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn
+    from urlparse import parse_qs, urlparse
+
+from .utils import parse_timestamp
+
+logger = logging.getLogger(__name__)
+
+#: The collections served under ``/v1``
+COLLECTIONS = (
+    "users",
+    "content",
+    "user_content",
+    "paths",
+    "user_paths",
+    "gatherings",
+    "skills",
+    "providers",
+)
+
+DEFAULT_PER_PAGE = 50
+MAX_PER_PAGE = 100
+
+#: Operators of the ``q`` filter
+OPERATORS = ("eq", "ne", "gt", "gte", "lt", "lte", "in")
+
+_TYPES = {
+    "users": "User",
+    "content": "Content",
+    "user_content": "UserContent",
+    "paths": "Path",
+    "user_paths": "UserPath",
+    "gatherings": "Gathering",
+    "skills": "Skill",
+    "providers": "Provider",
+}
+# the key the sub-clients wrap created and updated records in
+_WRAPPERS = {
+    "users": "user",
+    "content": "content",
+    "paths": "path",
+    "gatherings": "gathering",
+    "skills": "skill",
+    "providers": "provider",
+}
+# parameters the sub-clients send that are not fields of the record
+_IGNORED = {"users": ("send_invite",), "content": ("image",)}
+# fields the models require, for records created without them
+_DEFAULTS = {
+    "users": {
+        "first_name": None,
+        "last_name": None,
+        "email": None,
+        "job_title": None,
+        "deactivated": False,
+    },
+    "content": {
+        "name": None,
+        "content_type": None,
+        "source_url": None,
+        "enabled": True,
+    },
+    "paths": {"name": None, "published": False, "skills": []},
+    "skills": {"name": None},
+    "providers": {
+        "name": None,
+        "may_require_vpn": False,
+        "may_not_be_mobile_friendly": False,
+        "is_subscribed": True,
+    },
+    "gatherings": {"name": None},
+}
+_TIMESTAMP_SUFFIXES = ("_at", "_date")
+
+_FIRST_NAMES = ("Alex", "Sam", "Jamie", "Robin", "Taylor", "Jordan", "Casey", "Riley")
+_LAST_NAMES = ("Smith", "Chen", "Garcia", "Okafor", "Novak", "Kumar", "Rossi", "Tanaka")
+_JOB_TITLES = ("Engineer", "Analyst", "Designer", "Manager", "Consultant", "Director")
+_DEPARTMENTS = ("Engineering", "Sales", "Marketing", "Finance", "People", "Operations")
+_CONTENT_TYPES = ("Course", "Video", "Article", "Book", "Webpage", "Podcast")
+_LEVELS = ("Beginner", "Intermediate", "Advanced", "All")
+# records are created between 2016-01-01 and now
+_EPOCH = 1451606400
+
+
+def _timestamp(seconds):
+    return datetime.utcfromtimestamp(seconds).isoformat() + "+00:00"
+
+
+class _Generator(object):
+    def __init__(self, seed):
+        self.random = random.Random(seed)
+        self.now = time.time()
+
+    def id(self):
+        return str(uuid.UUID(int=self.random.getrandbits(128), version=4))
+
+    def times(self, count):
+        return sorted(self.random.uniform(_EPOCH, self.now) for _ in range(count))
+
+    def stamps(self, created):
+        updated = self.random.uniform(created, self.now)
+        return {"created_at": _timestamp(created), "updated_at": _timestamp(updated)}
+
+    def skill(self, n):
+        return {"_type": "Skill", "id": self.id(), "name": "skill {0}".format(n)}
+
+    def provider(self, n, created):
+        provider = {
+            "_type": "Provider",
+            "id": self.id(),
+            "custom_id": None,
+            "name": "Provider {0}".format(n),
+            "may_require_vpn": False,
+            "may_not_be_mobile_friendly": False,
+            "is_subscribed": True,
+        }
+        provider.update(self.stamps(created))
+        return provider
+
+    def department(self, name):
+        return {
+            "_type": "Department",
+            "id": self.id(),
+            "name": name,
+            "created_at": _timestamp(_EPOCH),
+        }
+
+    def user(self, n, created, department):
+        first = self.random.choice(_FIRST_NAMES)
+        last = self.random.choice(_LAST_NAMES)
+        user = {
+            "_type": "User",
+            "id": self.id(),
+            "custom_id": None,
+            "first_name": first,
+            "last_name": last,
+            "name": "{0} {1}".format(first, last),
+            "email": "user{0}@example.com".format(n),
+            "job_title": self.random.choice(_JOB_TITLES),
+            "hire_date": _timestamp(created)[:10],
+            "location": None,
+            "deactivated": False,
+            "admin": False,
+            "department": department,
+        }
+        user.update(self.stamps(created))
+        return user
+
+    def content(self, n, created, provider, skills):
+        content = {
+            "_type": "Content",
+            "id": self.id(),
+            "custom_id": None,
+            "name": "Content {0}".format(n),
+            "description": "",
+            "content_type": self.random.choice(_CONTENT_TYPES),
+            "source_url": "https://example.com/content/{0}".format(n),
+            "level": self.random.choice(_LEVELS),
+            "rating": self.random.randint(0, 5),
+            "reviews_count": self.random.randint(0, 50),
+            "duration": None,
+            "enabled": True,
+            "tags": [],
+            "skills": skills,
+            "provider": provider,
+        }
+        content.update(self.stamps(created))
+        return content
+
+    def path(self, n, created, user, skills):
+        path = {
+            "_type": "Path",
+            "id": self.id(),
+            "custom_id": None,
+            "name": "Path {0}".format(n),
+            "published": True,
+            "tags": [],
+            "skills": skills,
+            "user": user,
+        }
+        path.update(self.stamps(created))
+        return path
+
+    def gathering(self, n, created, user, skills):
+        gathering = {
+            "_type": "Gathering",
+            "id": self.id(),
+            "custom_id": None,
+            "name": "Gathering {0}".format(n),
+            "description": "",
+            "closed": False,
+            "user": user,
+            "skills": skills,
+        }
+        gathering.update(self.stamps(created))
+        return gathering
+
+    def progress(self, kind, created, user, item):
+        started = self.random.uniform(created, self.now)
+        completed = None
+        if self.random.random() < 0.5:
+            completed = _timestamp(self.random.uniform(started, self.now))
+        record = {
+            "_type": _TYPES[kind],
+            "id": self.id(),
+            "public": True,
+            "started_at": _timestamp(started),
+            "completed_at": completed,
+            "saved_at": None,
+            "user": user,
+        }
+        if kind == "user_content":
+            record.update(first_launched_at=None, last_launched_at=None, content=item)
+        else:
+            record.update(percentage="100.0" if completed else "0.0", path=item)
+        record.update(self.stamps(created))
+        return record
+
+
+def generate_tenant(
+    users=100,
+    content=100,
+    user_content=1000,
+    paths=20,
+    user_paths=200,
+    gatherings=10,
+    skills=50,
+    providers=10,
+    seed=0,
+):
+    """
+    Generate the records of a tenant, created between 2016 and now. The same
+    arguments generate the same IDs, names and relations.
+
+    :param users: Number of users, the other arguments are the numbers of
+        records of the other collections
+    :type  users: ``int``
+
+    :param seed: Seed of the random generator
+    :type  seed: ``int``
+
+    :return: The records of each of :data:`COLLECTIONS`, ordered by ``created_at``
+    :rtype: ``dict`` of ``str`` to ``list`` of ``dict``
+    """
+    g = _Generator(seed)
+    tenant = {}
+
+    def pick(records, count):
+        return g.random.sample(records, min(count, len(records)))
+
+    tenant["skills"] = [g.skill(n) for n in range(skills)]
+    tenant["providers"] = [
+        g.provider(n, created) for n, created in enumerate(g.times(providers))
+    ]
+    departments = [g.department(name) for name in _DEPARTMENTS]
+    tenant["users"] = [
+        g.user(n, created, g.random.choice(departments))
+        for n, created in enumerate(g.times(users))
+    ]
+    tenant["content"] = [
+        g.content(
+            n,
+            created,
+            g.random.choice(tenant["providers"]) if providers else None,
+            pick(tenant["skills"], 2),
+        )
+        for n, created in enumerate(g.times(content))
+    ]
+    tenant["paths"] = [
+        g.path(n, created, g.random.choice(tenant["users"]), pick(tenant["skills"], 2))
+        for n, created in enumerate(g.times(paths))
+    ]
+    tenant["gatherings"] = [
+        g.gathering(
+            n, created, g.random.choice(tenant["users"]), pick(tenant["skills"], 2)
+        )
+        for n, created in enumerate(g.times(gatherings))
+    ]
+    for kind, items, count in (
+        ("user_content", tenant["content"], user_content),
+        ("user_paths", tenant["paths"], user_paths),
+    ):
+        tenant[kind] = [
+            g.progress(
+                kind,
+                created,
+                g.random.choice(tenant["users"]),
+                g.random.choice(items),
+            )
+            for created in g.times(count if items and users else 0)
+        ]
+    return tenant
+
+
+def _value(field, value):
+    if field.endswith(_TIMESTAMP_SUFFIXES) and value:
+        try:
+            return parse_timestamp(value)
+        except Exception:
+            pass
+    return value
+
+
+def _compare(field, value, operator, operand):
+    if operator == "in":
+        return value in operand
+    value = _value(field, value)
+    operand = _value(field, operand)
+    if operator == "eq":
+        return value == operand
+    if operator == "ne":
+        return value != operand
+    if value is None or operand is None:
+        return False
+    if operator == "gt":
+        return value > operand
+    if operator == "gte":
+        return value >= operand
+    if operator == "lt":
+        return value < operand
+    return value <= operand
+
+
+def matches(record, query):
+    """
+    Whether a record matches a ``q`` filter, e.g.
+    ``{"updated_at": {"gt": "2018-01-01T00:00:00+00:00"}}`` or, for a nested
+    object, ``{"user": {"email": {"eq": "jane@example.com"}}}``
+
+    :param record: The record
+    :type  record: ``dict``
+
+    :param query: The filter, a condition of :data:`OPERATORS` per field
+    :type  query: ``dict``
+
+    :rtype: ``bool``
+    """
+    for field, condition in query.items():
+        value = record.get(field) if isinstance(record, dict) else None
+        if isinstance(condition, dict) and condition:
+            if all(operator in OPERATORS for operator in condition):
+                for operator, operand in condition.items():
+                    if not _compare(field, value, operator, operand):
+                        return False
+            elif not matches(value, condition):
+                return False
+        elif _value(field, value) != _value(field, condition):
+            return False
+    return True
+
+
+class _HttpError(Exception):
+    def __init__(self, status, message):
+        super(_HttpError, self).__init__(message)
+        self.status = status
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # the headers and body are separate writes, with Nagle's algorithm and
+    # delayed ACKs every keep-alive response would wait ~40ms for the body
+    disable_nagle_algorithm = True
+
+    def _serve(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        status, headers, payload = self.server.stand_in.handle(
+            self.command, self.path, self.headers, body
+        )
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _serve
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _HTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class PathgatherServer(object):
+    """
+    A local stand-in for the Pathgather API, for load and latency testing
+    without a network or a tenant.
+
+    Serves the :data:`COLLECTIONS` under ``/v1`` with cursor paging, the
+    ``q`` filter, ``GET``/``PUT``/``DELETE`` of a record by ID or custom ID,
+    ``POST`` to create records and ``ETag`` revalidation. The nested
+    endpoints, e.g. comments, skills of a user or members of a gathering,
+    are not emulated. Latency, server errors and throttling can be injected.
+    Safe to call from many threads.
+
+    .. code-block:: python
+
+        with PathgatherServer(generate_tenant(users=10000), latency=0.05) as server:
+            client = server.client()
+            users = client.users.all()
+    """
+
+    def __init__(
+        self,
+        tenant=None,
+        host="127.0.0.1",
+        port=0,
+        latency=0,
+        error_rate=0.0,
+        rate_limit=None,
+        api_key=None,
+        seed=None,
+    ):
+        """
+        :param tenant: The records of each collection, defaults to
+            :func:`generate_tenant`'s. They are modified by writes.
+        :type  tenant: ``dict`` of ``str`` to ``list`` of ``dict``
+
+        :param host: The interface to listen on
+        :type  host: ``str``
+
+        :param port: The port to listen on, 0 picks a free one
+        :type  port: ``int``
+
+        :param latency: Seconds to wait before each response, either one
+            value or a ``(min, max)`` range to pick from at random
+        :type  latency: ``float`` or ``tuple``
+
+        :param error_rate: Fraction of requests answered with HTTP 500
+        :type  error_rate: ``float``
+
+        :param rate_limit: Requests per second allowed, with bursts of up to
+            one second's worth. Requests over the limit are answered with
+            HTTP 429 and ``Retry-After``. ``None`` disables throttling.
+        :type  rate_limit: ``float``
+
+        :param api_key: Answer requests without this bearer token with HTTP
+            401, ``None`` accepts any token
+        :type  api_key: ``str``
+
+        :param seed: Seed of the latency and error injection
+        :type  seed: ``int``
+        """
+        tenant = generate_tenant() if tenant is None else tenant
+        self.bind_host = host
+        self.port = port
+        self.latency = latency
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.api_key = api_key
+        #: Number of requests received
+        self.requests = 0
+        #: Number of responses by status code
+        self.responses = Counter()
+
+        self._records = dict((kind, list(tenant.get(kind, []))) for kind in COLLECTIONS)
+        self._index = {}
+        for kind, records in self._records.items():
+            self._index[kind] = index = {}
+            for record in records:
+                self._add_to_index(index, record)
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._version = 0
+        self._selections = {}
+        self._tokens = rate_limit
+        self._refilled = time.time()
+        self._server = None
+        self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    @property
+    def host(self):
+        """ ``host:port`` to pass to the client, with ``scheme="http"`` """
+        return "{0}:{1}".format(self.bind_host, self.port)
+
+    @property
+    def url(self):
+        """ The base URL of the API """
+        return "http://{0}/v1".format(self.host)
+
+    def start(self):
+        """
+        Start serving on a background thread
+        """
+        if self._server is not None:
+            return
+        self._server = _HTTPServer((self.bind_host, self.port), _Handler)
+        self._server.stand_in = self
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="pathgather-server"
+        )
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stop serving
+        """
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._server = self._thread = None
+
+    def client(self, api_key=None, **kwargs):
+        """
+        A client of this server
+
+        :param api_key: The API token, defaults to :attr:`api_key`
+        :type  api_key: ``str``
+
+        :param kwargs: Other arguments of the client, e.g. ``retry_policy``
+
+        :rtype: :class:`pathgather.PathgatherClient`
+        """
+        from .client import PathgatherClient
+
+        return PathgatherClient(
+            self.host, api_key or self.api_key or "key", scheme="http", **kwargs
+        )
+
+    def records(self, kind):
+        """
+        The records of a collection
+
+        :param kind: One of :data:`COLLECTIONS`
+        :type  kind: ``str``
+
+        :rtype: ``list`` of ``dict``
+        """
+        with self._lock:
+            return list(self._records[kind])
+
+    def handle(self, method, path, headers, body):
+        """
+        Answer a request
+
+        :param method: The HTTP method
+        :type  method: ``str``
+
+        :param path: The path and query string, e.g. "/v1/users?from=50"
+        :type  path: ``str``
+
+        :param headers: The request headers
+        :type  headers: ``dict``
+
+        :param body: The request body
+        :type  body: ``bytes``
+
+        :return: The status code, headers and body of the response
+        :rtype: ``tuple``
+        """
+        with self._lock:
+            self.requests += 1
+        delay = self._delay()
+        if delay:
+            time.sleep(delay)
+        try:
+            status, response_headers, payload = self._respond(
+                method, path, headers, body
+            )
+        except _HttpError as e:
+            status, response_headers, payload = self._error(e.status, str(e))
+        except Exception:
+            logger.exception("Failed to answer %s %s", method, path)
+            status, response_headers, payload = self._error(500, "Server error")
+        with self._lock:
+            self.responses[status] += 1
+        return status, response_headers, payload
+
+    def _respond(self, method, path, headers, body):
+        if self.api_key is not None:
+            if headers.get("Authorization") != "Bearer {0}".format(self.api_key):
+                raise _HttpError(401, "Unauthorized")
+        wait = self._throttle()
+        if wait:
+            status, response_headers, payload = self._error(429, "Too many requests")
+            retry_after = str(int(math.ceil(wait)))
+            return status, response_headers + [("Retry-After", retry_after)], payload
+        if self.error_rate and self._random.random() < self.error_rate:
+            raise _HttpError(500, "Internal server error")
+
+        url = urlparse(path)
+        parts = [part for part in url.path.split("/") if part]
+        if len(parts) not in (2, 3) or parts[0] != "v1" or parts[1] not in _TYPES:
+            raise _HttpError(404, "Not found")
+        kind = parts[1]
+        query = dict((k, v[0]) for k, v in parse_qs(url.query).items())
+        try:
+            data = json.loads(body.decode("utf-8")) if body else {}
+        except ValueError:
+            raise _HttpError(400, "Invalid JSON")
+
+        if len(parts) == 2:
+            if method == "GET":
+                return self._json(self._page(kind, query, data), headers)
+            if method == "POST":
+                return self._json(self._create(kind, data))
+        else:
+            if method == "GET":
+                return self._json(self._get(kind, parts[2]), headers)
+            if method == "PUT":
+                return self._json(self._update(kind, parts[2], data))
+            if method == "DELETE":
+                self._delete(kind, parts[2])
+                return 200, [], b""
+        raise _HttpError(405, "Method not allowed")
+
+    def _delay(self):
+        if isinstance(self.latency, (tuple, list)):
+            return self._random.uniform(*self.latency)
+        return self.latency
+
+    def _throttle(self):
+        """ Seconds until the next request is allowed, 0 to allow this one """
+        if self.rate_limit is None:
+            return 0
+        with self._lock:
+            now = time.time()
+            self._tokens = min(
+                max(self.rate_limit, 1.0),
+                self._tokens + (now - self._refilled) * self.rate_limit,
+            )
+            self._refilled = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0
+            return (1 - self._tokens) / self.rate_limit
+
+    def _json(self, body, headers=None):
+        payload = json.dumps(body).encode("utf-8")
+        if headers is None:
+            return 200, [("Content-Type", "application/json")], payload
+        etag = '"{0}"'.format(hashlib.sha256(payload).hexdigest()[:32])
+        if headers.get("If-None-Match") == etag:
+            return 304, [("ETag", etag)], b""
+        return 200, [("Content-Type", "application/json"), ("ETag", etag)], payload
+
+    def _error(self, status, message):
+        payload = json.dumps({"error": message}).encode("utf-8")
+        return status, [("Content-Type", "application/json")], payload
+
+    def _page(self, kind, query, data):
+        try:
+            start = int(query.get("from", 0))
+            per_page = min(int(query.get("per_page", DEFAULT_PER_PAGE)), MAX_PER_PAGE)
+        except ValueError:
+            raise _HttpError(400, "Invalid from or per_page")
+        records = self._select(kind, data.get("q"))
+        end = start + max(per_page, 1)
+        next_page = str(end) if end < len(records) else None
+        return {"results": records[start:end], "next": next_page}
+
+    def _select(self, kind, query):
+        if not query:
+            return self._records[kind]
+        # paging a filtered collection would filter it again for every page
+        key = (kind, json.dumps(query, sort_keys=True))
+        with self._lock:
+            version = self._version
+            selection = self._selections.get(key)
+        if selection is not None and selection[0] == version:
+            return selection[1]
+        if not isinstance(query, dict):
+            raise _HttpError(400, "Invalid q")
+        selected = [record for record in self._records[kind] if matches(record, query)]
+        with self._lock:
+            if len(self._selections) >= 64:
+                self._selections.clear()
+            self._selections[key] = (version, selected)
+        return selected
+
+    def _get(self, kind, id):
+        record = self._index[kind].get(id)
+        if record is None:
+            raise _HttpError(404, "Could not find {0} {1}".format(kind, id))
+        return record
+
+    def _add_to_index(self, index, record):
+        index[record["id"]] = record
+        if record.get("custom_id"):
+            index[record["custom_id"]] = record
+
+    def _create(self, kind, data):
+        params = data.get(_WRAPPERS[kind], data) if kind in _WRAPPERS else data
+        now = _timestamp(time.time())
+        record = {
+            "_type": _TYPES[kind],
+            "id": str(uuid.uuid4()),
+            "created_at": now,
+            "updated_at": now,
+        }
+        if kind in ("user_content", "user_paths"):
+            record.update(self._progress(kind, params, now))
+        else:
+            record["custom_id"] = None
+            self._apply(kind, record, params, now)
+        with self._lock:
+            self._records[kind].append(record)
+            self._add_to_index(self._index[kind], record)
+            self._version += 1
+        return record
+
+    def _update(self, kind, id, data):
+        params = data.get(_WRAPPERS[kind], data) if kind in _WRAPPERS else data
+        current = self._get(kind, id)
+        record = dict(current)
+        now = _timestamp(time.time())
+        self._apply(kind, record, params, now)
+        record["updated_at"] = now
+        with self._lock:
+            records = self._records[kind]
+            records[records.index(current)] = record
+            index = self._index[kind]
+            if current.get("custom_id") != record.get("custom_id"):
+                index.pop(current.get("custom_id"), None)
+            self._add_to_index(index, record)
+            self._version += 1
+        return record
+
+    def _delete(self, kind, id):
+        record = self._get(kind, id)
+        with self._lock:
+            self._records[kind].remove(record)
+            index = self._index[kind]
+            index.pop(record["id"], None)
+            if record.get("custom_id"):
+                index.pop(record["custom_id"], None)
+            self._version += 1
+
+    def _apply(self, kind, record, params, now):
+        # translate the parameters the sub-clients send to the record's fields
+        for key, value in params.items():
+            if key in _IGNORED.get(kind, ()):
+                continue
+            if key == "skills" and value is not None:
+                value = [
+                    skill
+                    if isinstance(skill, dict)
+                    else {"_type": "Skill", "id": skill, "name": skill}
+                    for skill in value
+                ]
+            elif kind == "users" and key == "name" and value:
+                first, _, last = value.partition(" ")
+                record.update(first_name=first, last_name=last)
+            elif kind == "users" and key == "department":
+                value = {"_type": "Department", "id": value, "name": value}
+                value["created_at"] = now
+            elif kind == "content" and key.startswith("provider_"):
+                provider = dict(record.get("provider") or {"id": str(uuid.uuid4())})
+                provider.setdefault("name", None)
+                provider[key[len("provider_"):]] = value
+                key, value = "provider", provider
+            elif kind == "content" and key == "topic_name":
+                key, value = "topic", {"_type": "Topic", "name": value}
+            elif kind == "content" and key == "duration_str":
+                key = "duration"
+            record[key] = value
+        for key, value in _DEFAULTS.get(kind, {}).items():
+            record.setdefault(key, value)
+
+    def _progress(self, kind, params, now):
+        item_kind, item_key = (
+            ("content", "content") if kind == "user_content" else ("paths", "path")
+        )
+        item = self._get(item_kind, params.get(item_key + "_id"))
+        user = self._index["users"].get(params.get("user_id"))
+        if user is None and params.get("user_email"):
+            for candidate in self._records["users"]:
+                if candidate.get("email") == params["user_email"]:
+                    user = candidate
+                    break
+        if user is None:
+            raise _HttpError(404, "Could not find the user")
+        completed_at = params.get("completed_at")
+        if completed_at == "now":
+            completed_at = now
+        return {
+            "public": True,
+            "started_at": params.get("started_at"),
+            "completed_at": completed_at,
+            "saved_at": None,
+            "user": user,
+            item_key: item,
+        }
+
+
+def main(argv=None):
+    """
+    Serve a generated tenant until interrupted, e.g.
+    ``python -m pathgather.server --users 10000 --latency 0.05``
+    """
+    parser = argparse.ArgumentParser(description="Serve a local Pathgather tenant")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    for kind, default in (
+        ("users", 100),
+        ("content", 100),
+        ("user-content", 1000),
+        ("paths", 20),
+        ("user-paths", 200),
+        ("gatherings", 10),
+        ("skills", 50),
+        ("providers", 10),
+    ):
+        parser.add_argument("--" + kind, type=int, default=default)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--latency", type=float, default=0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit", type=float, default=None)
+    parser.add_argument("--api-key", default=None)
+    args = parser.parse_args(argv)
+
+    tenant = generate_tenant(
+        users=args.users,
+        content=args.content,
+        user_content=args.user_content,
+        paths=args.paths,
+        user_paths=args.user_paths,
+        gatherings=args.gatherings,
+        skills=args.skills,
+        providers=args.providers,
+        seed=args.seed,
+    )
+    server = PathgatherServer(
+        tenant,
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        error_rate=args.error_rate,
+        rate_limit=args.rate_limit,
+        api_key=args.api_key,
+    )
+    server.start()
+    print(
+        "Serving {0}, connect with PathgatherClient({1!r}, api_key, "
+        "scheme='http')".format(server.url, server.host)
+    )
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
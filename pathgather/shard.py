@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+# Licensed to Anthony Shaw (anthonyshaw@apache.org) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import queue
+except ImportError:  # Python 2
+    import Queue as queue
+
+import arrow
+
+
+def windows(start, end, shards):
+    """
+    Split the time range ``[start, end)`` into ``shards`` equal windows
+
+    :param start: Start of the range
+    :type  start: :class:`arrow.Arrow`
+
+    :param end: End of the range, ``None`` leaves the last window open-ended
+    :type  end: :class:`arrow.Arrow`
+
+    :param shards: Number of windows
+    :type  shards: ``int``
+
+    :return: ``(gte, lt)`` pairs, ``lt`` is ``None`` for an open-ended window
+    :rtype: ``list`` of ``tuple``
+    """
+    open_ended = end is None
+    if open_ended:
+        end = arrow.utcnow()
+    if end <= start or shards < 2:
+        return [(start, None if open_ended else end)]
+    step = (end - start) / shards
+    bounds = [start + step * i for i in range(shards)] + [end]
+    result = list(zip(bounds[:-1], bounds[1:]))
+    if open_ended:
+        result[-1] = (result[-1][0], None)
+    return result
+
+
+def iter_sharded(
+    client,
+    uri,
+    start,
+    end=None,
+    shards=8,
+    field="created_at",
+    query=None,
+    per_page=None,
+):
+    """
+    Iterate a paged collection by splitting it into disjoint time windows of
+    ``field`` and paging every window on its own thread
+
+    Records are yielded as they arrive, not in the API's order. A record is
+    only yielded once, even if it moved between windows during the crawl
+    (e.g. when sharding on ``updated_at``).
+
+    :param client: The API client
+    :type  client: :class:`pathgather.PathgatherClient`
+
+    :param uri: The collection, e.g. "users"
+    :type  uri: ``str``
+
+    :param start: Start of the range, e.g. when the tenant was created
+    :type  start: :class:`arrow.Arrow`, ``datetime`` or ISO-8601 ``str``
+
+    :param end: End of the range, defaults to open-ended
+    :type  end: :class:`arrow.Arrow`, ``datetime`` or ISO-8601 ``str``
+
+    :param shards: Number of windows, and threads
+    :type  shards: ``int``
+
+    :param field: The timestamp to split on, "created_at" or "updated_at"
+    :type  field: ``str``
+
+    :param query: Additional filter query, must not filter on ``field``, use
+        ``start`` and ``end`` to narrow it instead
+        (see https://docs.pathgather.com/docs/filtering)
+    :type  query: ``dict``
+
+    :param per_page: Results per page
+    :type  per_page: ``int``
+
+    :raises ValueError: If ``query`` already filters on ``field``
+
+    :rtype: ``generator`` of ``dict``
+    """
+    if query and field in query:
+        # the windows replace the condition, which would silently widen it
+        raise ValueError(
+            "query filters on {0!r}, use start and end instead".format(field)
+        )
+    start = arrow.get(start)
+    if end is not None:
+        end = arrow.get(end)
+    ranges = windows(start, end, shards)
+    params = {"per_page": per_page} if per_page is not None else None
+    pages = queue.Queue(maxsize=2 * len(ranges))
+    stop = threading.Event()
+
+    def put(item):
+        # Give up once the consumer has gone away rather than block forever
+        while not stop.is_set():
+            try:
+                pages.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def crawl(lower, upper):
+        q = dict(query or {})
+        q[field] = {"gte": lower.isoformat()}
+        if upper is not None:
+            q[field]["lt"] = upper.isoformat()
+        try:
+            data = client.json_codec.encode({"q": q})
+            # results are handed to another thread, so fetch each page whole
+            window_pages = client.get_paged(
+                uri, params=params, data=data, prefetch=0, stream=False
+            )
+            for page in window_pages:
+                if not put((page["results"], None)):
+                    return
+        except Exception as e:
+            put((None, e))
+            return
+        put((None, None))
+
+    pool = ThreadPoolExecutor(max_workers=len(ranges))
+    for lower, upper in ranges:
+        pool.submit(crawl, lower, upper)
+    seen = set()
+    remaining = len(ranges)
+    try:
+        while remaining:
+            results, error = pages.get()
+            if error is not None:
+                raise error
+            if results is None:
+                remaining -= 1
+                continue
+            for record in results:
+                if record["id"] not in seen:
+                    seen.add(record["id"])
+                    yield record
+    finally:
+        stop.set()
+        pool.shutdown(wait=False)
@@ -14,49 +14,92 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .utils import scrub
 from .models.skill import Skill
 
 
-class SkillsClient(object):
-    """ Skills API. """
+class BaseSkillsClient(object):
+    """ Model hydration shared by the Skills API clients. """
 
     def __init__(self, client):
         self.client = client
 
-    def all(self, from_page=None):
+    def _to_skill(self, data):
+        return Skill(**data)
+
+
+class SkillsClient(BaseSkillsClient):
+    """ Skills API. """
+
+    def all(self, from_page=None, per_page=None, raw=False):
         """
         Get all skills (will page results out)
 
         :param from_page: Start at page
         :type  from_page: ``int``
 
+        :param per_page: Results per page, up to
+            :attr:`pathgather.client.PathgatherClient.MAX_RESULTS_PER_PAGE`
+        :type  per_page: ``int``
+
+        :param raw: Return the decoded ``dict`` records, without building models
+        :type  raw: ``bool``
+
         :return: A list of users
         :rtype: ``list`` of :class:`pathgather.models.skill.Skill`
         """
+        return list(self.iter_all(from_page=from_page, per_page=per_page, raw=raw))
+
+    def iter_all(self, from_page=None, per_page=None, raw=False):
+        """
+        Iterate all skills, fetching each page only when it is needed
+
+        :param from_page: Start at page
+        :type  from_page: ``int``
+
+        :param per_page: Results per page, up to
+            :attr:`pathgather.client.PathgatherClient.MAX_RESULTS_PER_PAGE`
+        :type  per_page: ``int``
+
+        :param raw: Return the decoded ``dict`` records, without building models
+        :type  raw: ``bool``
+
+        :return: A generator of skills
+        :rtype: ``generator`` of :class:`pathgather.models.skill.Skill`
+        """
         params = {}
 
         if from_page is not None:
             params["from"] = from_page
+        if per_page is not None:
+            params["per_page"] = per_page
 
         users = self.client.get_paged("skills", params=params)
-        results = []
         for page in users:
-            results.extend([self._to_skill(i) for i in page["results"]])
-        return results
+            for i in page["results"]:
+                yield i if raw else self._to_skill(i)
 
-    def get(self, id):
+    def get(self, id, raw=False):
         """
         Fetch a skill by ID.
 
         :param id: The user id
         :type  id: ``str``
 
+        :param raw: Return the decoded ``dict``, without building a model
+        :type  raw: ``bool``
+
         :return: An instance :class:`pathgather.models.skill.Skill`
         :rtype: :class:`pathgather.models.skill.Skill`
         """
-        user = self.client.get("skills/{0}".format(id))
-        return self._to_skill(user)
+        if raw:
+            return self.client.get("skills/{0}".format(id))
+        cache = self.client.entity_cache
+        skill = cache.get("skills", id) if cache is not None else None
+        if skill is None:
+            skill = self._to_skill(self.client.get("skills/{0}".format(id)))
+            if cache is not None:
+                cache.set("skills", id, skill)
+        return skill
 
     def create(self, name, custom_id=None):
         """
@@ -102,6 +145,8 @@ class SkillsClient(object):
             params["custom_id"] = custom_id
 
         user = self.client.put("skills/{0}".format(id), {"user": params})
+        if self.client.entity_cache is not None:
+            self.client.entity_cache.invalidate("skills", id)
         return self._to_skill(user)
 
     def delete(self, id):
@@ -112,7 +157,5 @@ class SkillsClient(object):
         :type  id: ``str``
         """
         self.client.delete("skills/{0}".format(id))
-
-    def _to_skill(self, data):
-        scrub(data)
-        return Skill(**data)
+        if self.client.entity_cache is not None:
+            self.client.entity_cache.invalidate("skills", id)
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+# Licensed to Anthony Shaw (anthonyshaw@apache.org) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+try:
+    import ijson
+    from ijson.common import ObjectBuilder
+except ImportError:
+    ijson = None
+
+_CONTAINERS = ("start_map", "start_array")
+_SCALARS = ("null", "boolean", "integer", "double", "number", "string")
+
+
+class _ChunkReader(object):
+    """
+    File-like object over an iterator of byte chunks
+    """
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+
+    def read(self, size=-1):
+        # ijson probes the type of the stream with read(0)
+        if size == 0:
+            return b""
+        return next(self._chunks, b"")
+
+
+def available():
+    """
+    Whether incremental parsing is available (:mod:`ijson` is installed)
+
+    :rtype: ``bool``
+    """
+    return ijson is not None
+
+
+def iter_results(chunks, page):
+    """
+    Parse a page incrementally, yielding the items of its ``results`` array
+    as soon as each one is complete
+
+    ``_type`` keys are removed, like :meth:`pathgather.codec.JsonCodec.decode`
+    does. The page's other top-level values, e.g. ``next``, are stored in
+    ``page`` as they are parsed. ``next`` follows ``results`` in the API's
+    responses, so it is only known once every result has been read.
+
+    :param chunks: The response body
+    :type  chunks: ``iterable`` of ``bytes``
+
+    :param page: Receives the top-level values other than ``results``
+    :type  page: ``dict``
+
+    :rtype: ``generator`` of ``dict``
+    """
+    builder = None
+    # while dropping a "_type" value, the nesting depth within it
+    skip = None
+    for prefix, event, value in ijson.parse(_ChunkReader(chunks), use_float=True):
+        if builder is not None:
+            if skip is not None:
+                if event in _CONTAINERS:
+                    skip += 1
+                elif event in ("end_map", "end_array"):
+                    skip -= 1
+                if not skip:
+                    skip = None
+                continue
+            # drop the "_type" keys the API adds to every object
+            if event == "map_key" and value == "_type":
+                skip = 0
+                continue
+            builder.event(event, value)
+            if prefix == "results.item" and event in ("end_map", "end_array"):
+                yield builder.value
+                builder = None
+        elif prefix == "results.item":
+            if event in _CONTAINERS:
+                builder = ObjectBuilder()
+                builder.event(event, value)
+            else:
+                yield value
+        elif event in _SCALARS and prefix and "." not in prefix:
+            if prefix != "_type":
+                page[prefix] = value
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+# Licensed to Anthony Shaw (anthonyshaw@apache.org) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from collections import OrderedDict
+
+import arrow
+from attr import attrs, attrib
+
+#: Seconds before the watermark that every sync fetches again, to pick up
+#: records whose writes were still in flight when the last sync ran
+OVERLAP = 5
+
+
+@attrs
+class SyncResult(object):
+    records = attrib()
+    watermark = attrib()
+
+
+def sync_since(
+    client, uri, build, watermark=None, query=None, per_page=None, overlap=OVERLAP
+):
+    """
+    Fetch the records of a collection updated after ``watermark``
+
+    Records can become visible with an ``updated_at`` at or just before the
+    watermark of the previous sync, e.g. when their write was in flight. So
+    records updated up to ``overlap`` seconds before the watermark are
+    fetched again, and may be returned by consecutive syncs. Apply them
+    idempotently, e.g. by upserting by id.
+
+    :param client: The API client
+    :type  client: :class:`pathgather.PathgatherClient`
+
+    :param uri: The collection, e.g. "users"
+    :type  uri: ``str``
+
+    :param build: Converts a record to a model
+    :type  build: ``callable``
+
+    :param watermark: The ``watermark`` of the previous sync, ``None``
+        fetches every record
+    :type  watermark: :class:`arrow.Arrow`, ``datetime`` or ISO-8601 ``str``
+
+    :param query: Additional filter query
+        (see https://docs.pathgather.com/docs/filtering)
+    :type  query: ``dict``
+
+    :param per_page: Results per page
+    :type  per_page: ``int``
+
+    :param overlap: Seconds before the watermark to fetch again
+    :type  overlap: ``float``
+
+    :return: The changed records and the latest ``updated_at`` among them
+        (or the given watermark if nothing changed), to pass to the next sync
+    :rtype: :class:`SyncResult`
+    """
+    q = dict(query or {})
+    latest = None
+    if watermark is not None:
+        latest = arrow.get(watermark)
+        since = latest.shift(seconds=-overlap)
+        q["updated_at"] = {"gte": since.isoformat()}
+    data = client.json_codec.encode({"q": q}) if q else None
+    params = {"per_page": per_page} if per_page is not None else None
+
+    # records that moved between pages during the sync are listed twice,
+    # keep the latest copy
+    records = OrderedDict()
+    for page in client.get_paged(uri, params=params, data=data):
+        for record in page["results"]:
+            if record.get("updated_at"):
+                updated_at = arrow.get(record["updated_at"])
+                if latest is None or updated_at > latest:
+                    latest = updated_at
+            records[record["id"]] = record
+    return SyncResult(
+        records=[build(record) for record in records.values()], watermark=latest
+    )
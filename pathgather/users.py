@@ -14,9 +14,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import json
-
-from .utils import scrub
+from .columns import iter_records, to_arrow, to_columns, to_dataframe
+from .shard import iter_sharded
+from .sync import sync_since
 from .models.user import User
 from .models.department import Department
 from .models.skill import UserSkill, Skill
@@ -24,13 +24,119 @@ from .types_ import SkillLevel
 from .exceptions import UserNotFoundException
 
 
-class UsersClient(object):
-    """ Users API. """
+class BaseUsersClient(object):
+    """ Request building and model hydration shared by the Users API clients. """
 
     def __init__(self, client):
         self.client = client
 
-    def all(self, from_page=None, query=None):
+    def _create_params(
+        self,
+        name,
+        job_title,
+        department,
+        email,
+        saml_id,
+        custom_id,
+        hire_date,
+        location,
+        avatar,
+        admin,
+        send_invite,
+        deactivated,
+        custom_fields,
+    ):
+        params = {
+            "name": name,
+            "job_title": job_title,
+            "department": department,
+            "email": email,
+            "admin": admin,
+            "send_invite": send_invite,
+            "deactivated": deactivated,
+        }
+        if saml_id:
+            params["saml_id"] = saml_id
+        if custom_id:
+            params["custom_id"] = custom_id
+        if hire_date:
+            params["hire_date"] = hire_date
+        if location:
+            params["location"] = location
+        if avatar:
+            params["avatar"] = avatar
+        if custom_fields:
+            params["custom_fields"] = custom_fields
+        return params
+
+    def _update_params(
+        self,
+        name,
+        job_title,
+        department,
+        email,
+        saml_id,
+        custom_id,
+        hire_date,
+        location,
+        avatar,
+        admin,
+        deactivated,
+        custom_fields,
+    ):
+        params = {}
+        if name:
+            params["name"] = name
+        if job_title:
+            params["job_title"] = job_title
+        if department:
+            params["department"] = department
+        if email:
+            params["email"] = email
+        if admin is not None:
+            params["admin"] = admin
+        if deactivated is not None:
+            params["deactivated"] = deactivated
+        if saml_id:
+            params["saml_id"] = saml_id
+        if custom_id:
+            params["custom_id"] = custom_id
+        if hire_date:
+            params["hire_date"] = hire_date
+        if location:
+            params["location"] = location
+        if avatar:
+            params["avatar"] = avatar
+        if custom_fields:
+            params["custom_fields"] = custom_fields
+        return params
+
+    def _to_user(self, data):
+        if "department" in data and data["department"] is not None:
+            data["department"] = Department(**data["department"])
+        if "user_skills" in data and data["user_skills"] is not None:
+            _skills = []
+            for skill in data["user_skills"]:
+                skill["skill"] = Skill(**skill["skill"])
+                _skills.append(UserSkill(**skill))
+            data["user_skills"] = _skills
+        return User(**data)
+
+    def _to_user_skills(self, data):
+        _skills = []
+        for skill in data:
+            skill["skill"] = Skill(**skill["skill"])
+            _skills.append(UserSkill(**skill))
+        return _skills
+
+    def _to_user_skill(self, data):
+        return UserSkill(**data)
+
+
+class UsersClient(BaseUsersClient):
+    """ Users API. """
+
+    def all(self, from_page=None, query=None, per_page=None, raw=False):
         """
         Get all users (will page results out)
 
@@ -40,55 +146,243 @@ class UsersClient(object):
         :param query: Extra query parameters
         :param query: ``dict``
 
+        :param per_page: Results per page, up to
+            :attr:`pathgather.client.PathgatherClient.MAX_RESULTS_PER_PAGE`
+        :type  per_page: ``int``
+
+        :param raw: Return the decoded ``dict`` records, without building models
+        :type  raw: ``bool``
+
         :return: A list of users
         :rtype: ``list`` of :class:`pathgather.models.user.User`
         """
+        return list(self.iter_all(
+            from_page=from_page, query=query, per_page=per_page, raw=raw
+        ))
+
+    def iter_all(self, from_page=None, query=None, per_page=None, raw=False):
+        """
+        Iterate all users, fetching each page only when it is needed
+
+        :param from_page: Start at page
+        :type  from_page: ``int``
+
+        :param query: Extra query parameters
+        :param query: ``dict``
+
+        :param per_page: Results per page, up to
+            :attr:`pathgather.client.PathgatherClient.MAX_RESULTS_PER_PAGE`
+        :type  per_page: ``int``
+
+        :param raw: Return the decoded ``dict`` records, without building models
+        :type  raw: ``bool``
+
+        :return: A generator of users
+        :rtype: ``generator`` of :class:`pathgather.models.user.User`
+        """
         params = {}
 
         if from_page is not None:
             params["from"] = from_page
+        if per_page is not None:
+            params["per_page"] = per_page
 
         data = None
         if query is not None:
-            data = json.dumps({"q": query})
+            data = self.client.json_codec.encode({"q": query})
 
         users = self.client.get_paged("users", params=params, data=data)
-        results = []
         for page in users:
-            results.extend([self._to_user(i) for i in page["results"]])
-        return results
+            for i in page["results"]:
+                yield i if raw else self._to_user(i)
 
-    def get(self, id):
+    def iter_all_sharded(
+        self,
+        start,
+        end=None,
+        shards=8,
+        field="created_at",
+        query=None,
+        per_page=None,
+    ):
+        """
+        Iterate all users by splitting them into ``shards`` windows of
+        ``field`` and fetching the windows in parallel. Users arrive in no
+        particular order, each one once.
+
+        :param start: Start of the range, e.g. when the tenant was created
+        :type  start: :class:`arrow.Arrow`, ``datetime`` or ISO-8601 ``str``
+
+        :param end: End of the range, defaults to open-ended
+        :type  end: :class:`arrow.Arrow`, ``datetime`` or ISO-8601 ``str``
+
+        :param shards: Number of time windows fetched in parallel
+        :type  shards: ``int``
+
+        :param field: The timestamp to split on, "created_at" or "updated_at"
+        :type  field: ``str``
+
+        :param query: Additional filter query, must not filter on ``field``
+        :type  query: ``dict``
+
+        :param per_page: Results per page
+        :type  per_page: ``int``
+
+        :return: A generator of users
+        :rtype: ``generator`` of :class:`pathgather.models.user.User`
+        """
+        records = iter_sharded(
+            self.client,
+            "users",
+            start,
+            end=end,
+            shards=shards,
+            field=field,
+            query=query,
+            per_page=per_page,
+        )
+        for i in records:
+            yield self._to_user(i)
+
+    def sync_since(self, watermark=None, query=None, per_page=None):
+        """
+        Fetch the users updated since the last sync
+
+        :param watermark: The ``watermark`` of the previous sync, ``None``
+            fetches every user
+        :type  watermark: :class:`arrow.Arrow`, ``datetime`` or ISO-8601 ``str``
+
+        :param query: Additional filter query
+        :type  query: ``dict``
+
+        :param per_page: Results per page
+        :type  per_page: ``int``
+
+        :return: The changed users and the new watermark
+        :rtype: :class:`pathgather.sync.SyncResult`
+        """
+        return sync_since(
+            self.client,
+            "users",
+            self._to_user,
+            watermark=watermark,
+            query=query,
+            per_page=per_page,
+        )
+
+    def to_columns(self, query=None, fields=None, per_page=None):
+        """
+        Export all users as columns, without building a model for each record.
+        Nested objects become dotted columns, e.g. ``user.email``.
+
+        :param query: Additional filter query
+            (see https://docs.pathgather.com/docs/filtering)
+        :type  query: ``dict``
+
+        :param fields: The columns to keep, ``None`` keeps every column
+        :type  fields: ``list`` of ``str``
+
+        :param per_page: Results per page, defaults to the maximum
+        :type  per_page: ``int``
+
+        :return: One list per column
+        :rtype: ``OrderedDict`` of ``str`` to ``list``
+        """
+        records = iter_records(
+            self.client,
+            "users",
+            query=query,
+            per_page=per_page,
+        )
+        return to_columns(records, fields)
+
+    def to_dataframe(self, query=None, fields=None, per_page=None, parse_dates=True):
+        """
+        Export all users as a :class:`pandas.DataFrame`, without building a model
+        for each record. Requires ``pandas``.
+
+        :param query: Additional filter query
+            (see https://docs.pathgather.com/docs/filtering)
+        :type  query: ``dict``
+
+        :param fields: The columns to keep, ``None`` keeps every column
+        :type  fields: ``list`` of ``str``
+
+        :param per_page: Results per page, defaults to the maximum
+        :type  per_page: ``int``
+
+        :param parse_dates: Convert the ``*_at`` and ``*_date`` columns to
+            timestamps
+        :type  parse_dates: ``bool``
+
+        :rtype: :class:`pandas.DataFrame`
+        """
+        columns = self.to_columns(query=query, fields=fields, per_page=per_page)
+        return to_dataframe(columns, parse_dates=parse_dates)
+
+    def to_arrow(self, query=None, fields=None, per_page=None):
+        """
+        Export all users as a :class:`pyarrow.Table`, without building a model
+        for each record. Requires ``pyarrow``.
+
+        :param query: Additional filter query
+            (see https://docs.pathgather.com/docs/filtering)
+        :type  query: ``dict``
+
+        :param fields: The columns to keep, ``None`` keeps every column
+        :type  fields: ``list`` of ``str``
+
+        :param per_page: Results per page, defaults to the maximum
+        :type  per_page: ``int``
+
+        :rtype: :class:`pyarrow.Table`
+        """
+        return to_arrow(self.to_columns(query=query, fields=fields, per_page=per_page))
+
+    def get(self, id, raw=False):
         """
         Fetch a user by ID.
 
         :param id: The user id
         :type  id: ``str``
 
+        :param raw: Return the decoded ``dict``, without building a model
+        :type  raw: ``bool``
+
         :return: An instance :class:`pathgather.models.user.User`
         :rtype: :class:`pathgather.models.user.User`
         """
-        user = self.client.get("users/{0}".format(id))
-        return self._to_user(user)
-
-    def get_by_email(self, email):
+        if raw:
+            return self.client.get("users/{0}".format(id))
+        cache = self.client.entity_cache
+        user = cache.get("users", id) if cache is not None else None
+        if user is None:
+            user = self._to_user(self.client.get("users/{0}".format(id)))
+            if cache is not None:
+                cache.set("users", id, user)
+        return user
+
+    def get_by_email(self, email, raw=False):
         """
         Get a user by email
 
         :param email: User's email address
         :type  email: ``str``
 
+        :param raw: Return the decoded ``dict``, without building a model
+        :type  raw: ``bool``
+
         :return: A  users
         :rtype: :class:`pathgather.models.user.User`
         """
-        data = json.dumps({"q": {"email": {"eq": email}}})
+        data = self.client.json_codec.encode({"q": {"email": {"eq": email}}})
 
         users = self.client.get("users", params=None, data=data)
         if len(users["results"]) == 0:
             raise UserNotFoundException(
                 "Could not find user {0}".format(email), "users"
             )
-        return self._to_user(users["results"][0])
+        return users["results"][0] if raw else self._to_user(users["results"][0])
 
     def create(
         self,
@@ -154,28 +448,21 @@ class UsersClient(object):
         :return: An instance :class:`pathgather.models.user.User`
         :rtype: :class:`pathgather.models.user.User`
         """
-        params = {
-            "name": name,
-            "job_title": job_title,
-            "department": department,
-            "email": email,
-            "admin": admin,
-            "send_invite": send_invite,
-            "deactivated": deactivated,
-        }
-        if saml_id:
-            params["saml_id"] = saml_id
-        if custom_id:
-            params["custom_id"] = custom_id
-        if hire_date:
-            params["hire_date"] = hire_date
-        if location:
-            params["location"] = location
-        if avatar:
-            params["avatar"] = avatar
-        if custom_fields:
-            params["custom_fields"] = custom_fields
-
+        params = self._create_params(
+            name,
+            job_title,
+            department,
+            email,
+            saml_id,
+            custom_id,
+            hire_date,
+            location,
+            avatar,
+            admin,
+            send_invite,
+            deactivated,
+            custom_fields,
+        )
         user = self.client.post("users", {"user": params})
         return self._to_user(user)
 
@@ -243,33 +530,22 @@ class UsersClient(object):
         :return: An instance :class:`pathgather.models.user.User`
         :rtype: :class:`pathgather.models.user.User`
         """
-        params = {}
-        if name:
-            params["name"] = name
-        if job_title:
-            params["job_title"] = job_title
-        if department:
-            params["department"] = department
-        if email:
-            params["email"] = email
-        if admin is not None:
-            params["admin"] = admin
-        if deactivated is not None:
-            params["deactivated"] = deactivated
-        if saml_id:
-            params["saml_id"] = saml_id
-        if custom_id:
-            params["custom_id"] = custom_id
-        if hire_date:
-            params["hire_date"] = hire_date
-        if location:
-            params["location"] = location
-        if avatar:
-            params["avatar"] = avatar
-        if custom_fields:
-            params["custom_fields"] = custom_fields
-
+        params = self._update_params(
+            name,
+            job_title,
+            department,
+            email,
+            saml_id,
+            custom_id,
+            hire_date,
+            location,
+            avatar,
+            admin,
+            deactivated,
+            custom_fields,
+        )
         user = self.client.put("users/{0}".format(id), {"user": params})
+        self._invalidate(id)
         return self._to_user(user)
 
     def delete(self, id):
@@ -280,24 +556,23 @@ class UsersClient(object):
         :type  id: ``str``
         """
         self.client.delete("users/{0}".format(id))
+        self._invalidate(id)
 
-    def skills(self, id):
+    def skills(self, id, raw=False):
         """
         Get user skills
 
         :param id: The user ID
         :type  id: ``str``
 
+        :param raw: Return the decoded ``dict`` records, without building models
+        :type  raw: ``bool``
+
         :return: the skills for this user
         :rtype: ``list`` :class:`pathgather.models.skill.UserSkill`
         """
         result = self.client.get("users/{0}/user_skills".format(id))
-        scrub(result["results"])
-        _skills = []
-        for skill in result["results"]:
-            skill["skill"] = Skill(**skill["skill"])
-            _skills.append(UserSkill(**skill))
-        return _skills
+        return result["results"] if raw else self._to_user_skills(result["results"])
 
     def add_skill(self, id, skill, level=SkillLevel.ALL):
         """
@@ -317,8 +592,8 @@ class UsersClient(object):
         """
         data = {"skill_id": skill.id, "level": level}
         result = self.client.post("users/{0}/user_skills".format(id), data)
-        scrub(result)
-        return UserSkill(**result)
+        self._invalidate(id)
+        return self._to_user_skill(result)
 
     def add_skill_by_id(self, id, skill_id, level=SkillLevel.ALL):
         """
@@ -338,8 +613,8 @@ class UsersClient(object):
         """
         data = {"skill_id": skill_id, "level": level}
         result = self.client.post("users/{0}/user_skills".format(id), data)
-        scrub(result)
-        return UserSkill(**result)
+        self._invalidate(id)
+        return self._to_user_skill(result)
 
     def add_skill_by_name(self, id, skill_name, level=SkillLevel.ALL):
         """
@@ -359,8 +634,8 @@ class UsersClient(object):
         """
         data = {"skill_name": skill_name, "level": level}
         result = self.client.post("users/{0}/user_skills".format(id), data)
-        scrub(result)
-        return UserSkill(**result)
+        self._invalidate(id)
+        return self._to_user_skill(result)
 
     def update_skill_level(self, id, skill, level):
         """
@@ -380,8 +655,8 @@ class UsersClient(object):
         """
         data = {"skill_id": skill.id, "level": level}
         result = self.client.post("users/{0}/user_skills".format(id), data)
-        scrub(result)
-        return UserSkill(**result)
+        self._invalidate(id)
+        return self._to_user_skill(result)
 
     def delete_skill(self, id, user_skill):
         """
@@ -396,15 +671,9 @@ class UsersClient(object):
         if isinstance(user_skill, UserSkill):
             user_skill = user_skill.id
         self.client.delete("users/{0}/user_skills/{1}".format(id, user_skill))
+        self._invalidate(id)
 
-    def _to_user(self, data):
-        scrub(data)
-        if "department" in data and data["department"] is not None:
-            data["department"] = Department(**data["department"])
-        if "user_skills" in data and data["user_skills"] is not None:
-            _skills = []
-            for skill in data["user_skills"]:
-                skill["skill"] = Skill(**skill["skill"])
-                _skills.append(UserSkill(**skill))
-            data["user_skills"] = _skills
-        return User(**data)
+    def _invalidate(self, id):
+        # also after skill changes, the skills are part of the cached user
+        if self.client.entity_cache is not None:
+            self.client.entity_cache.invalidate("users", id)
@@ -18,7 +18,8 @@ requirements = [
     'PyYAML',
     'requests',
     'attrs',
-    'arrow'
+    'arrow',
+    'futures; python_version < "3"'
 ]
 
 test_requirements = [
@@ -37,11 +38,22 @@ setup(
     packages=[
         'pathgather',
         'pathgather.models',
+        'pathgather.aio',
     ],
     package_dir={'pathgather':
                  'pathgather'},
     include_package_data=True,
     install_requires=requirements,
+    extras_require={
+        'arrow': ['pyarrow'],
+        'async': ['aiohttp'],
+        'dataframe': ['pandas'],
+        'fast': [
+            'orjson; python_version >= "3.6"',
+            'ujson; python_version < "3.6"',
+        ],
+        'stream': ['ijson>=3.1'],
+    },
     license="Apache License (2.0)",
     zip_safe=False,
     keywords='pathgather',
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Throughput and memory benchmarks of paging, model hydration and ``scrub``
+over large collections, served by a local transport.
+
+Collections of 10,000 records are benchmarked by default. Set
+``PATHGATHER_BENCHMARK_RECORDS``, e.g. to ``10000,100000,1000000``, for
+larger ones. Compare releases with pytest-benchmark's ``--benchmark-autosave``
+and ``--benchmark-compare``.
+"""
+import json
+import os
+
+import pytest
+
+from pathgather.client import PathgatherClient
+from pathgather.utils import scrub
+from tests.transport import Collection, mount
+
+pytest.importorskip("pytest_benchmark")
+tracemalloc = pytest.importorskip("tracemalloc")
+
+SIZES = [
+    int(size)
+    for size in os.environ.get("PATHGATHER_BENCHMARK_RECORDS", "10000").split(",")
+]
+PER_PAGE = PathgatherClient.MAX_RESULTS_PER_PAGE
+ROUNDS = 3
+
+#: collection (and fixture) -> the sub-client method that iterates it, which
+#: hydrates with ``_to_user``, ``_to_content``, ``_to_user_content`` and
+#: ``_to_gathering``
+COLLECTIONS = {
+    "users": "users.iter_all",
+    "content": "content.iter_all",
+    "user_content": "content.iter_starts_and_completions",
+    "gatherings": "gatherings.iter_all",
+}
+
+
+def fixture_record(name):
+    with open("tests/fixtures/v1/{0}".format(name), "rb") as fixture:
+        return json.loads(fixture.read().decode("utf-8"))["results"][0]
+
+
+def collection_client(collection, size, record=True):
+    client = PathgatherClient("test.pathgather.com", "my_key_123")
+    handler = Collection(fixture_record(collection), size, PER_PAGE)
+    return client, mount(client, handler, record)
+
+
+def iterate(client, collection, raw):
+    sub_client, method = COLLECTIONS[collection].split(".")
+    return getattr(getattr(client, sub_client), method)(per_page=PER_PAGE, raw=raw)
+
+
+def drain(records):
+    count = 0
+    for _ in records:
+        count += 1
+    return count
+
+
+def record_rate(benchmark, size):
+    if benchmark.stats is not None:
+        benchmark.extra_info["records_per_second"] = size / benchmark.stats.stats.mean
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_get_paged(benchmark, size):
+    client, transport = collection_client("users", size)
+
+    def run():
+        del transport.requests[:]
+        pages = client.get_paged("users", params={"per_page": PER_PAGE})
+        return sum(len(page["results"]) for page in pages)
+
+    assert benchmark.pedantic(run, rounds=ROUNDS) == size
+    assert len(transport.requests) == -(-size // PER_PAGE)
+    record_rate(benchmark, size)
+
+
+@pytest.mark.parametrize("raw", [True, False], ids=["raw", "models"])
+@pytest.mark.parametrize("collection", sorted(COLLECTIONS))
+@pytest.mark.parametrize("size", SIZES)
+def test_hydration(benchmark, size, collection, raw):
+    """
+    Pages the collection through its ``iter_*`` method. The difference between
+    ``models`` and ``raw`` is the cost of the ``_to_*`` builder.
+    """
+    client, _ = collection_client(collection, size, record=False)
+    count = benchmark.pedantic(
+        lambda: drain(iterate(client, collection, raw)), rounds=ROUNDS
+    )
+    assert count == size
+    record_rate(benchmark, size)
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_scrub(benchmark, size):
+    """
+    Decodes the pages without removing ``_type`` keys and scrubs every record,
+    compare with ``test_hydration[...-user_content-raw]``.
+    """
+    client, transport = collection_client("user_content", size)
+    loads = client.json_codec.loads
+    pages = [transport.handler.body(i) for i in range(-(-size // PER_PAGE))]
+
+    def run():
+        count = 0
+        for page in pages:
+            for record in loads(page)["results"]:
+                scrub(record)
+                count += 1
+        return count
+
+    assert benchmark.pedantic(run, rounds=ROUNDS) == size
+    record_rate(benchmark, size)
+
+
+@pytest.mark.parametrize("collection", sorted(COLLECTIONS))
+@pytest.mark.parametrize("size", SIZES)
+def test_peak_memory(benchmark, size, collection):
+    """
+    Peak memory allocated while iterating the collection as models. Only
+    about one page is held at a time, so it should not grow with ``size``.
+    """
+    client, _ = collection_client(collection, size, record=False)
+
+    def run():
+        tracemalloc.start()
+        try:
+            count = drain(iterate(client, collection, False))
+            return count, tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    count, peak = benchmark.pedantic(run, rounds=1)
+    assert count == size
+    benchmark.extra_info["peak_bytes"] = peak
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Memory benchmark of the slotted models
+
+Builds ``UserContent`` records, with their nested ``User``, ``Content`` and
+``ContentProvider``, and compares the memory they hold with equivalent
+``__dict__`` based classes. The bytes per record are saved in the
+benchmark's ``extra_info``.
+"""
+import copy
+
+import attr
+import pytest
+
+from pathgather.client import PathgatherClient
+from pathgather.models.content import Content, ContentProvider, UserContent
+from pathgather.models.user import User
+
+pytest.importorskip("pytest_benchmark")
+tracemalloc = pytest.importorskip("tracemalloc")
+
+RECORDS = 2000
+
+
+def unslotted(cls):
+    return attr.make_class(
+        cls.__name__, [a.name for a in attr.fields(cls)], slots=False
+    )
+
+
+def rebuild(obj, classes):
+    """
+    A copy of ``obj`` and its nested models, sharing their field values.
+    ``classes`` maps each model class to the class to copy it to.
+    """
+    cls = type(obj)
+    if cls not in classes:
+        classes[cls] = unslotted(cls)
+    # bypass __init__, converters would allocate new values
+    copied = classes[cls].__new__(classes[cls])
+    for a in attr.fields(cls):
+        value = getattr(obj, a.name)
+        if attr.has(type(value)):
+            value = rebuild(value, classes)
+        object.__setattr__(copied, a.name, value)
+    return copied
+
+
+def measure(build):
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        objects = build()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    return objects, size
+
+
+def test_user_content_memory(benchmark):
+    client = PathgatherClient("test.pathgather.com", "my_key_123")
+    with open("tests/fixtures/v1/user_content", "rb") as fixture:
+        record = client.json_codec.decode(fixture.read())["results"][0]
+    slotted = [
+        client.content._to_user_content(copy.deepcopy(record)) for _ in range(RECORDS)
+    ]
+    same = {cls: cls for cls in (UserContent, User, Content, ContentProvider)}
+    unslotted_classes = {}
+
+    # field values are shared, so the difference is the objects themselves
+    _, slotted_size = benchmark.pedantic(
+        measure, (lambda: [rebuild(o, same) for o in slotted],), rounds=1
+    )
+    _, dict_size = measure(lambda: [rebuild(o, unslotted_classes) for o in slotted])
+
+    benchmark.extra_info["slotted_bytes_per_record"] = slotted_size / float(RECORDS)
+    benchmark.extra_info["dict_bytes_per_record"] = dict_size / float(RECORDS)
+    assert slotted_size < dict_size
@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of removing ``_type`` keys while decoding, against the recursive
+``scrub`` pass run on every decoded record before. Compare the ``decode``
+and ``scrub`` variants of each codec in pytest-benchmark's table.
+"""
+import json
+
+import pytest
+
+from pathgather import codec
+from pathgather.utils import scrub
+
+pytest.importorskip("pytest_benchmark")
+
+CODECS = [codec.JsonCodec]
+if codec.orjson is not None:
+    CODECS.append(codec.OrjsonCodec)
+if codec.ujson is not None:
+    CODECS.append(codec.UjsonCodec)
+
+
+def user_content_page(size=100):
+    with open("tests/fixtures/v1/user_content", "rb") as fixture:
+        record = json.loads(fixture.read().decode("utf-8"))["results"][0]
+    return json.dumps({"results": [record] * size, "next": None}).encode("utf-8")
+
+
+def loads_and_scrub(c, page):
+    body = c.loads(page)
+    for record in body["results"]:
+        scrub(record)
+    return body
+
+
+def decode(c, page):
+    return c.decode(page)
+
+
+@pytest.mark.parametrize("strip", [decode, loads_and_scrub], ids=["decode", "scrub"])
+@pytest.mark.parametrize("codec_class", CODECS, ids=lambda cls: cls.name)
+def test_strip_types(benchmark, codec_class, strip):
+    page = user_content_page()
+    c = codec_class()
+    benchmark.group = "strip_types-{0}".format(c.name)
+    assert benchmark(strip, c, page) == loads_and_scrub(c, page)
@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+
+import sys
+
+collect_ignore = []
+
+# async def syntax and asyncio.run()
+if sys.version_info < (3, 7):
+    collect_ignore.append("test_aio.py")
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--benchmarks",
+        action="store_true",
+        help="run the benchmarks in tests/benchmarks, see make benchmark",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--benchmarks"):
+        return
+    benchmarks = [item for item in items if "/benchmarks/" in item.nodeid]
+    if benchmarks:
+        config.hook.pytest_deselected(items=benchmarks)
+        items[:] = [item for item in items if "/benchmarks/" not in item.nodeid]
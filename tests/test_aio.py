@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Test the asyncio client against a local aiohttp server
+"""
+import asyncio
+import sys
+
+import pytest
+
+if sys.version_info < (3, 7):
+    pytest.skip("asyncio tests require Python 3.7+", allow_module_level=True)
+
+web = pytest.importorskip("aiohttp.web")
+test_utils = pytest.importorskip("aiohttp.test_utils")
+
+from pathgather.aio import AsyncPathgatherClient  # NOQA
+from pathgather.exceptions import PathgatherApiException  # NOQA
+
+
+TEST_API_KEY = "my_key_123"
+TEST_TENANT = "test.pathgather.com"
+TEST_USER_ID = "4cea0449-666a-433f-8396-857e269449a9"
+
+
+def fixture(name):
+    async def handler(request):
+        assert request.headers["Authorization"] == "Bearer {0}".format(TEST_API_KEY)
+        with open("tests/fixtures/v1/{0}".format(name), "rb") as fixture_file:
+            return web.Response(body=fixture_file.read())
+
+    return handler
+
+
+async def bad_request(request):
+    return web.Response(body=b"bad request", status=500)
+
+
+def run(coro):
+    async def with_server():
+        app = web.Application()
+        app.router.add_get("/v1/users", fixture("users"))
+        app.router.add_get("/v1/users/{id}", fixture("users_{0}".format(TEST_USER_ID)))
+        app.router.add_get("/v1/user_content", fixture("user_content"))
+        app.router.add_get("/v1/gatherings", fixture("gatherings"))
+        app.router.add_get("/v1/bad", bad_request)
+        async with test_utils.TestServer(app) as server:
+            async with AsyncPathgatherClient(TEST_TENANT, TEST_API_KEY) as client:
+                client.base_url = str(server.make_url("/v1"))
+                return await coro(client)
+
+    return asyncio.run(with_server())
+
+
+def test_all_users():
+    async def go(client):
+        return await client.users.all()
+
+    response = run(go)
+    assert response[0].id == TEST_USER_ID
+    assert response[0].department.id == "90c8e4f2-3fba-4747-9322-00635bcff1bc"
+
+
+def test_get_user():
+    async def go(client):
+        return await client.users.get(TEST_USER_ID)
+
+    response = run(go)
+    assert response.id == TEST_USER_ID
+
+
+def test_user_content():
+    async def go(client):
+        return await client.content.starts_and_completions()
+
+    response = run(go)
+    assert response[0].id == "f41f88d2-c9f0-4f5d-9dcc-c3c6c33d7e6d"
+    assert response[0].content.provider.name == "youtu.be"
+
+
+def test_user_content_raw():
+    async def go(client):
+        return await client.content.starts_and_completions(raw=True)
+
+    response = run(go)
+    assert response[0]["id"] == "f41f88d2-c9f0-4f5d-9dcc-c3c6c33d7e6d"
+    assert response[0]["content"]["provider"]["name"] == "youtu.be"
+
+
+def test_iter_user_content():
+    async def go(client):
+        async for user_content in client.content.iter_starts_and_completions():
+            return user_content
+
+    response = run(go)
+    assert response.id == "f41f88d2-c9f0-4f5d-9dcc-c3c6c33d7e6d"
+
+
+def test_concurrent_requests():
+    async def go(client):
+        return await asyncio.gather(
+            client.users.all(), client.gatherings.all(), client.users.get(TEST_USER_ID)
+        )
+
+    users, gatherings, user = run(go)
+    assert users[0].id == user.id
+    assert len(gatherings) > 0
+
+
+def test_get_bad_request():
+    async def go(client):
+        return await client.get("bad")
+
+    with pytest.raises(PathgatherApiException):
+        run(go)
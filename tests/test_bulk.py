@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Test the concurrent bulk runner
+"""
+import random
+import threading
+import time
+
+from pathgather.bulk import run_bulk
+from pathgather.ratelimit import RateLimiter
+
+
+def test_run_bulk_ordered():
+    def slow_double(item):
+        time.sleep(random.random() / 100)
+        return item * 2
+
+    report = run_bulk(slow_double, iter(range(50)), max_workers=8)
+    assert [r.result for r in report.results] == [i * 2 for i in range(50)]
+    assert [r.index for r in report.results] == list(range(50))
+    assert report.throughput > 0
+
+
+def test_run_bulk_partial_failure():
+    def fail_odd(item):
+        if item % 2:
+            raise ValueError(item)
+        return item
+
+    report = run_bulk(fail_odd, range(10), max_workers=3)
+    assert [r.item for r in report.succeeded] == [0, 2, 4, 6, 8]
+    assert [r.item for r in report.failed] == [1, 3, 5, 7, 9]
+    assert isinstance(report.failed[0].error, ValueError)
+
+
+def test_run_bulk_bounded_in_flight():
+    consumed = []
+    completed = []
+    backlog = []
+    lock = threading.Lock()
+
+    def items():
+        for i in range(40):
+            consumed.append(i)
+            yield i
+
+    def track(item):
+        with lock:
+            backlog.append(len(consumed) - len(completed))
+        time.sleep(0.001)
+        with lock:
+            completed.append(item)
+
+    run_bulk(track, items(), max_workers=2)
+    assert max(backlog) <= 5
+
+
+def test_run_bulk_rate_limiter():
+    limiter = RateLimiter(100, burst=1)
+    report = run_bulk(lambda item: item, range(11), max_workers=4, rate_limiter=limiter)
+    assert [r.result for r in report.results] == list(range(11))
+    # the first item uses the burst, the other 10 wait 10ms each
+    assert report.elapsed >= 0.09
@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Test the HTTP and entity caches
+"""
+import time
+from collections import namedtuple
+
+from pathgather.cache import EntityCache, HttpCache
+from pathgather.client import PathgatherClient
+from tests.transport import mount
+
+
+TEST_API_KEY = "my_key_123"
+TEST_TENANT = "test.pathgather.com"
+Entity = namedtuple("Entity", "id custom_id")
+PROVIDERS = {
+    "results": [
+        {
+            "_type": "Provider",
+            "id": "1",
+            "name": "Pluralsight",
+            "may_require_vpn": False,
+            "may_not_be_mobile_friendly": False,
+            "is_subscribed": True,
+            "created_at": "2017-01-01T00:00:00Z",
+            "updated_at": "2017-01-01T00:00:00Z",
+        }
+    ],
+    "next": None,
+}
+
+
+def etag_handler(request):
+    if request.headers.get("If-None-Match") == '"v1"':
+        return 304, b"", {"ETag": '"v1"'}
+    return 200, PROVIDERS, {"ETag": '"v1"'}
+
+
+def test_http_cache_revalidates():
+    client = PathgatherClient(TEST_TENANT, TEST_API_KEY, http_cache=HttpCache())
+    transport = mount(client, etag_handler)
+    first = client.providers.all()
+    second = client.providers.all()
+    assert first == second
+    assert second[0].name == "Pluralsight"
+    assert "If-None-Match" not in transport.requests[0].headers
+    assert transport.requests[1].headers["If-None-Match"] == '"v1"'
+
+
+def test_http_cache_returns_copies():
+    client = PathgatherClient(TEST_TENANT, TEST_API_KEY, http_cache=HttpCache())
+    mount(client, etag_handler)
+    first = client.get("providers")
+    first["results"].pop()
+    assert len(client.get("providers")["results"]) == 1
+
+
+def test_http_cache_last_modified():
+    modified = "Wed, 21 Oct 2015 07:28:00 GMT"
+
+    def handler(request):
+        if request.headers.get("If-Modified-Since") == modified:
+            return 304, b"", None
+        return 200, {"good": True}, {"Last-Modified": modified}
+
+    client = PathgatherClient(TEST_TENANT, TEST_API_KEY, http_cache=HttpCache())
+    transport = mount(client, handler)
+    assert client.get("get")["good"]
+    assert client.get("get")["good"]
+    assert len(transport.requests) == 2
+
+
+def test_http_cache_eviction():
+    cache = HttpCache(max_entries=2)
+    for i in range(3):
+        cache.set(cache.key("uri", {"from": i}), "etag", None, {"i": i})
+    assert cache.get(cache.key("uri", {"from": 0})) is None
+    assert cache.get(cache.key("uri", {"from": 2})) == {"i": 2}
+    assert cache.headers(cache.key("uri", {"from": 1})) == {"If-None-Match": "etag"}
+
+
+def skill_handler(request):
+    if request.method == "GET":
+        return 200, {"_type": "Skill", "id": "1", "name": "Ruby"}, None
+    return 200, b"", None
+
+
+def test_entity_cache_get():
+    client = PathgatherClient(TEST_TENANT, TEST_API_KEY, entity_cache=EntityCache())
+    transport = mount(client, skill_handler)
+    assert client.skills.get("1").name == "Ruby"
+    assert client.skills.get("1").name == "Ruby"
+    assert len(transport.requests) == 1
+
+
+def test_entity_cache_invalidated_by_delete():
+    client = PathgatherClient(TEST_TENANT, TEST_API_KEY, entity_cache=EntityCache())
+    transport = mount(client, skill_handler)
+    client.skills.get("1")
+    client.skills.delete("1")
+    client.skills.get("1")
+    assert [r.method for r in transport.requests] == ["GET", "DELETE", "GET"]
+
+
+def test_entity_cache_ttl():
+    cache = EntityCache(ttl=60, ttls={"users": 0.01})
+    cache.set("users", "1", "user")
+    cache.set("content", "1", "content")
+    time.sleep(0.02)
+    assert cache.get("users", "1") is None
+    assert cache.get("content", "1") == "content"
+
+
+def test_entity_cache_lru():
+    cache = EntityCache(max_entries=2)
+    cache.set("users", "1", "a")
+    cache.set("users", "2", "b")
+    cache.get("users", "1")
+    cache.set("users", "3", "c")
+    assert cache.get("users", "2") is None
+    assert cache.get("users", "1") == "a"
+    cache.invalidate("users", "1")
+    assert cache.get("users", "1") is None
+
+
+def test_entity_cache_invalidate_by_custom_id():
+    cache = EntityCache()
+    user = Entity(id="1", custom_id="emp-1")
+    cache.set("users", "1", user)
+    cache.set("users", "emp-1", user)
+    cache.invalidate("users", "emp-1")
+    assert cache.get("users", "1") is None
+    assert cache.get("users", "emp-1") is None
+    assert cache._aliases == {}
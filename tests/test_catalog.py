@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Test the on-disk catalog cache
+"""
+import pytest
+import requests
+from pathgather.catalog import CatalogCache
+from pathgather.client import PathgatherClient
+from pathgather.exceptions import PathgatherApiException
+from tests.transport import mount, paged
+
+
+TEST_API_KEY = "my_key_123"
+TEST_TENANT = "test.pathgather.com"
+SKILLS = [
+    [{"_type": "Skill", "id": "2", "name": "Ruby"}],
+    [{"_type": "Skill", "id": "1", "name": "Python", "custom_id": "py"}],
+]
+
+
+def make_client(handler=None):
+    client = PathgatherClient(TEST_TENANT, TEST_API_KEY)
+    return client, mount(client, handler or paged(SKILLS))
+
+
+def test_catalog_cold_start(tmpdir):
+    path = str(tmpdir.join("catalog.db"))
+    client, transport = make_client()
+    skills = CatalogCache(client, path).skills()
+    assert [skill.name for skill in skills] == ["Ruby", "Python"]
+    assert len(transport.requests) == 2
+
+    client, transport = make_client()
+    catalog = CatalogCache(client, path)
+    assert catalog.skills() == skills
+    assert catalog.fetched_at("skills") is not None
+    assert len(transport.requests) == 0
+
+
+def test_catalog_keyed_by_host(tmpdir):
+    path = str(tmpdir.join("catalog.db"))
+    client, _ = make_client()
+    CatalogCache(client, path).skills()
+    other = PathgatherClient("other.pathgather.com", TEST_API_KEY)
+    transport = mount(other, paged([[]]))
+    assert CatalogCache(other, path).skills() == []
+    assert len(transport.requests) == 1
+
+
+def test_catalog_max_age(tmpdir):
+    client, transport = make_client()
+    catalog = CatalogCache(client, str(tmpdir.join("catalog.db")), max_age=0)
+    catalog.skills()
+    catalog.skills()
+    assert len(transport.requests) == 4
+    catalog.skills(max_age=3600)
+    assert len(transport.requests) == 4
+
+
+def test_catalog_serves_stale_on_error(tmpdir):
+    client, transport = make_client()
+    catalog = CatalogCache(client, str(tmpdir.join("catalog.db")), max_age=0)
+    catalog.skills()
+    transport.handler = lambda request: (500, b"error", None)
+    assert len(catalog.skills()) == 2
+    catalog.serve_stale_on_error = False
+    with pytest.raises(PathgatherApiException):
+        catalog.skills()
+
+
+def test_catalog_serves_stale_on_connection_error(tmpdir):
+    client, transport = make_client()
+    catalog = CatalogCache(client, str(tmpdir.join("catalog.db")), max_age=0)
+    catalog.skills()
+
+    def unreachable(request):
+        raise requests.ConnectionError("connection refused")
+
+    transport.handler = unreachable
+    assert len(catalog.skills()) == 2
+    catalog.serve_stale_on_error = False
+    with pytest.raises(requests.ConnectionError):
+        catalog.skills()
+
+
+def test_catalog_duplicate_ids(tmpdir):
+    moved = dict(SKILLS[0][0], name="Ruby on Rails")
+    client, _ = make_client(paged([SKILLS[0], SKILLS[1] + [moved]]))
+    skills = CatalogCache(client, str(tmpdir.join("catalog.db"))).skills()
+    assert [(s.id, s.name) for s in skills] == [("2", "Ruby on Rails"), ("1", "Python")]
+
+
+def test_catalog_invalidate(tmpdir):
+    client, transport = make_client()
+    catalog = CatalogCache(client, str(tmpdir.join("catalog.db")))
+    catalog.skills()
+    catalog.invalidate("skills")
+    assert catalog.fetched_at("skills") is None
+    catalog.skills()
+    assert len(transport.requests) == 4
@@ -7,10 +7,14 @@ Test licensing client base functionality
 from requests_staticmock import BaseMockClass, mock_session_with_class
 from requests_staticmock.responses import StaticResponseFactory
 import json
+import threading
+import time
 import pytest
 from six import b
+from pathgather import stream as streaming
 from pathgather.client import PathgatherClient
 from pathgather.exceptions import PathgatherApiException
+from tests.transport import mount, paged, query
 
 
 TEST_API_KEY = "my_key_123"
@@ -124,3 +128,121 @@ def test_delete_bad_request():
     with mock_session_with_class(client.session, MockClient, TEST_URL):
         with pytest.raises(PathgatherApiException):
             client.delete("delete/bad")
+
+
+def test_get_paged_follows_cursor():
+    paged_client = PathgatherClient(TEST_TENANT, TEST_API_KEY)
+    mount(paged_client, paged([[1, 2], [3], [4, 5]]))
+    pages = list(paged_client.get_paged("users"))
+    assert [page["results"] for page in pages] == [[1, 2], [3], [4, 5]]
+
+
+def test_get_paged_keeps_params():
+    paged_client = PathgatherClient(TEST_TENANT, TEST_API_KEY)
+    transport = mount(paged_client, paged([[1], [2], [3], [4]]))
+    params = {"from": "1", "per_page": 500, "sort": "name"}
+    pages = list(paged_client.get_paged("users", params=params))
+    assert [page["results"] for page in pages] == [[2], [3], [4]]
+    assert [query(r)["from"] for r in transport.requests] == ["1", "2", "3"]
+    for request in transport.requests:
+        assert query(request)["per_page"] == "100"
+        assert query(request)["sort"] == "name"
+    assert params == {"from": "1", "per_page": 500, "sort": "name"}
+
+
+@pytest.mark.skipif(not streaming.available(), reason="requires ijson")
+def test_get_paged_stream():
+    stream_client = PathgatherClient(TEST_TENANT, TEST_API_KEY, stream_pages=True)
+    transport = mount(stream_client, paged([[1, 2], [3], [4, 5]]))
+    pages = stream_client.get_paged("users")
+    page = next(pages)
+    assert not isinstance(page["results"], list)
+    assert next(page["results"]) == 1
+    # the rest of the page is read to find the cursor
+    assert [list(p["results"]) for p in pages] == [[3], [4, 5]]
+    assert len(transport.requests) == 3
+    assert all(kwargs["stream"] for kwargs in transport.send_kwargs)
+
+
+@pytest.mark.skipif(not streaming.available(), reason="requires ijson")
+def test_get_paged_stream_error():
+    stream_client = PathgatherClient(TEST_TENANT, TEST_API_KEY)
+    mount(stream_client, lambda request: (500, b("bad request"), None))
+    with pytest.raises(PathgatherApiException):
+        next(stream_client.get_paged("users", stream=True))
+
+
+def test_get_paged_prefetch():
+    paged_client = PathgatherClient(TEST_TENANT, TEST_API_KEY, prefetch_pages=2)
+    transport = mount(paged_client, paged([[1, 2], [3], [4, 5], [6]]))
+    pages = paged_client.get_paged("users")
+    assert next(pages)["results"] == [1, 2]
+    # the background thread keeps fetching while the first page is processed
+    for _ in range(100):
+        if len(transport.requests) >= 3:
+            break
+        time.sleep(0.01)
+    assert len(transport.requests) >= 3
+    assert [page["results"] for page in pages] == [[3], [4, 5], [6]]
+
+
+def test_get_paged_prefetch_error():
+    paged_client = PathgatherClient(TEST_TENANT, TEST_API_KEY)
+    handler = paged([[1], [2]])
+
+    def failing(request):
+        if query(request).get("from") == "1":
+            return 500, b("bad request"), None
+        return handler(request)
+
+    mount(paged_client, failing)
+    pages = paged_client.get_paged("users", prefetch=1)
+    assert next(pages)["results"] == [1]
+    with pytest.raises(PathgatherApiException):
+        next(pages)
+
+
+def test_pool_settings():
+    pooled_client = PathgatherClient(
+        TEST_TENANT, TEST_API_KEY, pool_maxsize=32, pool_block=True, keep_alive=False
+    )
+    adapter = pooled_client.session.get_adapter(TEST_URL)
+    assert adapter._pool_maxsize == 32
+    assert adapter._pool_block
+    assert pooled_client.session.headers["Connection"] == "close"
+
+
+def test_timeout():
+    timeout_client = PathgatherClient(TEST_TENANT, TEST_API_KEY, timeout=(3, 10))
+    transport = mount(timeout_client, lambda request: (200, {"good": True}, None))
+    timeout_client.get("get")
+    assert transport.send_kwargs[0]["timeout"] == (3, 10)
+
+
+def test_results_per_page_per_instance():
+    small_client = PathgatherClient(TEST_TENANT, TEST_API_KEY, results_per_page=10)
+    transport = mount(small_client, lambda request: (200, {"good": True}, None))
+    params = {"from": "abc"}
+    small_client.get("get", params=params)
+    assert params == {"from": "abc"}
+    assert query(transport.requests[0])["per_page"] == "10"
+    assert PathgatherClient.results_per_page == 50
+    assert client.results_per_page == 50
+
+
+def test_shared_between_threads():
+    shared_client = PathgatherClient(TEST_TENANT, TEST_API_KEY)
+    transport = mount(shared_client, lambda request: (200, {"good": True}, None))
+    results = []
+
+    def worker():
+        for _ in range(10):
+            results.append(shared_client.get("get")["good"])
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(results) == 80 and all(results)
+    assert len(transport.requests) == 80
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Test the JSON codecs
+"""
+import json
+
+import pytest
+
+from pathgather import codec
+from pathgather.client import PathgatherClient
+from tests.transport import mount
+
+TEST_API_KEY = "my_key_123"
+TEST_TENANT = "test.pathgather.com"
+DOCUMENT = {"name": u"Café 日本", "count": 3, "tags": [None, True, 1.5]}
+
+CODECS = [codec.JsonCodec]
+if codec.orjson is not None:
+    CODECS.append(codec.OrjsonCodec)
+if codec.ujson is not None:
+    CODECS.append(codec.UjsonCodec)
+
+
+@pytest.mark.parametrize("codec_class", CODECS)
+def test_round_trip(codec_class):
+    c = codec_class()
+    assert c.loads(c.dumps(DOCUMENT)) == DOCUMENT
+    encoded = c.encode(DOCUMENT)
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded.decode("utf-8")) == DOCUMENT
+    assert c.loads(encoded) == DOCUMENT
+
+
+@pytest.mark.parametrize("codec_class", CODECS)
+def test_decode_strips_type(codec_class):
+    typed = {"_type": "Page", "results": [{"_type": "User", "user": {"_type": "U"}}]}
+    c = codec_class()
+    assert c.decode(json.dumps(typed).encode("utf-8")) == {"results": [{"user": {}}]}
+    assert c.loads(json.dumps(typed)) == typed
+
+
+def test_default_codec():
+    expected = "orjson" if codec.orjson else "ujson" if codec.ujson else "json"
+    assert codec.default_codec().name == expected
+
+
+class LoadsCodec(codec.JsonCodec):
+    """ Plugs in a JSON library by overriding only ``loads`` """
+
+    def loads(self, data):
+        body = super(LoadsCodec, self).loads(data)
+        body["loaded_by"] = "LoadsCodec"
+        return body
+
+
+def test_decode_uses_overridden_loads():
+    typed = {"_type": "Page", "results": [{"_type": "User", "id": "1"}]}
+    decoded = LoadsCodec().decode(json.dumps(typed).encode("utf-8"))
+    assert decoded == {"results": [{"id": "1"}], "loaded_by": "LoadsCodec"}
+
+
+class RecordingCodec(codec.JsonCodec):
+    def __init__(self):
+        self.calls = []
+
+    def encode(self, obj):
+        self.calls.append("encode")
+        return super(RecordingCodec, self).encode(obj)
+
+    def decode(self, data):
+        self.calls.append("decode")
+        return super(RecordingCodec, self).decode(data)
+
+
+def test_client_uses_codec():
+    recording = RecordingCodec()
+    codec_client = PathgatherClient(TEST_TENANT, TEST_API_KEY, json_codec=recording)
+    transport = mount(codec_client, lambda request: (200, {"good": True}, None))
+    assert codec_client.post("post", DOCUMENT) == {"good": True}
+    assert codec_client.get("get") == {"good": True}
+    assert recording.calls == ["encode", "decode", "decode"]
+    assert json.loads(transport.requests[0].body.decode("utf-8")) == DOCUMENT
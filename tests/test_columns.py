@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Test the columnar exports
+"""
+import json
+
+import pytest
+
+from pathgather import columns
+from pathgather.client import PathgatherClient
+from tests.transport import mount, paged, query
+
+TEST_API_KEY = "my_key_123"
+TEST_TENANT = "test.pathgather.com"
+
+
+def fixture_record(name):
+    with open("tests/fixtures/v1/{0}".format(name), "rb") as fixture:
+        return json.loads(fixture.read().decode("utf-8"))["results"][0]
+
+
+def test_to_columns_flattens_and_pads():
+    records = [
+        {"id": "1", "user": {"email": "a@b.com"}},
+        {"id": "2", "score": 3},
+    ]
+    result = columns.to_columns(records)
+    assert list(result) == ["id", "user.email", "score"]
+    assert result["id"] == ["1", "2"]
+    assert result["user.email"] == ["a@b.com", None]
+    assert result["score"] == [None, 3]
+
+
+def test_to_columns_null_objects():
+    records = [
+        {"id": "1", "user": None},
+        {"id": "2", "user": {"id": "u2", "email": "a@b.com"}},
+        {"id": "3", "user": None},
+    ]
+    for ordered in (records, records[::-1]):
+        result = columns.to_columns(ordered)
+        assert sorted(result) == ["id", "user.email", "user.id"]
+        by_id = dict(zip(result["id"], result["user.id"]))
+        assert by_id == {"1": None, "2": "u2", "3": None}
+
+
+def test_to_columns_fields():
+    records = [{"id": "1", "user": {"email": "a@b.com"}}, {"id": "2", "user": None}]
+    result = columns.to_columns(records, ["user.email", "id", "missing"])
+    assert list(result) == ["user.email", "id", "missing"]
+    assert result["user.email"] == ["a@b.com", None]
+    assert result["missing"] == [None, None]
+
+
+def test_users_to_columns():
+    user = fixture_record("users")
+    export_client = PathgatherClient(TEST_TENANT, TEST_API_KEY)
+    transport = mount(
+        export_client, paged([[dict(user, id="1")], [dict(user, id="2")]])
+    )
+    result = export_client.users.to_columns(fields=["id", "email"])
+    assert result["id"] == ["1", "2"]
+    assert result["email"] == [user["email"]] * 2
+    assert query(transport.requests[0])["per_page"] == "100"
+
+
+def test_starts_and_completions_to_columns():
+    user_content = fixture_record("user_content")
+    export_client = PathgatherClient(TEST_TENANT, TEST_API_KEY)
+    transport = mount(export_client, paged([[user_content]]))
+    result = export_client.content.starts_and_completions_to_columns(
+        query={"completed": {"eq": True}}
+    )
+    assert result["user.id"] == [user_content["user"]["id"]]
+    assert result["content.id"] == [user_content["content"]["id"]]
+    body = json.loads(transport.requests[0].body)
+    assert body == {"q": {"completed": {"eq": True}}}
+
+
+def test_content_to_dataframe():
+    pandas = pytest.importorskip("pandas")
+    content = fixture_record("content")
+    export_client = PathgatherClient(TEST_TENANT, TEST_API_KEY)
+    mount(export_client, paged([[content]]))
+    frame = export_client.content.to_dataframe(filter="shared")
+    assert list(frame["id"]) == [content["id"]]
+    assert pandas.api.types.is_datetime64_any_dtype(frame["created_at"])
+
+
+def test_to_arrow():
+    pytest.importorskip("pyarrow")
+    table = columns.to_arrow(
+        columns.to_columns([{"id": "1", "user": {"email": "a@b.com"}}, {"id": "2"}])
+    )
+    assert table.column_names == ["id", "user.email"]
+    assert table.column("user.email").to_pylist() == ["a@b.com", None]
+
+
+def test_starts_and_completions_to_arrow():
+    pytest.importorskip("pyarrow")
+    user_content = fixture_record("user_content")
+    export_client = PathgatherClient(TEST_TENANT, TEST_API_KEY)
+    mount(export_client, paged([[user_content]]))
+    table = export_client.paths.starts_and_completions_to_arrow(fields=["user.id"])
+    assert table.column("user.id").to_pylist() == [user_content["user"]["id"]]
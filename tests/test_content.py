@@ -9,8 +9,11 @@ from requests_staticmock import (
     mock_session_with_class,
     mock_session_with_fixtures,
 )
+from six import b
 from pathgather.client import PathgatherClient
+from pathgather.exceptions import PathgatherApiException
 from pathgather.types_ import ContentType, SkillLevel
+from tests.transport import mount
 
 
 TEST_API_KEY = "my_key_123"
@@ -125,6 +128,21 @@ def test_user_content():
         assert response[0].user.first_name == "non"
 
 
+def test_iter_user_content():
+    with mock_session_with_fixtures(client.session, "tests/fixtures", TEST_URL):
+        response = list(client.content.iter_starts_and_completions())
+        assert response[0].id == "f41f88d2-c9f0-4f5d-9dcc-c3c6c33d7e6d"
+        assert response[0].content.provider.name == "youtu.be"
+
+
+def test_user_content_raw():
+    with mock_session_with_fixtures(client.session, "tests/fixtures", TEST_URL):
+        response = client.content.starts_and_completions(raw=True)
+        assert response[0]["id"] == "f41f88d2-c9f0-4f5d-9dcc-c3c6c33d7e6d"
+        assert response[0]["content"]["provider"]["name"] == "youtu.be"
+        assert "_type" not in response[0]["user"]
+
+
 def test_log_completion():
     with mock_session_with_class(client.session, MockClient, TEST_URL):
         response = client.content.log_completion(
@@ -159,3 +177,69 @@ def test_create_content_comment():
             response.content.name
             == "No serial number - how we log it in ITSM / BranchTrack"
         )
+
+
+def test_bulk_create():
+    bulk_client = PathgatherClient(TEST_TENANT, TEST_API_KEY)
+    with open(
+        "tests/fixtures/v1/content_89a07305-0122-4da1-8b40-b99f4a968f88", "rb"
+    ) as fixture:
+        body = fixture.read()
+
+    def handler(request):
+        if b"broken" in request.body:
+            return 422, b("invalid content"), None
+        return 200, body, None
+
+    mount(bulk_client, handler)
+    items = [
+        {
+            "name": name,
+            "content_type": ContentType.WEBPAGE,
+            "source_url": "url://test.com/page",
+            "topic_name": "topic",
+            "provider_name": "Pluralsight",
+        }
+        for name in ["one", "broken", "three"]
+    ]
+    items.append(
+        {
+            "name": "no provider",
+            "content_type": ContentType.WEBPAGE,
+            "source_url": "url://test.com/page",
+            "topic_name": "topic",
+        }
+    )
+    report = bulk_client.content.bulk_create(items, max_workers=2)
+    assert [r.ok for r in report.results] == [True, False, True, False]
+    assert report.results[0].result.id == TEST_CONTENT_ID
+    assert isinstance(report.results[1].error, PathgatherApiException)
+    assert isinstance(report.results[3].error, ValueError)
+
+
+def test_log_completions():
+    ingest_client = PathgatherClient(TEST_TENANT, TEST_API_KEY)
+    with open(
+        "tests/fixtures/v1/user_content_650a4eb1-eff8-4032-aef0-ee5a66ab61b1", "rb"
+    ) as fixture:
+        body = fixture.read()
+
+    def handler(request):
+        if b"missing" in request.body:
+            return 404, b("not found"), None
+        return 200, body, None
+
+    transport = mount(ingest_client, handler)
+    event = {"content_id": "a", "user_email": "a@test.com", "completed_at": "2018-01-01"}
+    events = [
+        event,
+        dict(event),
+        {"content_id": "missing", "user_id": "1"},
+        {"content_id": "b", "user_id": "1"},
+    ]
+    report = ingest_client.content.log_completions(iter(events), max_workers=2)
+    assert len(transport.requests) == 3
+    assert [r.item["content_id"] for r in report.results] == ["a", "missing", "b"]
+    assert [r.ok for r in report.results] == [True, False, True]
+    assert report.results[0].result.id == "650a4eb1-eff8-4032-aef0-ee5a66ab61b1"
+    assert report.skipped == [events[1]]
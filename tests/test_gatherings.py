@@ -4,18 +4,22 @@
 """
 Test licensing client base functionality
 """
+import pytest
 from requests_staticmock import (
     BaseMockClass,
     mock_session_with_class,
     mock_session_with_fixtures,
 )
 from requests_staticmock.responses import StaticResponseFactory
+from pathgather.cache import EntityCache
 from pathgather.client import PathgatherClient
+from tests.transport import mount
 
 
 TEST_API_KEY = "my_key_123"
 TEST_TENANT = "test.pathgather.com"
 TEST_URL = "https://{0}".format(TEST_TENANT)
+TEST_GATHERING_ID = "3578d16a-381a-4041-a6bb-1b3957fc8e94"
 
 client = PathgatherClient(TEST_TENANT, TEST_API_KEY)
 
@@ -207,3 +211,35 @@ def test_delete_gathering_path():
             "9dbd1b62-2d6e-414a-9e4c-253d17693f09",
         )
         assert response is None
+
+
+GATHERING_WRITES = {
+    "invite_user": lambda gatherings, id: gatherings.invite_user(id, "u1"),
+    "remove_user": lambda gatherings, id: gatherings.remove_user(id, "u1"),
+    "add_content": lambda gatherings, id: gatherings.add_content(id, "c1"),
+    "remove_content": lambda gatherings, id: gatherings.remove_content(id, "c1"),
+    "remove_path": lambda gatherings, id: gatherings.remove_path(id, "p1"),
+}
+
+
+@pytest.mark.parametrize("write", sorted(GATHERING_WRITES))
+def test_gathering_writes_invalidate_entity_cache(write):
+    cached_client = PathgatherClient(
+        TEST_TENANT, TEST_API_KEY, entity_cache=EntityCache()
+    )
+    posted = "gatherings_invite" if write == "invite_user" else "gatherings_contents"
+    fixtures = {"GET": "gatherings_{0}".format(TEST_GATHERING_ID), "POST": posted}
+
+    def handler(request):
+        if request.method not in fixtures:
+            return 200, b"", None
+        with open("tests/fixtures/v1/" + fixtures[request.method], "rb") as fixture:
+            return 200, fixture.read(), None
+
+    transport = mount(cached_client, handler)
+    cached_client.gatherings.get(TEST_GATHERING_ID)
+    cached_client.gatherings.get(TEST_GATHERING_ID)
+    GATHERING_WRITES[write](cached_client.gatherings, TEST_GATHERING_ID)
+    cached_client.gatherings.get(TEST_GATHERING_ID)
+    # the second get() was cached, the third is fetched again
+    assert [r.method for r in transport.requests].count("GET") == 2
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Test the request instrumentation
+"""
+import pytest
+
+from pathgather.client import PathgatherClient
+from pathgather.exceptions import PathgatherApiException
+from pathgather.metrics import LatencyHistogram, RequestMetrics, endpoint_template
+from pathgather.retry import RetryPolicy
+from tests.transport import mount, paged
+
+TEST_API_KEY = "my_key_123"
+TEST_TENANT = "test.pathgather.com"
+
+
+def test_endpoint_template():
+    assert endpoint_template("users") == "users"
+    assert endpoint_template("users/abc") == "users/{id}"
+    assert endpoint_template("users/abc/user_skills") == "users/{id}/user_skills"
+    assert endpoint_template("gatherings/1/users/2") == "gatherings/{id}/users/{id}"
+
+
+def test_latency_histogram():
+    histogram = LatencyHistogram(buckets=(0.1, 1))
+    for value in (0.05, 0.1, 0.5, 2):
+        histogram.add(value)
+    result = histogram.as_dict()
+    assert list(result["buckets"].items()) == [(0.1, 2), (1, 1), ("+Inf", 1)]
+    assert (result["min"], result["max"], result["mean"]) == (0.05, 2, 0.6625)
+    assert (result["p50"], result["p90"]) == (0.1, 2)
+    assert LatencyHistogram().as_dict()["p50"] is None
+
+
+def test_request_hooks():
+    before, after = [], []
+    client = PathgatherClient(
+        TEST_TENANT,
+        TEST_API_KEY,
+        before_request=lambda e: before.append(e.status_code),
+        after_request=after.append,
+    )
+    mount(client, paged([[{"id": "1"}], [{"id": "2"}]]))
+    assert len(list(client.get_paged("users"))) == 2
+    assert before == [None, None]
+    assert [(e.method, e.endpoint, e.cursor) for e in after] == [
+        ("GET", "users", None),
+        ("GET", "users", "1"),
+    ]
+    assert after[0].status_code == 200
+    assert after[0].response_bytes == len(b'{"results": [{"id": "1"}], "next": "1"}')
+    assert after[0].elapsed >= 0
+    assert after[0].retries == 0
+
+
+def test_stats():
+    statuses = [502, 200, 404, 200]
+
+    def handler(request):
+        return statuses.pop(0), {"id": "1"}, None
+
+    client = PathgatherClient(
+        TEST_TENANT,
+        TEST_API_KEY,
+        retry_policy=RetryPolicy(backoff_factor=0),
+    )
+    mount(client, handler)
+    client.get("users/1")
+    with pytest.raises(PathgatherApiException):
+        client.get("users/2")
+    client.post("users", {"user": {"email": "a@b.com"}})
+
+    stats = client.stats()
+    assert (stats["requests"], stats["failures"], stats["retries"]) == (3, 1, 1)
+    assert stats["status_codes"] == {200: 2, 404: 1}
+    assert stats["latency"]["count"] == 3
+    assert sorted(stats["endpoints"]) == ["GET users/{id}", "POST users"]
+    get_user = stats["endpoints"]["GET users/{id}"]
+    assert (get_user["requests"], get_user["retries"]) == (2, 1)
+    assert stats["endpoints"]["POST users"]["request_bytes"] > 0
+
+    assert client.stats(reset=True)["requests"] == 3
+    assert client.stats()["requests"] == 0
+
+
+def test_shared_metrics():
+    metrics = RequestMetrics()
+    clients = [
+        PathgatherClient(TEST_TENANT, TEST_API_KEY, metrics=metrics) for _ in range(2)
+    ]
+    for client in clients:
+        mount(client, paged([[]]))
+        client.get("skills")
+    assert metrics.stats()["endpoints"]["GET skills"]["requests"] == 2
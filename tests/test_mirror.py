@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Test the local mirror
+"""
+import json
+import time
+
+import arrow
+import pytest
+
+from pathgather.client import PathgatherClient
+from pathgather.mirror import Mirror
+from tests.transport import mount
+
+TEST_API_KEY = "my_key_123"
+TEST_TENANT = "test.pathgather.com"
+
+
+def make_user(id, updated_at):
+    with open("tests/fixtures/v1/users", "rb") as fixture:
+        user = json.loads(fixture.read().decode("utf-8"))["results"][0]
+    return dict(user, id=id, updated_at=updated_at)
+
+
+class Tenant(object):
+    """ Serves ``records`` per collection, honouring the ``updated_at`` filter """
+
+    def __init__(self):
+        self.records = {
+            "users": [
+                make_user("1", "2018-03-01T00:00:00+00:00"),
+                make_user("2", "2018-03-02T00:00:00+00:00"),
+            ],
+            "skills": [{"_type": "Skill", "id": "s1", "name": "Ruby"}],
+        }
+        for kind in ("content", "paths", "gatherings", "providers"):
+            self.records[kind] = []
+
+    def __call__(self, request):
+        kind = request.path_url.split("?")[0].split("/")[-1]
+        results = self.records[kind]
+        if request.body:
+            gte = json.loads(request.body)["q"]["updated_at"]["gte"]
+            results = [
+                r for r in results if arrow.get(r["updated_at"]) >= arrow.get(gte)
+            ]
+        return 200, {"results": results, "next": None}, None
+
+
+def make_mirror(tmpdir, tenant):
+    client = PathgatherClient(TEST_TENANT, TEST_API_KEY)
+    transport = mount(client, tenant)
+    return Mirror(client, str(tmpdir.join("mirror.db"))), transport
+
+
+def test_mirror_load_and_read(tmpdir):
+    mirror, transport = make_mirror(tmpdir, Tenant())
+    mirror.load(["users", "skills"])
+    assert mirror.count("users") == 2
+    assert mirror.get("users", "2").id == "2"
+    assert mirror.get("users", "3") is None
+    assert [s.name for s in mirror.all("skills")] == ["Ruby"]
+    assert mirror.synced_at("users") is not None
+    assert mirror.synced_at("paths") is None
+    requests = len(transport.requests)
+    mirror.get("users", "1")
+    assert len(transport.requests) == requests
+    mirror.close()
+
+
+def test_mirror_delta_sync(tmpdir):
+    tenant = Tenant()
+    mirror, transport = make_mirror(tmpdir, tenant)
+    mirror.load(["users", "skills"])
+    tenant.records["users"].append(make_user("3", "2018-03-03T00:00:00+00:00"))
+    tenant.records["users"][0] = make_user("1", "2018-03-04T00:00:00+00:00")
+    tenant.records["skills"] = [{"_type": "Skill", "id": "s2", "name": "Python"}]
+    del transport.requests[:]
+    mirror.sync(["users", "skills"])
+    q = json.loads(transport.requests[0].body)["q"]
+    assert q == {"updated_at": {"gte": "2018-03-01T23:59:55+00:00"}}
+    assert sorted(u.id for u in mirror.all("users")) == ["1", "2", "3"]
+    assert mirror.get("users", "1").updated_at == "2018-03-04T00:00:00+00:00"
+    assert [s.name for s in mirror.all("skills")] == ["Python"]
+    mirror.close()
+
+
+def test_mirror_query(tmpdir):
+    tenant = Tenant()
+    tenant.records["users"].append(
+        dict(make_user("3", "2018-03-03T00:00:00+00:00"), email="c@example.com")
+    )
+    mirror, transport = make_mirror(tmpdir, tenant)
+    mirror.sync(["users"])
+    requests = len(transport.requests)
+
+    after = {"updated_at": {"gte": "2018-03-02T00:00:00+00:00"}}
+    assert [u.id for u in mirror.query("users", after)] == ["2", "3"]
+    assert [u.id for u in mirror.query("users", after, limit=1)] == ["2"]
+    assert [u.id for u in mirror.query("users", {"email": "c@example.com"})] == ["3"]
+    assert [u.id for u in mirror.query("users", {"id": {"in": ["1", "3"]}})] == [
+        "1",
+        "3",
+    ]
+    department = tenant.records["users"][0]["department"]["name"]
+    assert len(mirror.query("users", {"department.name": department})) == 3
+    assert mirror.query("users", {"custom_id": {"ne": None}}) == []
+    assert len(mirror.query("users")) == 3
+    with pytest.raises(ValueError):
+        mirror.query("users", {"email": {"like": "%"}})
+    with pytest.raises(ValueError):
+        mirror.query("users", {"email') OR (1": "x"})
+    assert len(transport.requests) == requests
+    mirror.close()
+
+
+def test_mirror_sync_loads_missing(tmpdir):
+    mirror, transport = make_mirror(tmpdir, Tenant())
+    mirror.sync(["users"])
+    assert not transport.requests[0].body
+    assert mirror.count("users") == 2
+    mirror.close()
+
+
+def test_mirror_background_sync(tmpdir):
+    mirror, transport = make_mirror(tmpdir, Tenant())
+    mirror.start(interval=0.01)
+    for _ in range(100):
+        if mirror.synced_at("providers") is not None:
+            break
+        time.sleep(0.01)
+    mirror.stop()
+    assert mirror.count("skills") == 1
+    mirror.close()
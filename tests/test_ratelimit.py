@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Test the adaptive rate limiter
+"""
+import threading
+import time
+
+import pytest
+from pathgather.client import PathgatherClient
+from pathgather.exceptions import PathgatherApiException
+from pathgather.ratelimit import RateLimiter, parse_retry_after
+from tests.transport import mount
+
+
+TEST_API_KEY = "my_key_123"
+TEST_TENANT = "test.pathgather.com"
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_acquire_spaces_requests():
+    limiter = RateLimiter(50, burst=1)
+    start = time.time()
+    for _ in range(6):
+        limiter.acquire()
+    assert time.time() - start >= 0.09
+
+
+def test_acquire_threads():
+    limiter = RateLimiter(200, burst=1)
+    acquired = []
+
+    def worker():
+        for _ in range(5):
+            limiter.acquire()
+            acquired.append(1)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    start = time.time()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(acquired) == 20
+    assert time.time() - start >= 0.09
+
+
+def test_throttled_slows_down_and_recovers():
+    limiter = RateLimiter(10, min_rate=2, increase=1)
+    limiter.throttled(0.05)
+    assert limiter.rate == 5
+    start = time.time()
+    limiter.acquire()
+    assert time.time() - start >= 0.05
+    for _ in range(3):
+        limiter.throttled()
+    assert limiter.rate == 2
+    for _ in range(20):
+        limiter.succeeded()
+    assert limiter.rate == 10
+
+
+def test_client_retries_throttled_requests():
+    client = PathgatherClient(
+        TEST_TENANT, TEST_API_KEY, rate_limiter=RateLimiter(100, increase=0)
+    )
+    responses = [
+        (429, b"slow down", {"Retry-After": "0"}),
+        (429, b"slow down", None),
+        (200, {"good": True}, None),
+    ]
+    transport = mount(client, lambda request: responses.pop(0))
+    assert client.get("users")["good"]
+    assert len(transport.requests) == 3
+    assert client.rate_limiter.rate == 25
+
+
+def test_client_gives_up_when_throttled():
+    client = PathgatherClient(
+        TEST_TENANT, TEST_API_KEY, rate_limiter=RateLimiter(100, max_retries=1)
+    )
+    transport = mount(client, lambda request: (429, b"slow down", {"Retry-After": "0"}))
+    with pytest.raises(PathgatherApiException):
+        client.get("users")
+    assert len(transport.requests) == 2
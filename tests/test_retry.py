@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Test the retry policy
+"""
+import pytest
+import requests
+from pathgather.client import PathgatherClient
+from pathgather.exceptions import PathgatherApiException
+from pathgather.retry import RetryPolicy
+from requests.packages.urllib3.exceptions import MaxRetryError, NewConnectionError
+from tests.transport import mount, paged
+
+
+TEST_API_KEY = "my_key_123"
+TEST_TENANT = "test.pathgather.com"
+
+
+def make_client(**kwargs):
+    events = []
+    kwargs.setdefault("backoff_factor", 0.001)
+    policy = RetryPolicy(on_retry=events.append, **kwargs)
+    return PathgatherClient(TEST_TENANT, TEST_API_KEY, retry_policy=policy), events
+
+
+def responses(*items):
+    items = list(items)
+
+    def handler(request):
+        item = items.pop(0)
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    return handler
+
+
+def test_backoff():
+    policy = RetryPolicy(backoff_factor=1, max_backoff=5, jitter=False)
+    assert [policy.backoff(i) for i in range(1, 5)] == [1, 2, 4, 5]
+    policy.jitter = True
+    assert 0 <= policy.backoff(3) <= 4
+
+
+def test_retry_server_error():
+    client, events = make_client()
+    transport = mount(
+        client, responses((502, b"bad gateway", None), (200, {"good": True}, None))
+    )
+    assert client.get("users")["good"]
+    assert len(transport.requests) == 2
+    assert len(events) == 1
+    assert events[0].status_code == 502
+    assert events[0].attempt == 1
+    assert events[0].will_retry
+
+
+def test_retry_connection_error():
+    client, events = make_client()
+    mount(
+        client,
+        responses(requests.ConnectionError("reset"), (200, {"good": True}, None)),
+    )
+    assert client.put("users/1")["good"]
+    assert isinstance(events[0].error, requests.ConnectionError)
+
+
+def test_retry_gives_up():
+    client, events = make_client(max_attempts=3)
+    transport = mount(client, lambda request: (503, b"unavailable", None))
+    with pytest.raises(PathgatherApiException):
+        client.delete("users/1")
+    assert len(transport.requests) == 3
+    assert [event.will_retry for event in events] == [True, True, False]
+
+
+def test_retry_deadline():
+    client, events = make_client(backoff_factor=10, jitter=False, deadline=1)
+    transport = mount(client, lambda request: (500, b"error", None))
+    with pytest.raises(PathgatherApiException):
+        client.get("users")
+    assert len(transport.requests) == 1
+    assert not events[0].will_retry
+
+
+def test_post_not_retried():
+    client, events = make_client()
+    transport = mount(client, lambda request: (500, b"error", None))
+    with pytest.raises(PathgatherApiException):
+        client.post("users", {})
+    assert len(transport.requests) == 1
+
+
+def test_post_retried_when_not_connected():
+    client, events = make_client()
+    mount(
+        client,
+        responses(
+            requests.exceptions.ConnectTimeout("timed out"), (200, {"good": True}, None)
+        ),
+    )
+    assert client.post("users", {})["good"]
+
+
+def test_post_retried_when_refused():
+    client, _ = make_client()
+    refused = NewConnectionError(None, "Connection refused")
+    mount(
+        client,
+        responses(
+            requests.ConnectionError(MaxRetryError(None, "/v1/users", refused)),
+            (200, {"good": True}, None),
+        ),
+    )
+    assert client.post("users", {})["good"]
+
+
+def test_post_not_retried_when_reset():
+    client, _ = make_client()
+    transport = mount(
+        client, responses(requests.ConnectionError("Connection reset by peer"))
+    )
+    with pytest.raises(requests.ConnectionError):
+        client.post("users", {})
+    assert len(transport.requests) == 1
+
+
+def test_post_idempotent():
+    client, events = make_client()
+    mount(client, responses((500, b"error", None), (200, {"good": True}, None)))
+    assert client.post("users", {}, idempotent=True)["good"]
+
+
+def test_retry_mid_crawl():
+    client, events = make_client()
+    handler = paged([[1], [2], [3]])
+    failures = [(502, b"bad gateway", None)]
+
+    def flaky(request):
+        if "from=1" in request.url and failures:
+            return failures.pop()
+        return handler(request)
+
+    mount(client, flaky)
+    pages = list(client.get_paged("users"))
+    assert [page["results"] for page in pages] == [[1], [2], [3]]
+    assert len(events) == 1
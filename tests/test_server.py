@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Test the local stand-in server
+"""
+import json
+import time
+
+import pytest
+
+from pathgather.exceptions import PathgatherApiException
+from pathgather.retry import RetryPolicy
+from pathgather.server import PathgatherServer, generate_tenant, matches
+
+TENANT = generate_tenant(
+    users=120, content=30, user_content=250, paths=5, user_paths=20
+)
+
+
+@pytest.fixture
+def server():
+    with PathgatherServer(TENANT) as running:
+        yield running
+
+
+def test_generate_tenant():
+    first, second = generate_tenant(users=5, seed=3), generate_tenant(users=5, seed=3)
+    assert [u["id"] for u in first["users"]] == [u["id"] for u in second["users"]]
+    assert len(TENANT["users"]) == 120
+    created = [user["created_at"] for user in TENANT["users"]]
+    assert created == sorted(created)
+
+
+def test_matches():
+    record = {"email": "a@example.com", "updated_at": "2018-03-01T10:00:00Z"}
+    assert matches(record, {"email": {"eq": "a@example.com"}})
+    assert matches(record, {"updated_at": {"gt": "2018-03-01T09:00:00+00:00"}})
+    assert not matches(record, {"updated_at": {"lt": "2018-03-01T05:00:00-05:00"}})
+    assert matches({"user": record}, {"user": {"email": {"in": ["a@example.com"]}}})
+
+
+def test_paging(server):
+    client = server.client()
+    users = client.users.all(per_page=50)
+    assert [u.id for u in users] == [u["id"] for u in TENANT["users"]]
+    assert server.responses[200] == 3
+    user_content = client.content.starts_and_completions()
+    assert len(user_content) == 250
+    assert user_content[0].content.provider is not None
+
+
+def test_query(server):
+    client = server.client()
+    since = TENANT["users"][100]["created_at"]
+    users = client.users.all(query={"created_at": {"gte": since}})
+    assert len(users) == 20
+    user = client.users.get_by_email(TENANT["users"][7]["email"])
+    assert user.id == TENANT["users"][7]["id"]
+
+
+def test_base_latency(server):
+    client = server.client()
+    client.skills.all()
+    started = time.time()
+    for _ in range(20):
+        client.skills.all()
+    # ~40ms per request if Nagle's algorithm delays the response bodies
+    assert (time.time() - started) / 20 < 0.02
+
+
+def test_create_update_delete():
+    with PathgatherServer(generate_tenant(users=2)) as server:
+        client = server.client()
+        user = client.users.create("Jane Doe", "CTO", "Founders", "jane@example.com")
+        assert (user.first_name, user.department.name) == ("Jane", "Founders")
+        assert client.users.update(user.id, job_title="CEO").job_title == "CEO"
+        assert client.users.get(user.id).job_title == "CEO"
+        client.users.delete(user.id)
+        with pytest.raises(PathgatherApiException):
+            client.users.get(user.id)
+        assert len(server.records("users")) == 2
+
+
+def test_errors_are_retried():
+    with PathgatherServer(TENANT, error_rate=0.5, seed=1) as server:
+        client = server.client(
+            retry_policy=RetryPolicy(max_attempts=20, backoff_factor=0)
+        )
+        assert len(client.users.all()) == 120
+        assert server.responses[500] > 0
+
+
+def test_throttling():
+    server = PathgatherServer(TENANT, rate_limit=1)
+    assert server.handle("GET", "/v1/skills", {}, b"")[0] == 200
+    status, headers, body = server.handle("GET", "/v1/skills", {}, b"")
+    assert status == 429
+    assert dict(headers)["Retry-After"] == "1"
+    assert json.loads(body.decode("utf-8")) == {"error": "Too many requests"}
+
+
+def test_etag_and_auth():
+    server = PathgatherServer(TENANT, api_key="secret")
+    headers = {"Authorization": "Bearer secret"}
+    status, response_headers, _ = server.handle("GET", "/v1/skills", headers, b"")
+    assert status == 200
+    headers["If-None-Match"] = dict(response_headers)["ETag"]
+    assert server.handle("GET", "/v1/skills", headers, b"")[0] == 304
+    assert server.handle("GET", "/v1/skills", {}, b"")[0] == 401
+    assert server.handle("GET", "/v1/unknown", headers, b"")[0] == 404
@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Test sharded enumeration
+"""
+import json
+
+import arrow
+import pytest
+from six import b
+
+from pathgather.client import PathgatherClient
+from pathgather.exceptions import PathgatherApiException
+from pathgather.shard import iter_sharded, windows
+from tests.transport import mount, query
+
+TEST_API_KEY = "my_key_123"
+TEST_TENANT = "test.pathgather.com"
+START = arrow.get("2018-01-01T00:00:00+00:00")
+
+
+def windowed(records):
+    """ Serve ``records`` filtered by the ``q`` time window, 2 per page """
+
+    def handler(request):
+        window = json.loads(request.body)["q"]["created_at"]
+        lower = arrow.get(window["gte"])
+        upper = arrow.get(window["lt"]) if "lt" in window else None
+        matches = [
+            r
+            for r in records
+            if lower <= arrow.get(r["created_at"])
+            and (upper is None or arrow.get(r["created_at"]) < upper)
+        ]
+        index = int(query(request).get("from", 0))
+        next_page = str(index + 2) if index + 2 < len(matches) else None
+        return 200, {"results": matches[index:index + 2], "next": next_page}, None
+
+    return handler
+
+
+def test_windows():
+    ranges = windows(START, START.shift(days=4), 4)
+    assert [r[0].day for r in ranges] == [1, 2, 3, 4]
+    assert ranges[-1][1] == START.shift(days=4)
+    assert windows(START, None, 4)[-1][1] is None
+    assert windows(START, START, 4) == [(START, START)]
+
+
+def test_iter_sharded():
+    records = [
+        {"id": str(i), "created_at": START.shift(hours=i).isoformat()}
+        for i in range(40)
+    ]
+    sharded_client = PathgatherClient(TEST_TENANT, TEST_API_KEY)
+    transport = mount(sharded_client, windowed(records))
+    results = list(iter_sharded(sharded_client, "users", START, shards=4))
+    assert sorted(r["id"] for r in results) == sorted(r["id"] for r in records)
+    assert len(transport.requests) > 4
+
+
+def test_iter_sharded_deduplicates():
+    sharded_client = PathgatherClient(TEST_TENANT, TEST_API_KEY)
+    page = {"results": [{"id": "1"}], "next": None}
+    mount(sharded_client, lambda request: (200, page, None))
+    results = list(
+        iter_sharded(sharded_client, "users", START, START.shift(days=1), shards=3)
+    )
+    assert results == [{"id": "1"}]
+
+
+def test_iter_sharded_error():
+    sharded_client = PathgatherClient(TEST_TENANT, TEST_API_KEY)
+    mount(sharded_client, lambda request: (500, b("bad request"), None))
+    with pytest.raises(PathgatherApiException):
+        list(iter_sharded(sharded_client, "users", START, shards=2))
+
+
+def test_iter_sharded_rejects_query_on_field():
+    sharded_client = PathgatherClient(TEST_TENANT, TEST_API_KEY)
+    transport = mount(sharded_client, windowed([]))
+    query = {"created_at": {"gte": START.shift(days=2).isoformat()}}
+    with pytest.raises(ValueError):
+        list(iter_sharded(sharded_client, "users", START, shards=2, query=query))
+    assert transport.requests == []
+    records = iter_sharded(
+        sharded_client, "users", START, shards=2, query={"updated_at": {"gte": "x"}}
+    )
+    assert list(records) == []
+
+
+def test_users_iter_all_sharded():
+    with open("tests/fixtures/v1/users", "rb") as fixture:
+        user = json.loads(fixture.read().decode("utf-8"))["results"][0]
+    records = []
+    for i in range(5):
+        record = dict(user, id=str(i), created_at=START.shift(days=i).isoformat())
+        records.append(record)
+    sharded_client = PathgatherClient(TEST_TENANT, TEST_API_KEY)
+    mount(sharded_client, windowed(records))
+    users = list(
+        sharded_client.users.iter_all_sharded(START, START.shift(days=5), shards=2)
+    )
+    assert sorted(u.id for u in users) == ["0", "1", "2", "3", "4"]
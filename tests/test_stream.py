@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Test incremental page parsing
+"""
+import json
+
+import pytest
+
+from pathgather import stream
+from pathgather.client import PathgatherClient
+from pathgather.codec import JsonCodec
+from pathgather.ratelimit import RateLimiter
+from pathgather.retry import RetryPolicy
+from tests.transport import mount
+
+pytestmark = pytest.mark.skipif(not stream.available(), reason="requires ijson")
+
+
+def chunked(document, size=7):
+    body = json.dumps(document).encode("utf-8")
+    for i in range(0, len(body), size):
+        yield body[i:i + size]
+
+
+def test_iter_results():
+    document = {
+        "meta": {"total": 3},
+        "results": [
+            {"id": "1", "user": {"tags": [1, 2.5]}, "content": None},
+            [1, 2],
+            "3",
+        ],
+        "next": "abc",
+    }
+    page = {}
+    results = stream.iter_results(chunked(document), page)
+    assert next(results) == document["results"][0]
+    assert "next" not in page
+    assert list(results) == [[1, 2], "3"]
+    assert page == {"next": "abc"}
+
+
+def test_iter_results_strips_type():
+    document = {
+        "results": [{"_type": "UserContent", "user": {"_type": "User", "id": "1"}}]
+    }
+    assert list(stream.iter_results(chunked(document), {})) == [{"user": {"id": "1"}}]
+
+
+def test_iter_results_strips_type_containers():
+    document = {
+        "_type": "Page",
+        "total": 2,
+        "results": [
+            {"_type": {"name": "User", "tags": [{"_type": "x"}]}, "id": "1"},
+            {"id": "2", "_type": ["User"], "user": {"_type": {}, "id": "3"}},
+        ]
+    }
+    body = json.dumps(document).encode("utf-8")
+    page = {}
+    results = list(stream.iter_results(chunked(document), page))
+    page["results"] = results
+    assert page == JsonCodec().decode(body)
+    assert page == {
+        "total": 2,
+        "results": [{"id": "1"}, {"id": "2", "user": {"id": "3"}}],
+    }
+
+
+def test_discarded_responses_are_closed():
+    statuses = [503, 429, 200]
+    client = PathgatherClient(
+        "test.pathgather.com",
+        "my_key_123",
+        retry_policy=RetryPolicy(backoff_factor=0),
+        rate_limiter=RateLimiter(1000),
+        stream_pages=True,
+    )
+    transport = mount(
+        client,
+        lambda request: (
+            statuses.pop(0),
+            {"results": [{"id": "1"}], "next": None},
+            {"Retry-After": "0"},
+        ),
+    )
+    responses = []
+    send = transport.send
+
+    def record(request, **kwargs):
+        responses.append(send(request, **kwargs))
+        return responses[-1]
+
+    transport.send = record
+    pages = list(client.get_paged("users"))
+    assert [r.status_code for r in responses] == [503, 429, 200]
+    assert [r.raw.closed for r in responses[:2]] == [True, True]
+    assert len(pages) == 1
+
+
+def test_iter_results_is_incremental():
+    def chunks():
+        yield b'{"results": [{"id": "1"}, '
+        raise AssertionError("read past the first result")
+
+    assert next(stream.iter_results(chunks(), {})) == {"id": "1"}
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Test incremental sync
+"""
+import json
+
+import arrow
+
+from pathgather.client import PathgatherClient
+from tests.transport import mount, paged
+
+TEST_API_KEY = "my_key_123"
+TEST_TENANT = "test.pathgather.com"
+
+
+def fixture_record(name):
+    with open("tests/fixtures/v1/{0}".format(name), "rb") as fixture:
+        return json.loads(fixture.read().decode("utf-8"))["results"][0]
+
+
+def test_users_sync_since():
+    user = fixture_record("users")
+    sync_client = PathgatherClient(TEST_TENANT, TEST_API_KEY)
+    transport = mount(
+        sync_client,
+        paged(
+            [
+                [dict(user, id="1", updated_at="2018-03-02T10:00:00Z")],
+                [dict(user, id="2", updated_at="2018-03-01T10:00:00Z")],
+            ]
+        ),
+    )
+    result = sync_client.users.sync_since("2018-03-01T00:00:00+00:00")
+    assert [u.id for u in result.records] == ["1", "2"]
+    assert result.watermark == arrow.get("2018-03-02T10:00:00Z")
+    q = json.loads(transport.requests[0].body)["q"]
+    assert q == {"updated_at": {"gte": "2018-02-28T23:59:55+00:00"}}
+
+
+def test_sync_since_watermark_ties():
+    user = fixture_record("users")
+    first = dict(user, id="1", updated_at="2018-03-02T10:00:00Z")
+    late = dict(user, id="2", updated_at="2018-03-02T10:00:00Z")
+    visible = [first]
+
+    def handler(request):
+        gte = arrow.get(json.loads(request.body)["q"]["updated_at"]["gte"])
+        results = [r for r in visible if arrow.get(r["updated_at"]) >= gte]
+        return 200, {"results": results, "next": None}, None
+
+    sync_client = PathgatherClient(TEST_TENANT, TEST_API_KEY)
+    mount(sync_client, handler)
+    result = sync_client.users.sync_since("2018-03-02T00:00:00Z")
+    assert [u.id for u in result.records] == ["1"]
+    # written with the same timestamp, but only visible after the first sync
+    visible.append(late)
+    result = sync_client.users.sync_since(result.watermark)
+    assert [u.id for u in result.records] == ["1", "2"]
+    assert result.watermark == arrow.get("2018-03-02T10:00:00Z")
+
+
+def test_sync_since_duplicate_ids():
+    user = fixture_record("users")
+    sync_client = PathgatherClient(TEST_TENANT, TEST_API_KEY)
+    mount(
+        sync_client,
+        paged(
+            [
+                [dict(user, id="1", updated_at="2018-03-02T10:00:00Z")],
+                [dict(user, id="1", updated_at="2018-03-02T11:00:00Z")],
+            ]
+        ),
+    )
+    result = sync_client.users.sync_since()
+    assert [u.updated_at for u in result.records] == ["2018-03-02T11:00:00Z"]
+
+
+def test_content_sync_since_unchanged():
+    sync_client = PathgatherClient(TEST_TENANT, TEST_API_KEY)
+    mount(sync_client, paged([[]]))
+    watermark = arrow.get("2018-03-01T00:00:00+00:00")
+    result = sync_client.content.sync_since(watermark)
+    assert result.records == []
+    assert result.watermark == watermark
+
+
+def test_starts_and_completions_full_sync():
+    user_content = fixture_record("user_content")
+    sync_client = PathgatherClient(TEST_TENANT, TEST_API_KEY)
+    transport = mount(sync_client, paged([[user_content]]))
+    result = sync_client.content.sync_starts_and_completions_since()
+    assert len(result.records) == 1
+    assert result.watermark == arrow.get(user_content["updated_at"])
+    assert not transport.requests[0].body
@@ -4,6 +4,9 @@
 """
 Test licensing client base functionality
 """
+import json
+
+import pytest
 from requests_staticmock import (
     BaseMockClass,
     mock_session_with_class,
@@ -11,9 +14,11 @@ from requests_staticmock import (
 )
 from requests_staticmock.responses import StaticResponseFactory
 from six import b
+from pathgather.cache import EntityCache
 from pathgather.client import PathgatherClient
 from pathgather.types_ import SkillLevel
 from pathgather.models.skill import Skill, UserSkill
+from tests.transport import mount, paged, query
 
 
 TEST_API_KEY = "my_key_123"
@@ -71,6 +76,93 @@ def test_all_users():
         assert response[0].department.id == "90c8e4f2-3fba-4747-9322-00635bcff1bc"
 
 
+def test_iter_all_users():
+    with mock_session_with_fixtures(client.session, "tests/fixtures", TEST_URL):
+        response = client.users.iter_all()
+        assert not isinstance(response, list)
+        user = next(response)
+        assert user.id == TEST_USER_ID
+        response.close()
+
+
+def test_all_users_from_page():
+    paged_client = PathgatherClient(TEST_TENANT, TEST_API_KEY)
+    with open("tests/fixtures/v1/users", "rb") as fixture:
+        user = json.loads(fixture.read().decode("utf-8"))["results"][0]
+    transport = mount(paged_client, paged([[user], [user], [user]]))
+    users = paged_client.users.all(from_page="1", per_page=100)
+    assert len(users) == 2
+    assert query(transport.requests[0]) == {"from": "1", "per_page": "100"}
+
+
+def test_all_users_streamed():
+    paged_client = PathgatherClient(TEST_TENANT, TEST_API_KEY, stream_pages=True)
+    with open("tests/fixtures/v1/users", "rb") as fixture:
+        user = json.loads(fixture.read().decode("utf-8"))["results"][0]
+    mount(paged_client, paged([[user, user], [user]]))
+    users = paged_client.users.all()
+    assert [u.id for u in users] == [TEST_USER_ID] * 3
+
+
+def test_all_users_raw():
+    raw_client = PathgatherClient(TEST_TENANT, TEST_API_KEY)
+    with open("tests/fixtures/v1/users", "rb") as fixture:
+        user = json.loads(fixture.read().decode("utf-8"))["results"][0]
+    mount(raw_client, paged([[user], [user]]))
+    users = raw_client.users.all(raw=True)
+    assert [u["id"] for u in users] == [TEST_USER_ID] * 2
+    assert users[0]["department"]["id"] == "90c8e4f2-3fba-4747-9322-00635bcff1bc"
+    assert "_type" not in users[0]
+
+
+def test_get_user_raw_skips_entity_cache():
+    cache = EntityCache()
+    raw_client = PathgatherClient(TEST_TENANT, TEST_API_KEY, entity_cache=cache)
+    with open("tests/fixtures/v1/users_{0}".format(TEST_USER_ID), "rb") as fixture:
+        body = fixture.read()
+    mount(raw_client, lambda request: (200, body, None))
+    user = raw_client.users.get(TEST_USER_ID, raw=True)
+    assert isinstance(user, dict)
+    assert user["id"] == TEST_USER_ID
+    assert cache.get("users", TEST_USER_ID) is None
+
+
+SKILL_WRITES = {
+    "add_skill": lambda users, id: users.add_skill(id, TEST_SKILL),
+    "add_skill_by_id": lambda users, id: users.add_skill_by_id(id, TEST_SKILL.id),
+    "add_skill_by_name": lambda users, id: users.add_skill_by_name(id, "Ruby"),
+    "update_skill_level": lambda users, id: users.update_skill_level(
+        id, TEST_SKILL, SkillLevel.EXPERT
+    ),
+    "delete_skill": lambda users, id: users.delete_skill(id, TEST_USER_SKILL_ID),
+}
+
+
+@pytest.mark.parametrize("key", [TEST_USER_ID, "emp-1"], ids=["id", "custom_id"])
+@pytest.mark.parametrize("write", sorted(SKILL_WRITES))
+def test_skill_writes_invalidate_entity_cache(write, key):
+    cache = EntityCache()
+    cached_client = PathgatherClient(TEST_TENANT, TEST_API_KEY, entity_cache=cache)
+    with open("tests/fixtures/v1/users_{0}".format(TEST_USER_ID), "rb") as fixture:
+        user = json.loads(fixture.read().decode("utf-8"))
+    with open("tests/fixtures/v1/users_skill", "rb") as fixture:
+        user_skill = fixture.read()
+
+    def handler(request):
+        if request.method == "GET":
+            return 200, dict(user, custom_id="emp-1"), None
+        if request.method == "POST":
+            return 200, user_skill, None
+        return 200, b"", None
+
+    mount(cached_client, handler)
+    cached_client.users.get(TEST_USER_ID)
+    cached_client.users.get("emp-1")
+    SKILL_WRITES[write](cached_client.users, key)
+    assert cache.get("users", TEST_USER_ID) is None
+    assert cache.get("users", "emp-1") is None
+
+
 def test_get_user():
     with mock_session_with_class(client.session, MockClient, TEST_URL):
         response = client.users.get(TEST_USER_ID)
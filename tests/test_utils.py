@@ -0,0 +1,33 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Test the utility functions
+"""
+import datetime
+
+import arrow
+import pytest
+
+from pathgather.utils import parse_timestamp
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2017-12-06T08:41:04.456-05:00",
+        "2017-12-06T08:41:04.123456+00:00",
+        "2017-12-06T08:41:04Z",
+        "2017-12-06T08:41:04",
+        "2017-12-06",
+        1512567664,
+        arrow.get("2017-12-06T08:41:04+01:00"),
+        datetime.datetime(2017, 12, 6, 8, 41, 4),
+    ],
+)
+def test_parse_timestamp(value):
+    expected = arrow.get(value)
+    parsed = parse_timestamp(value)
+    assert isinstance(parsed, arrow.Arrow)
+    assert parsed == expected
+    assert parsed.utcoffset() == expected.utcoffset()
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+
+"""
+A local requests transport for tests that need more than static fixtures,
+e.g. multi-page cursors, failures or response headers.
+"""
+import io
+import json
+import threading
+
+from requests import Response
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from six.moves.urllib.parse import urlparse, parse_qs
+
+
+class LocalTransport(BaseAdapter):
+    """
+    Serves every request from ``handler(request)``, which returns a
+    ``(status_code, body, headers)`` tuple. Unless ``record`` is false,
+    requests are recorded in :attr:`requests` and the keyword arguments they
+    were sent with, e.g. ``timeout``, in :attr:`send_kwargs`.
+    """
+
+    def __init__(self, handler, record=True):
+        super(LocalTransport, self).__init__()
+        self.handler = handler
+        self.record = record
+        self.requests = []
+        self.send_kwargs = []
+        self._lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        if self.record:
+            with self._lock:
+                self.requests.append(request)
+                self.send_kwargs.append(kwargs)
+        status_code, body, headers = self.handler(request)
+        if not isinstance(body, bytes):
+            body = json.dumps(body).encode("utf-8")
+        response = Response()
+        response.status_code = status_code
+        # served from ``raw`` so streamed responses are read incrementally
+        response.raw = io.BytesIO(body)
+        response.headers = CaseInsensitiveDict(headers or {})
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+def query(request):
+    """ The query string of a prepared request as a flat ``dict``. """
+    return {k: v[0] for k, v in parse_qs(urlparse(request.url).query).items()}
+
+
+def paged(pages):
+    """
+    A handler serving ``pages`` (a list of lists of results), with the
+    ``next`` cursor of page N being ``str(N + 1)``.
+    """
+
+    def handler(request):
+        index = int(query(request).get("from", 0))
+        next_page = str(index + 1) if index + 1 < len(pages) else None
+        return 200, {"results": pages[index], "next": next_page}, None
+
+    return handler
+
+
+class Collection(object):
+    """
+    A handler serving ``total`` copies of ``record`` in pages of
+    ``per_page``, following the ``from`` cursor. The results of a page are
+    encoded once, so benchmarks measure the client rather than the handler.
+    """
+
+    def __init__(self, record, total, per_page=100):
+        self.total = total
+        self.per_page = per_page
+        encoded = json.dumps(record).encode("utf-8")
+        self._results = {}
+        for count in {per_page, total % per_page}:
+            self._results[count] = b",".join([encoded] * count)
+
+    def body(self, index):
+        """ The encoded page at ``index``. """
+        count = min(self.per_page, self.total - index * self.per_page)
+        last = (index + 1) * self.per_page >= self.total
+        next_page = b"null" if last else '"{0}"'.format(index + 1).encode("ascii")
+        return (
+            b'{"results":[' + self._results[count] + b'],"next":' + next_page + b"}"
+        )
+
+    def __call__(self, request):
+        return 200, self.body(int(query(request).get("from", 0))), None
+
+
+def mount(client, handler, record=True):
+    """ Route all of ``client``'s requests to ``handler``. """
+    transport = LocalTransport(handler, record)
+    client.session.mount("https://", transport)
+    return transport